@@ -0,0 +1,80 @@
+"""
+ANALYTICS PACKAGE
+=================
+Public API of the analytics layer.
+
+Names are resolved lazily (PEP 562): ``import analytics`` loads nothing
+heavy, and a submodule is only imported the first time one of its names
+is used. Metrics-only processes therefore never pay for Matplotlib, and
+pandas is only loaded once the data loader is actually needed.
+"""
+
+import importlib
+from typing import Dict, List
+
+# Public name -> submodule that defines it
+_EXPORTS: Dict[str, str] = {
+    # data_loader.py
+    "DataLoader": "data_loader",
+    "load_cricket_data": "data_loader",
+    "clean_data": "data_loader",
+    "get_player_data": "data_loader",
+    # metrics.py
+    "MetricsCalculator": "metrics",
+    "calculate_metrics": "metrics",
+    "calculate_consistency_index": "metrics",
+    "calculate_format_metrics": "metrics",
+    "metrics_from_sums": "metrics",
+    "format_metrics_from_sums": "metrics",
+    # chart_data.py
+    "career_progression_series": "chart_data",
+    "cumulative_average": "chart_data",
+    "lttb_downsample": "chart_data",
+    # compare.py
+    "LeagueTable": "compare",
+    "PlayerNotFoundError": "compare",
+    "compare_players": "compare",
+    # deliveries.py
+    "DeliveryLoader": "deliveries",
+    "load_deliveries": "deliveries",
+    # instrumentation.py
+    "span": "instrumentation",
+    "timed": "instrumentation",
+    # parallel.py
+    "ParallelAggregator": "parallel",
+    # query.py
+    "Query": "query",
+    # recent.py
+    "RecentInningsStore": "recent",
+    # records.py
+    "RecordsIndex": "records",
+    # sqlite_store.py
+    "SQLiteDataLoader": "sqlite_store",
+    # synthetic.py
+    "SyntheticDataGenerator": "synthetic",
+    "SyntheticDeliveryGenerator": "synthetic",
+    # graphs.py
+    "GraphGenerator": "graphs",
+    "generate_last_10_matches_graph": "graphs",
+    "generate_runs_distribution": "graphs",
+    "generate_career_progression": "graphs",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import the defining submodule on first access to a public name."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{_EXPORTS[name]}", __name__)
+    value = getattr(module, name)
+
+    # Cache so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,166 @@
+"""
+CHART DATA MODULE
+=================
+Builds the numeric series behind the charts, independent of Matplotlib.
+
+Responsibilities:
+- Cumulative average series for career progression
+- Shape-preserving downsampling (Largest-Triangle-Three-Buckets)
+- JSON-ready chart payloads for the frontend
+
+The same series feed both the PNG charts in graphs.py and the JSON
+chart export, so both always show identical points.
+"""
+
+import numpy as np
+from typing import Dict, Optional, Union
+
+
+# Point budget above which progression series are downsampled
+DEFAULT_MAX_POINTS = 500
+
+
+def cumulative_average(runs: np.ndarray) -> np.ndarray:
+    """
+    Calculate the running batting average after every match.
+
+    Args:
+        runs: Runs scored in every match, in career order
+
+    Returns:
+        Array with the cumulative average after each match
+    """
+    runs = np.asarray(runs, dtype=float)
+    return np.cumsum(runs) / np.arange(1, len(runs) + 1)
+
+
+def lttb_indices(y: np.ndarray, threshold: int, x: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Select points to keep using Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. The interior is split into
+    ``threshold - 2`` buckets and from each bucket the point forming the
+    largest triangle with the previously kept point and the next bucket's
+    average is chosen, which keeps the visual shape of the line.
+
+    The global maximum and minimum are added back if LTTB did not pick
+    them, so the result can hold up to two points more than ``threshold``.
+
+    Args:
+        y: Series values
+        threshold: Target number of points (at least 3)
+        x: Series positions (defaults to 0..n-1)
+
+    Returns:
+        Sorted array of indices into ``y``
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if threshold >= n or n <= 2:
+        return np.arange(n)
+    if threshold < 3:
+        raise ValueError("threshold must be at least 3")
+
+    x = np.arange(n, dtype=float) if x is None else np.asarray(x, dtype=float)
+
+    # Bucket edges over the interior points 1..n-2
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    prev = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if end <= start:
+            end = start + 1
+
+        # Average of the next bucket (or the last point for the final bucket)
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], max(edges[i + 2], edges[i + 1] + 1)
+            avg_x = x[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = x[n - 1], y[n - 1]
+
+        # Twice the triangle area for every candidate in this bucket
+        areas = np.abs(
+            (x[prev] - avg_x) * (y[start:end] - y[prev])
+            - (x[prev] - x[start:end]) * (avg_y - y[prev])
+        )
+        prev = start + int(np.argmax(areas))
+        selected[i + 1] = prev
+
+    # Never drop the peaks
+    peaks = np.array([np.argmax(y), np.argmin(y)], dtype=np.int64)
+    return np.unique(np.concatenate([selected, peaks]))
+
+
+def lttb_downsample(
+    x: np.ndarray,
+    y: np.ndarray,
+    threshold: int
+) -> tuple:
+    """
+    Downsample an (x, y) series with Largest-Triangle-Three-Buckets.
+
+    Args:
+        x: Series positions
+        y: Series values
+        threshold: Target number of points
+
+    Returns:
+        Tuple of (downsampled x, downsampled y)
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    keep = lttb_indices(y, threshold, x)
+    return x[keep], y[keep]
+
+
+def career_progression_series(
+    runs: np.ndarray,
+    max_points: Optional[int] = DEFAULT_MAX_POINTS
+) -> Dict[str, Union[list, float, int]]:
+    """
+    Build the career progression series, downsampled to a point budget.
+
+    Args:
+        runs: Runs scored in every match, in career order
+        max_points: Point budget (None disables downsampling)
+
+    Returns:
+        Dictionary with match numbers, cumulative averages, the final
+        average and the number of matches before downsampling
+    """
+    averages = cumulative_average(runs)
+    match_number = np.arange(1, len(averages) + 1)
+
+    if max_points is not None and len(averages) > max_points:
+        match_number, averages = lttb_downsample(match_number, averages, max_points)
+
+    return {
+        "match_number": match_number.tolist(),
+        "cumulative_average": [round(float(a), 2) for a in averages],
+        "final_average": round(float(averages[-1]), 2) if len(averages) else 0.0,
+        "total_matches": int(len(runs))
+    }
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    print("=" * 60)
+    print("CHART DATA MODULE - STANDALONE TEST")
+    print("=" * 60)
+
+    rng = np.random.default_rng(7)
+    runs = rng.integers(0, 150, size=5000)
+
+    series = career_progression_series(runs, max_points=200)
+
+    print(f"\n Matches: {series['total_matches']}")
+    print(f"   Points kept: {len(series['match_number'])}")
+    print(f"   Final average: {series['final_average']}")
+
+    print("\n Chart data test passed!")
@@ -0,0 +1,374 @@
+"""
+COMPARE MODULE
+==============
+Compares any number of players against each other and the whole league.
+
+Responsibilities:
+- Aggregate every player's totals per format in one grouped pass
+  (the same sums metrics_from_sums uses, so results match MetricsCalculator)
+- Keep a league table of career and per-format metrics for every player
+- Compare N players: metrics, format splits, differences from the first
+  player, per-metric leaders and percentile ranks within the league
+
+A comparison is a set of dictionary lookups plus one searchsorted per
+metric, so its cost barely depends on how many players are compared.
+The table is rebuilt only for players whose matches change.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from .instrumentation import span
+from .metrics import format_metrics_from_sums, metrics_from_sums
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+FORMATS = ['odi', 'test', 't20i']
+
+# Numeric fields compared (all of them "higher is better")
+CAREER_FIELDS = [
+    'total_runs', 'matches_played', 'batting_average', 'strike_rate',
+    'consistency_index', 'centuries', 'half_centuries', 'highest_score'
+]
+FORMAT_FIELDS = ['matches', 'runs', 'average', 'strike_rate', 'centuries']
+
+_SUM_COLUMNS = ['runs', 'balls', 'dismissals', 'runs_squared', 'centuries', 'half_centuries']
+
+
+class PlayerNotFoundError(ValueError):
+    """A requested player is not in the data (the API answers 404)."""
+
+
+def sum_inputs(df: pd.DataFrame):
+    """
+    Per-match values that grouped_sums adds up, plus the format key.
+
+    Args:
+        df: Cleaned matches in the cricket_data.csv schema
+
+    Returns:
+        Tuple of (DataFrame with runs, balls, dismissals, runs_squared,
+        centuries and half_centuries per match; lowercased format Series,
+        NaN where the format is missing)
+    """
+    import pandas as pd
+
+    runs = df['runs']
+    work = pd.DataFrame({
+        'runs': runs,
+        'balls': df['balls_faced'],
+        'dismissals': (df['dismissal'] != 'not out') if 'dismissal' in df.columns else True,
+        'runs_squared': runs.astype(float) ** 2,
+        # Same fallbacks as MetricsCalculator when milestone columns are missing
+        'centuries': df['centuries'] if 'centuries' in df.columns else runs >= 100,
+        'half_centuries': (
+            df['half_centuries'] if 'half_centuries' in df.columns else (runs >= 50) & (runs < 100)
+        ),
+    }, index=df.index)
+
+    format_key = (
+        df['format'].str.lower() if 'format' in df.columns
+        else pd.Series(np.nan, index=df.index, dtype=object)
+    )
+    return work, format_key.rename('format')
+
+
+def grouped_sums(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate matches per player and format in one grouped pass.
+
+    Args:
+        df: Cleaned matches in the cricket_data.csv schema
+
+    Returns:
+        DataFrame indexed by (player_name, format) with the sums accepted
+        by metrics_from_sums; rows without a format keep a NaN format
+    """
+    work, format_key = sum_inputs(df)
+    grouped = work.groupby([df['player_name'], format_key], sort=False, dropna=False)
+
+    sums = grouped[_SUM_COLUMNS].sum()
+    sums['matches'] = grouped.size()
+    sums['highest_score'] = grouped['runs'].max()
+    return sums
+
+
+def merge_sums(partials: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Exactly combine grouped_sums results computed over disjoint row sets.
+
+    Every sum adds up and highest_score takes the maximum, so merging the
+    sums of any split of the rows gives the sums of all of them.
+
+    Args:
+        partials: grouped_sums (or merge_sums) results
+
+    Returns:
+        DataFrame in the grouped_sums layout
+    """
+    import pandas as pd
+
+    combined = pd.concat(list(partials))
+    grouped = combined.groupby(level=['player_name', 'format'], sort=False, dropna=False)
+    sums = grouped[_SUM_COLUMNS + ['matches']].sum()
+    sums['highest_score'] = grouped['highest_score'].max()
+    return sums
+
+
+def _career_sums(sums: pd.DataFrame) -> pd.DataFrame:
+    """Roll per-format sums up to one row per player."""
+    totals = sums.groupby(level='player_name', sort=False).sum()
+    totals['highest_score'] = sums['highest_score'].groupby(level='player_name', sort=False).max()
+    return totals
+
+
+class LeagueTable:
+    """Career and per-format metrics for every player in the league."""
+
+    def __init__(
+        self,
+        metrics: Dict[str, Dict],
+        format_metrics: Dict[str, Dict[str, Dict]],
+        sums: Optional[pd.DataFrame] = None
+    ):
+        """
+        Initialize from precomputed metrics.
+
+        Args:
+            metrics: Player -> calculate_all_metrics result
+            format_metrics: Player -> format -> format_metrics result
+            sums: Per (player, format) sums the metrics came from; needed
+                  for ``updated`` (tables built from metrics alone are fixed)
+        """
+        self.metrics = metrics
+        self.format_metrics = format_metrics
+        self.sums = sums
+        # Sorted league values per (format, field), built on first use
+        self._sorted: Dict[tuple, np.ndarray] = {}
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "LeagueTable":
+        """
+        Build the table from cleaned matches in one grouped pass.
+
+        Args:
+            df: Cleaned matches for the whole league
+
+        Returns:
+            LeagueTable for every player in ``df``
+        """
+        with span("compare.league_build", rows=len(df)):
+            return cls.from_sums(grouped_sums(df))
+
+    @classmethod
+    def from_sums(cls, sums: pd.DataFrame) -> "LeagueTable":
+        """
+        Build the table from per (player, format) sums.
+
+        Args:
+            sums: grouped_sums / merge_sums result, however it was computed
+
+        Returns:
+            LeagueTable for every player in ``sums``
+        """
+        metrics, format_metrics = cls._metrics_from(sums)
+        return cls(metrics, format_metrics, sums)
+
+    def updated(self, frames: Dict[str, pd.DataFrame]) -> "LeagueTable":
+        """
+        Return a new table with some players' matches replaced.
+
+        The current table is left untouched, so readers holding it keep a
+        consistent view while the new one is swapped in.
+
+        Args:
+            frames: Player -> that player's complete cleaned matches
+
+        Returns:
+            New LeagueTable
+
+        Raises:
+            RuntimeError: If this table was built from metrics only
+        """
+        import pandas as pd
+
+        if self.sums is None:
+            raise RuntimeError("League table was built from metrics only and cannot be updated")
+        if not frames:
+            return self
+
+        with span("compare.league_update", rows=sum(len(f) for f in frames.values())):
+            fresh = grouped_sums(pd.concat(frames.values()))
+            kept = self.sums[~self.sums.index.get_level_values('player_name').isin(list(frames))]
+            sums = pd.concat([kept, fresh])
+
+            metrics, format_metrics = self._metrics_from(fresh)
+            metrics = {**self.metrics, **metrics}
+            format_metrics = {**self.format_metrics, **format_metrics}
+        return LeagueTable(metrics, format_metrics, sums)
+
+    @staticmethod
+    def _metrics_from(sums: pd.DataFrame):
+        """Career and format metrics for every player in ``sums``."""
+        metrics = {
+            name: metrics_from_sums(name, row)
+            for name, row in _career_sums(sums).to_dict('index').items()
+        }
+        by_format = sums.to_dict('index')
+        empty = {key: 0 for key in sums.columns}
+        format_metrics = {
+            name: {
+                format_type: format_metrics_from_sums(by_format.get((name, format_type), empty))
+                for format_type in FORMATS
+            }
+            for name in metrics
+        }
+        return metrics, format_metrics
+
+    def __len__(self) -> int:
+        return len(self.metrics)
+
+    def __contains__(self, player_name: str) -> bool:
+        return player_name in self.metrics
+
+    def league_values(self, field: str, format_type: Optional[str] = None) -> np.ndarray:
+        """
+        Sorted values of one metric across the league.
+
+        Args:
+            field: Metric name (CAREER_FIELDS, or FORMAT_FIELDS with a format)
+            format_type: Restrict to players who played this format (optional)
+
+        Returns:
+            Sorted numpy array
+        """
+        key = (format_type, field)
+        values = self._sorted.get(key)
+        if values is None:
+            if format_type is None:
+                raw = [m[field] for m in self.metrics.values()]
+            else:
+                raw = [
+                    formats[format_type][field] for formats in self.format_metrics.values()
+                    if formats[format_type]['matches'] > 0
+                ]
+            values = np.sort(np.asarray(raw, dtype=float))
+            self._sorted[key] = values
+        return values
+
+    def compare(self, player_names: Iterable[str], format_type: Optional[str] = None) -> Dict:
+        """
+        Compare players against each other and the league.
+
+        Args:
+            player_names: Standardized names; the first one is the baseline
+                          for ``differences``
+            format_type: Compare one format's metrics instead of career
+                         metrics (optional)
+
+        Returns:
+            Dictionary with players (metrics plus format splits),
+            percentiles, differences, leaders and league_size
+
+        Raises:
+            PlayerNotFoundError: If a player is not in the table
+            ValueError: If the format is unknown
+        """
+        names = list(dict.fromkeys(player_names))
+        missing = [name for name in names if name not in self.metrics]
+        if missing:
+            raise PlayerNotFoundError(f"Players not found: {', '.join(missing)}")
+        if format_type is not None:
+            format_type = format_type.lower()
+            if format_type not in FORMATS:
+                raise ValueError(f"Unknown format '{format_type}'. Available: {', '.join(FORMATS)}")
+
+        with span("compare.players", rows=len(names)):
+            if format_type is None:
+                fields = CAREER_FIELDS
+                headline = {name: self.metrics[name] for name in names}
+            else:
+                fields = FORMAT_FIELDS
+                headline = {name: self.format_metrics[name][format_type] for name in names}
+
+            values = np.array([[headline[name][f] for f in fields] for name in names], dtype=float)
+            percentiles = np.empty_like(values)
+            for column, field in enumerate(fields):
+                league = self.league_values(field, format_type)
+                if len(league) == 0:
+                    percentiles[:, column] = 0.0
+                else:
+                    # Share of the league at or below each player's value
+                    below = np.searchsorted(league, values[:, column], side='right')
+                    percentiles[:, column] = below / len(league) * 100
+
+            baseline = values[0]
+            leaders = values.argmax(axis=0)
+
+            return {
+                "format": format_type,
+                "baseline": names[0],
+                "league_size": int(len(self.league_values(fields[0], format_type))),
+                "players": {
+                    name: {**headline[name], "formats": self.format_metrics[name]}
+                    for name in names
+                },
+                "percentiles": {
+                    name: {f: round(float(p), 1) for f, p in zip(fields, percentiles[row])}
+                    for row, name in enumerate(names)
+                },
+                "differences": {
+                    name: {f: _number(values[row, col] - baseline[col]) for col, f in enumerate(fields)}
+                    for row, name in enumerate(names)
+                },
+                "leaders": {f: names[leaders[col]] for col, f in enumerate(fields)},
+            }
+
+
+def _number(value: float):
+    """Round a difference for JSON: ints stay ints, floats keep 1 decimal."""
+    value = round(float(value), 1)
+    return int(value) if value.is_integer() else value
+
+
+def compare_players(
+    df: pd.DataFrame,
+    player_names: List[str],
+    format_type: Optional[str] = None
+) -> Dict:
+    """
+    Compare players using every match in ``df`` as the league.
+
+    Args:
+        df: Cleaned matches for the whole league
+        player_names: Players to compare (case-insensitive)
+        format_type: Compare one format (optional)
+
+    Returns:
+        Same dictionary as LeagueTable.compare
+    """
+    names = [name.lower().strip() for name in player_names]
+    return LeagueTable.from_frame(df).compare(names, format_type)
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    import json
+    import pandas as pd
+
+    print("=" * 60)
+    print("COMPARE MODULE - STANDALONE TEST")
+    print("=" * 60)
+
+    data = pd.read_csv("../data/cricket_data.csv")
+    data['player_name'] = data['player_name'].str.lower().str.strip()
+
+    result = compare_players(data, ["Virat Kohli", "Rohit Sharma", "MS Dhoni"])
+    print(json.dumps({k: result[k] for k in ["baseline", "leaders", "percentiles"]}, indent=2))
+
+    print("\n Compare test passed!")
@@ -9,13 +9,22 @@ Responsibilities:
 - Filter by player name
 - Convert data types
 - Validate data integrity
+
+Progress goes through the ``logging`` module and every stage is timed
+with instrumentation spans (``data.load``, ``data.clean.*``, ``data.filter_*``).
 """
 
+import logging
+
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Optional, Dict, List
 
+from .instrumentation import span
+
+logger = logging.getLogger(__name__)
+
 
 class DataLoader:
     """Handles all data loading and cleaning operations."""
@@ -43,11 +52,14 @@ class DataLoader:
         if not self.csv_path.exists():
             raise FileNotFoundError(f"Data file not found: {self.csv_path}")
         
-        print(f" Loading data from {self.csv_path}")
+        logger.info("Loading data from %s", self.csv_path)
         
         try:
-            self.data = pd.read_csv(self.csv_path)
-            print(f" Loaded {len(self.data)} rows")
+            with span("data.load") as s:
+                self.data = pd.read_csv(self.csv_path)
+                s.rows = len(self.data)
+                s.bytes = self.csv_path.stat().st_size
+            logger.info("Loaded %d rows", len(self.data))
             return self.data
         except Exception as e:
             raise Exception(f"Error loading CSV: {str(e)}")
@@ -69,57 +81,62 @@ class DataLoader:
         Returns:
             Cleaned DataFrame
         """
-        print(" Cleaning data...")
-        
-        # Make a copy to avoid modifying original
-        cleaned = df.copy()
-        
-        # 1. Remove duplicates
-        initial_rows = len(cleaned)
-        cleaned = cleaned.drop_duplicates()
-        if len(cleaned) < initial_rows:
-            print(f"   Removed {initial_rows - len(cleaned)} duplicate rows")
-        
-        # 2. Handle missing values in critical columns
-        critical_columns = ['player_name', 'runs', 'balls_faced']
-        for col in critical_columns:
-            if col in cleaned.columns:
-                missing_count = cleaned[col].isna().sum()
-                if missing_count > 0:
-                    print(f"     Found {missing_count} missing values in {col}")
-                    # Drop rows with missing critical data
-                    cleaned = cleaned.dropna(subset=[col])
-        
-        # 3. Convert data types
-        numeric_columns = ['runs', 'balls_faced', 'fours', 'sixes', 'centuries', 'half_centuries']
-        for col in numeric_columns:
-            if col in cleaned.columns:
-                # Convert to numeric, coercing errors to NaN
-                cleaned[col] = pd.to_numeric(cleaned[col], errors='coerce')
-                # Fill NaN with 0 for stats columns (not runs/balls)
-                if col not in ['runs', 'balls_faced']:
-                    cleaned[col] = cleaned[col].fillna(0)
-        
-        # 4. Validate data integrity
-        # Remove rows where balls_faced is 0 or negative
-        if 'balls_faced' in cleaned.columns:
-            invalid_balls = cleaned[cleaned['balls_faced'] <= 0]
-            if len(invalid_balls) > 0:
-                print(f"     Removing {len(invalid_balls)} rows with invalid balls_faced")
-                cleaned = cleaned[cleaned['balls_faced'] > 0]
-        
-        # Remove rows where runs is negative
-        if 'runs' in cleaned.columns:
-            invalid_runs = cleaned[cleaned['runs'] < 0]
-            if len(invalid_runs) > 0:
-                print(f"     Removing {len(invalid_runs)} rows with negative runs")
-                cleaned = cleaned[cleaned['runs'] >= 0]
-        
-        # 5. Standardize player names (lowercase, strip whitespace)
-        if 'player_name' in cleaned.columns:
-            cleaned['player_name'] = cleaned['player_name'].str.lower().str.strip()
-        
-        print(f" Cleaning complete. Final rows: {len(cleaned)}")
+        logger.info("Cleaning data...")
+        
+        with span("data.clean", rows=len(df)):
+            # 1. Remove duplicates
+            # drop_duplicates returns a new frame, so the original is never
+            # modified and no separate up-front copy is needed
+            initial_rows = len(df)
+            with span("data.clean.duplicates", rows=initial_rows):
+                cleaned = df.drop_duplicates()
+            if len(cleaned) < initial_rows:
+                logger.info("Removed %d duplicate rows", initial_rows - len(cleaned))
+            
+            # 2. Handle missing values in critical columns
+            critical_columns = ['player_name', 'runs', 'balls_faced']
+            with span("data.clean.missing", rows=len(cleaned)):
+                for col in critical_columns:
+                    if col in cleaned.columns:
+                        missing_count = cleaned[col].isna().sum()
+                        if missing_count > 0:
+                            logger.warning("Found %d missing values in %s", missing_count, col)
+                            # Drop rows with missing critical data
+                            cleaned = cleaned.dropna(subset=[col])
+            
+            # 3. Convert data types
+            numeric_columns = ['runs', 'balls_faced', 'fours', 'sixes', 'centuries', 'half_centuries']
+            with span("data.clean.types", rows=len(cleaned)):
+                for col in numeric_columns:
+                    if col in cleaned.columns:
+                        # Convert to numeric, coercing errors to NaN
+                        cleaned[col] = pd.to_numeric(cleaned[col], errors='coerce')
+                        # Fill NaN with 0 for stats columns (not runs/balls)
+                        if col not in ['runs', 'balls_faced']:
+                            cleaned[col] = cleaned[col].fillna(0)
+            
+            # 4. Validate data integrity
+            with span("data.clean.validate", rows=len(cleaned)):
+                # Remove rows where balls_faced is 0 or negative
+                if 'balls_faced' in cleaned.columns:
+                    invalid_balls = cleaned[cleaned['balls_faced'] <= 0]
+                    if len(invalid_balls) > 0:
+                        logger.warning("Removing %d rows with invalid balls_faced", len(invalid_balls))
+                        cleaned = cleaned[cleaned['balls_faced'] > 0]
+                
+                # Remove rows where runs is negative
+                if 'runs' in cleaned.columns:
+                    invalid_runs = cleaned[cleaned['runs'] < 0]
+                    if len(invalid_runs) > 0:
+                        logger.warning("Removing %d rows with negative runs", len(invalid_runs))
+                        cleaned = cleaned[cleaned['runs'] >= 0]
+            
+            # 5. Standardize player names (lowercase, strip whitespace)
+            if 'player_name' in cleaned.columns:
+                with span("data.clean.names", rows=len(cleaned)):
+                    cleaned['player_name'] = cleaned['player_name'].str.lower().str.strip()
+        
+        logger.info("Cleaning complete. Final rows: %d", len(cleaned))
         return cleaned
     
     def filter_by_player(self, df: pd.DataFrame, player_name: str) -> pd.DataFrame:
@@ -140,7 +157,8 @@ class DataLoader:
         search_name = player_name.lower().strip()
         
         # Filter
-        player_data = df[df['player_name'] == search_name]
+        with span("data.filter_player", rows=len(df)):
+            player_data = df[df['player_name'] == search_name]
         
         if len(player_data) == 0:
             available_players = df['player_name'].unique().tolist()
@@ -149,7 +167,7 @@ class DataLoader:
                 f"Available players: {', '.join(available_players)}"
             )
         
-        print(f" Found {len(player_data)} matches for {player_name}")
+        logger.info("Found %d matches for %s", len(player_data), player_name)
         return player_data
     
     def get_format_data(self, df: pd.DataFrame, format_type: str) -> pd.DataFrame:
@@ -165,9 +183,10 @@ class DataLoader:
         """
         format_type = format_type.lower()
         if 'format' in df.columns:
-            return df[df['format'].str.lower() == format_type]
+            with span("data.filter_format", rows=len(df)):
+                return df[df['format'].str.lower() == format_type]
         else:
-            print("  Warning: 'format' column not found in data")
+            logger.warning("'format' column not found in data")
             return df
 
 
@@ -217,6 +236,8 @@ def get_player_data(df: pd.DataFrame, player_name: str) -> pd.DataFrame:
 
 # Example usage and testing
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format=" %(message)s")
+    
     print("=" * 60)
     print("DATA LOADER MODULE - STANDALONE TEST")
     print("=" * 60)
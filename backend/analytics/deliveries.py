@@ -0,0 +1,319 @@
+"""
+DELIVERIES MODULE
+=================
+Ingests ball-by-ball delivery files into innings rows in the
+cricket_data.csv schema.
+
+Responsibilities:
+- Stream each delivery file in fixed-size chunks (only the needed columns)
+- Aggregate every chunk into partial per-innings sums: runs off the bat,
+  balls faced (wides excluded), fours, sixes and the dismissal
+- Merge partials exactly, so an innings split across chunks or files
+  adds up to the same row
+- Parallelise across files with a process pool; each worker holds one
+  chunk of deliveries plus its innings partials, never the whole file
+- Report throughput in deliveries per second
+
+The output goes straight into DataLoader.clean_data and MetricsCalculator.
+
+Usage:
+    python -m analytics.deliveries --players 200 --innings 200 --files 8 --workers 4
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .instrumentation import span
+from .synthetic import COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Columns read from delivery files; everything else (over, ball, bowler...) is skipped
+REQUIRED_COLUMNS = [
+    'match_id', 'innings', 'match_date', 'format', 'opponent',
+    'batter', 'batter_runs', 'extras_type', 'wicket_kind', 'player_out'
+]
+
+# One innings of one batter
+INNINGS_KEY = ['match_id', 'innings', 'player_name']
+
+# Wicket kinds that end an innings without a dismissal
+NOT_DISMISSED = {'retired hurt', 'retired not out'}
+
+# How partial sums of the same innings combine
+_MERGE = {
+    'runs': 'sum',
+    'balls_faced': 'sum',
+    'fours': 'sum',
+    'sixes': 'sum',
+    # '' sorts before every wicket kind, so max keeps the dismissal
+    'dismissal': 'max',
+    'match_date': 'first',
+    'format': 'first',
+    'opponent': 'first',
+}
+
+
+def aggregate_deliveries(chunk: pd.DataFrame) -> pd.DataFrame:
+    """
+    Aggregate deliveries into partial per-innings sums.
+
+    Balls faced count every delivery except wides (no-balls are faced).
+    Dismissals are keyed by ``player_out``, so a non-striker run out is
+    credited to the right batter even if they never faced a ball.
+
+    Args:
+        chunk: Deliveries with REQUIRED_COLUMNS
+
+    Returns:
+        DataFrame indexed by (match_id, innings, player_name) with the
+        columns of _MERGE
+    """
+    extras = chunk['extras_type'].fillna('').str.lower()
+    batter_runs = chunk['batter_runs'].fillna(0).astype(np.int64)
+    keys = [chunk['match_id'], chunk['innings'], chunk['batter'].rename('player_name')]
+
+    faced = pd.DataFrame({
+        'runs': batter_runs,
+        'balls_faced': (extras != 'wide').astype(np.int64),
+        'fours': (batter_runs == 4).astype(np.int64),
+        'sixes': (batter_runs == 6).astype(np.int64),
+        'dismissal': '',
+        'match_date': chunk['match_date'],
+        'format': chunk['format'],
+        'opponent': chunk['opponent'],
+    }, index=chunk.index)
+
+    player_out = chunk['player_out'].fillna('')
+    out = chunk[player_out != '']
+    wickets = pd.DataFrame({
+        'runs': 0,
+        'balls_faced': 0,
+        'fours': 0,
+        'sixes': 0,
+        'dismissal': out['wicket_kind'].fillna('').str.lower(),
+        'match_date': out['match_date'],
+        'format': out['format'],
+        'opponent': out['opponent'],
+    }, index=out.index)
+    wicket_keys = [out['match_id'], out['innings'], out['player_out'].rename('player_name')]
+
+    partial = faced.groupby(keys, sort=False).agg(_MERGE)
+    if len(wickets):
+        partial = pd.concat([partial, wickets.groupby(wicket_keys, sort=False).agg(_MERGE)])
+    return partial
+
+
+def merge_partials(partials: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Combine partial innings sums from several chunks or files.
+
+    Args:
+        partials: Outputs of aggregate_deliveries (or of this function)
+
+    Returns:
+        One row per innings, same layout as the inputs
+    """
+    partials = [p for p in partials if len(p)]
+    if not partials:
+        return pd.DataFrame(
+            columns=list(_MERGE),
+            index=pd.MultiIndex.from_arrays([[], [], []], names=INNINGS_KEY)
+        )
+    combined = pd.concat(partials)
+    if len(partials) == 1 and combined.index.is_unique:
+        return combined
+    return combined.groupby(level=INNINGS_KEY, sort=False).agg(_MERGE)
+
+
+def aggregate_file(path: str, chunksize: int = 200_000) -> Tuple[pd.DataFrame, int]:
+    """
+    Stream one delivery file into partial innings sums.
+
+    Args:
+        path: Delivery CSV
+        chunksize: Deliveries read per chunk (bounds memory)
+
+    Returns:
+        Tuple of (partial innings sums, number of deliveries read)
+
+    Raises:
+        ValueError: If the file lacks a required column
+    """
+    header = pd.read_csv(path, nrows=0).columns
+    missing = [col for col in REQUIRED_COLUMNS if col not in header]
+    if missing:
+        raise ValueError(f"{path} is missing delivery columns: {', '.join(missing)}")
+
+    partials = []
+    deliveries = 0
+    reader = pd.read_csv(
+        path,
+        usecols=REQUIRED_COLUMNS,
+        chunksize=chunksize,
+        dtype={'extras_type': str, 'wicket_kind': str, 'player_out': str},
+        keep_default_na=False,
+        na_values={'batter_runs': ['']},
+    )
+    for chunk in reader:
+        deliveries += len(chunk)
+        partials.append(aggregate_deliveries(chunk))
+        # Innings finished in earlier chunks collapse to one row each
+        if len(partials) > 8:
+            partials = [merge_partials(partials)]
+    return merge_partials(partials), deliveries
+
+
+def innings_rows(partial: pd.DataFrame) -> pd.DataFrame:
+    """
+    Turn merged innings sums into rows in the cricket_data.csv schema.
+
+    Args:
+        partial: Output of merge_partials
+
+    Returns:
+        DataFrame with synthetic.COLUMNS, latest match first per player
+    """
+    rows = partial.reset_index()
+    dismissal = rows['dismissal']
+    rows['dismissal'] = dismissal.where((dismissal != '') & ~dismissal.isin(NOT_DISMISSED), 'not out')
+    rows['format'] = rows['format'].str.lower()
+    for col in ['runs', 'balls_faced', 'fours', 'sixes']:
+        rows[col] = rows[col].astype(np.int64)
+    rows['centuries'] = (rows['runs'] >= 100).astype(np.int64)
+    rows['half_centuries'] = ((rows['runs'] >= 50) & (rows['runs'] < 100)).astype(np.int64)
+
+    rows = rows.sort_values(['player_name', 'match_date'], ascending=[True, False], kind='stable')
+    return rows[COLUMNS].reset_index(drop=True)
+
+
+class DeliveryLoader:
+    """Loads ball-by-ball delivery files as innings rows."""
+
+    def __init__(
+        self,
+        paths: Iterable[str],
+        chunksize: int = 200_000,
+        workers: Optional[int] = None
+    ):
+        """
+        Initialize with the delivery files to ingest.
+
+        Args:
+            paths: Delivery CSV files
+            chunksize: Deliveries read per chunk in each worker
+            workers: Worker processes (default: one per file, capped at the
+                     CPU count); 1 aggregates in this process
+        """
+        self.paths = [str(Path(p)) for p in paths]
+        self.chunksize = chunksize
+        self.workers = workers
+        self.stats: Dict[str, float] = {}
+
+    def _worker_count(self) -> int:
+        if self.workers is not None:
+            return max(1, min(self.workers, len(self.paths)))
+        return max(1, min(len(self.paths), os.cpu_count() or 1))
+
+    def load(self) -> pd.DataFrame:
+        """
+        Aggregate every file into innings rows.
+
+        Returns:
+            DataFrame in the cricket_data.csv schema, ready for clean_data
+
+        Raises:
+            FileNotFoundError: If a delivery file doesn't exist
+            ValueError: If a file lacks a required column
+        """
+        for path in self.paths:
+            if not Path(path).exists():
+                raise FileNotFoundError(f"Delivery file not found: {path}")
+
+        workers = self._worker_count()
+        logger.info("Aggregating %d delivery file(s) with %d worker(s)", len(self.paths), workers)
+
+        start = time.perf_counter()
+        with span("deliveries.load") as s:
+            results: List[Tuple[pd.DataFrame, int]]
+            if workers == 1:
+                results = [aggregate_file(path, self.chunksize) for path in self.paths]
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(
+                        aggregate_file, self.paths, [self.chunksize] * len(self.paths)
+                    ))
+            deliveries = sum(count for _, count in results)
+            s.rows = deliveries
+
+            with span("deliveries.merge", rows=sum(len(p) for p, _ in results)):
+                innings = innings_rows(merge_partials(p for p, _ in results))
+        seconds = time.perf_counter() - start
+
+        self.stats = {
+            "files": len(self.paths),
+            "workers": workers,
+            "deliveries": deliveries,
+            "innings": len(innings),
+            "seconds": round(seconds, 3),
+            "deliveries_per_sec": round(deliveries / seconds) if seconds > 0 else 0,
+        }
+        logger.info(
+            "Aggregated %d deliveries into %d innings in %.2fs (%d deliveries/s)",
+            deliveries, len(innings), seconds, self.stats["deliveries_per_sec"]
+        )
+        return innings
+
+
+def load_deliveries(paths: Iterable[str], workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    Convenience function to ingest delivery files.
+
+    Args:
+        paths: Delivery CSV files
+        workers: Worker processes (optional)
+
+    Returns:
+        DataFrame in the cricket_data.csv schema
+    """
+    return DeliveryLoader(paths, workers=workers).load()
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    import argparse
+    import tempfile
+
+    from .data_loader import DataLoader
+    from .synthetic import SyntheticDeliveryGenerator
+
+    parser = argparse.ArgumentParser(description="Ingest synthetic ball-by-ball files")
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument("--innings", type=int, default=200, help="Innings per player")
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=200_000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format=" %(message)s")
+
+    print("=" * 60)
+    print("DELIVERIES MODULE - STANDALONE TEST")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = SyntheticDeliveryGenerator(args.players, args.innings).write_files(tmp, args.files)
+        loader = DeliveryLoader(paths, chunksize=args.chunksize, workers=args.workers)
+        innings = loader.load()
+
+    cleaned = DataLoader().clean_data(innings)
+    print(f"\n {loader.stats['deliveries']:,} deliveries -> {len(cleaned):,} innings")
+    print(f" Throughput: {loader.stats['deliveries_per_sec']:,} deliveries/s "
+          f"({loader.stats['workers']} workers)")
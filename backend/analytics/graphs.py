@@ -4,34 +4,87 @@ GRAPHS MODULE
 Generates cricket performance visualizations using Matplotlib.
 
 Graphs:
-1. Last 10 Matches Performance (Bar Chart)
+1. Last 10 Matches Performance (Bar Chart, latest 10 innings by match_date)
 2. Runs Distribution (Histogram)
-3. Career Progression (Line Chart)
+3. Career Progression (Line Chart, innings ordered by match_date)
+4. Player Report (all of the above, plus an optional format split,
+   drawn into one figure and encoded once)
 
-All graphs are saved as PNG files for frontend display.
+All graphs are saved as PNG files for frontend display, or rendered to
+PNG bytes in memory with ``to_png`` (the API never writes files).
+
+Matplotlib is imported on first use (when a GraphGenerator is created),
+so importing this module stays cheap for metrics-only processes.
+
+Figure building and PNG encoding are timed as separate instrumentation
+stages (``graphs.<chart>.build`` / ``graphs.<chart>.encode``).
 """
 
-import pandas as pd
+from __future__ import annotations
+
+import io
+import logging
+
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, List
+
+from .chart_data import DEFAULT_MAX_POINTS, career_progression_series
+from .instrumentation import span
+from .recent import latest_runs, runs_by_date
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CHARTS = ['last_10_matches', 'runs_distribution', 'career_progression', 'report']
+
+# savefig options per chart (the report is laid out by tight_layout alone)
+_SAVE_OPTIONS = {
+    'last_10_matches': {'bbox_inches': 'tight'},
+    'runs_distribution': {'bbox_inches': 'tight'},
+    'career_progression': {'bbox_inches': 'tight'},
+    'report': {},
+}
+
+# Loaded lazily by _load_matplotlib()
+plt = None
+mpatches = None
+
+
+def _load_matplotlib():
+    """Import matplotlib.pyplot and matplotlib.patches on first use."""
+    global plt, mpatches
+    if plt is None:
+        import matplotlib.pyplot
+        import matplotlib.patches
+        plt = matplotlib.pyplot
+        mpatches = matplotlib.patches
 
 
 class GraphGenerator:
     """Handles all graph generation for cricket analytics."""
     
-    def __init__(self, output_dir: str = "frontend/assets/graphs"):
+    def __init__(
+        self,
+        output_dir: str = "frontend/assets/graphs",
+        max_points: Optional[int] = DEFAULT_MAX_POINTS
+    ):
         """
         Initialize graph generator.
         
         Args:
             output_dir: Directory to save generated graphs
+            max_points: Point budget for progression charts; longer
+                series are downsampled (None disables downsampling)
         """
         self.output_dir = Path(output_dir)
+        self.max_points = max_points
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        _load_matplotlib()
+        
         # Set style for professional-looking graphs
         plt.style.use('dark_background')
         self.setup_style()
@@ -50,72 +103,240 @@ class GraphGenerator:
         plt.rcParams['font.size'] = 10
         plt.rcParams['axes.titlesize'] = 14
         plt.rcParams['axes.labelsize'] = 11
-    
-    def last_10_matches(
-        self, 
-        player_data: pd.DataFrame, 
+
+    def _encode(self, fig, chart: str, output):
+        """
+        Encode a figure to PNG and close it.
+
+        Args:
+            fig: Matplotlib figure
+            chart: One of CHARTS (encode stage name and savefig options)
+            output: File path or binary file object
+        """
+        try:
+            with span(f"graphs.{chart}.encode") as s:
+                fig.savefig(output, format='png', dpi=150, facecolor='#0a0e1a', **_SAVE_OPTIONS[chart])
+                s.bytes = output.tell() if hasattr(output, 'tell') else Path(output).stat().st_size
+        finally:
+            plt.close(fig)
+
+    def _save(self, fig, chart: str, filename: str) -> str:
+        """
+        Encode a figure into the output directory and log where it went.
+
+        Args:
+            fig: Matplotlib figure
+            chart: One of CHARTS
+            filename: File name inside the output directory
+
+        Returns:
+            Path to saved graph
+        """
+        filepath = self.output_dir / filename
+        self._encode(fig, chart, filepath)
+        logger.info("Saved: %s", filepath)
+        return str(filepath)
+
+    def to_png(
+        self,
+        chart: str,
+        player_data: pd.DataFrame,
         player_name: str,
-        filename: Optional[str] = None
-    ) -> str:
+        include_formats: bool = False
+    ) -> bytes:
         """
-        Generate bar chart for last 10 matches.
-        
+        Render one chart to PNG bytes without writing a file.
+
         Args:
+            chart: One of CHARTS
             player_data: DataFrame with player's match data
             player_name: Name of player
-            filename: Custom filename (optional)
-            
+            include_formats: Add the runs-by-format panel (report only)
+
         Returns:
-            Path to saved graph
+            PNG bytes
         """
-        # Get last 10 matches
-        last_10 = player_data.tail(10).copy()
-        last_10 = last_10.reset_index(drop=True)
-        
-        # Create figure
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        # Prepare data
-        matches = range(1, len(last_10) + 1)
-        runs = last_10['runs'].values
-        
+        if chart not in CHARTS:
+            raise ValueError(f"Unknown chart '{chart}'. Available: {', '.join(CHARTS)}")
+        if chart == 'report':
+            fig = self._report_figure(player_data, player_name, include_formats)
+        else:
+            fig = getattr(self, f"_{chart}_figure")(player_data, player_name)
+        buffer = io.BytesIO()
+        self._encode(fig, chart, buffer)
+        return buffer.getvalue()
+
+    def _draw_last_10(self, ax, runs: np.ndarray, player_name: str, title_size: int = 14):
+        """
+        Draw the last 10 matches bar chart onto an existing axes.
+
+        Args:
+            ax: Matplotlib axes to draw on
+            runs: Runs scored in the last (up to) 10 matches, oldest first
+            player_name: Name of player
+            title_size: Font size of the panel title
+        """
+        matches = range(1, len(runs) + 1)
+
         # Color bars (coral for normal, teal for centuries)
         colors = ['#4ecdc4' if r >= 100 else '#ff6b6b' for r in runs]
-        
+
         # Create bars
         bars = ax.bar(matches, runs, color=colors, alpha=0.8, edgecolor='white', linewidth=1)
-        
+
         # Add value labels on bars
-        for i, (bar, run) in enumerate(zip(bars, runs)):
+        for bar, run in zip(bars, runs):
             height = bar.get_height()
             ax.text(bar.get_x() + bar.get_width()/2., height,
                    f'{int(run)}',
                    ha='center', va='bottom', fontsize=9, fontweight='bold')
-        
+
         # Styling
         ax.set_xlabel('Match Number', fontsize=12)
         ax.set_ylabel('Runs Scored', fontsize=12)
-        ax.set_title(f'{player_name.title()} - Last 10 Matches Performance', 
-                    fontsize=14, fontweight='bold', pad=20)
+        ax.set_title(f'{player_name.title()} - Last 10 Matches Performance',
+                    fontsize=title_size, fontweight='bold', pad=20)
         ax.grid(axis='y', alpha=0.3)
         ax.set_axisbelow(True)
-        
+
         # Legend
         normal_patch = mpatches.Patch(color='#ff6b6b', label='Normal Score')
         century_patch = mpatches.Patch(color='#4ecdc4', label='Century (100+)')
         ax.legend(handles=[normal_patch, century_patch], loc='upper left')
+
+    def _draw_runs_distribution(self, ax, runs: np.ndarray, player_name: str, title_size: int = 14):
+        """
+        Draw the runs distribution histogram onto an existing axes.
+
+        Args:
+            ax: Matplotlib axes to draw on
+            runs: Runs scored in every match
+            player_name: Name of player
+            title_size: Font size of the panel title
+        """
+        # Create histogram with custom bins
+        bins = [0, 20, 40, 60, 80, 100, 150, 200]
+        n, bins, patches = ax.hist(runs, bins=bins, color='#ff6b6b',
+                                   alpha=0.7, edgecolor='white', linewidth=1)
+
+        # Color the 100+ bin differently
+        for i, patch in enumerate(patches):
+            if bins[i] >= 100:
+                patch.set_facecolor('#4ecdc4')
+
+        # Styling
+        ax.set_xlabel('Run Ranges', fontsize=12)
+        ax.set_ylabel('Frequency (Number of Matches)', fontsize=12)
+        ax.set_title(f'{player_name.title()} - Runs Distribution',
+                    fontsize=title_size, fontweight='bold', pad=20)
+        ax.grid(axis='y', alpha=0.3)
+        ax.set_axisbelow(True)
+
+        # Add mean line
+        mean_runs = runs.mean()
+        ax.axvline(mean_runs, color='#fbbf24', linestyle='--', linewidth=2,
+                  label=f'Average: {mean_runs:.1f}')
+        ax.legend()
+
+    def _draw_career_progression(self, ax, runs: np.ndarray, player_name: str, title_size: int = 14):
+        """
+        Draw the cumulative average line chart onto an existing axes.
+
+        Args:
+            ax: Matplotlib axes to draw on
+            runs: Runs scored in every match, in career order
+            player_name: Name of player
+            title_size: Font size of the panel title
+        """
+        # Calculate cumulative average, downsampled to the point budget
+        series = career_progression_series(runs, self.max_points)
+        match_number = series['match_number']
+        cumulative_average = series['cumulative_average']
+
+        # Plot
+        ax.plot(match_number, cumulative_average,
+               color='#4ecdc4', linewidth=2.5, marker='o', markersize=4,
+               markerfacecolor='#ff6b6b', markeredgecolor='white', markeredgewidth=1)
+
+        # Fill area under curve
+        ax.fill_between(match_number, cumulative_average,
+                       alpha=0.2, color='#4ecdc4')
+
+        # Styling
+        ax.set_xlabel('Career Matches', fontsize=12)
+        ax.set_ylabel('Cumulative Batting Average', fontsize=12)
+        ax.set_title(f'{player_name.title()} - Career Progression',
+                    fontsize=title_size, fontweight='bold', pad=20)
+        ax.grid(True, alpha=0.3)
+        ax.set_axisbelow(True)
+
+        # Add final average annotation
+        final_avg = series['final_average']
+        ax.annotate(f'Current Avg: {final_avg:.1f}',
+                   xy=(match_number[-1], final_avg),
+                   xytext=(10, 10), textcoords='offset points',
+                   bbox=dict(boxstyle='round,pad=0.5', facecolor='#ff6b6b', alpha=0.7),
+                   fontsize=10, fontweight='bold')
+
+    def _draw_format_split(self, ax, player_data: pd.DataFrame, player_name: str, title_size: int = 14):
+        """
+        Draw total runs per format as a horizontal bar chart.
+
+        Args:
+            ax: Matplotlib axes to draw on
+            player_data: DataFrame with player's match data
+            player_name: Name of player
+            title_size: Font size of the panel title
+        """
+        format_runs = player_data.groupby(player_data['format'].str.lower())['runs'].sum()
+        format_runs = format_runs.sort_values()
+
+        bars = ax.barh([f.upper() for f in format_runs.index], format_runs.values,
+                       color='#4ecdc4', alpha=0.8, edgecolor='white', linewidth=1)
+        for bar, run in zip(bars, format_runs.values):
+            ax.text(bar.get_width(), bar.get_y() + bar.get_height()/2.,
+                   f' {int(run):,}', va='center', fontsize=9, fontweight='bold')
+
+        ax.set_xlabel('Total Runs', fontsize=12)
+        ax.set_title(f'{player_name.title()} - Runs by Format',
+                    fontsize=title_size, fontweight='bold', pad=20)
+        ax.grid(axis='x', alpha=0.3)
+        ax.set_axisbelow(True)
+
+    def last_10_matches(
+        self, 
+        player_data: pd.DataFrame, 
+        player_name: str,
+        filename: Optional[str] = None
+    ) -> str:
+        """
+        Generate bar chart for last 10 matches.
+        
+        Args:
+            player_data: DataFrame with player's match data
+            player_name: Name of player
+            filename: Custom filename (optional)
+            
+        Returns:
+            Path to saved graph
+        """
+        fig = self._last_10_matches_figure(player_data, player_name)
         
         # Save
         if filename is None:
             filename = f"{player_name.replace(' ', '_')}_last_10_matches.png"
-        filepath = self.output_dir / filename
-        
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=150, bbox_inches='tight', facecolor='#0a0e1a')
-        plt.close()
-        
-        print(f" Saved: {filepath}")
-        return str(filepath)
+        return self._save(fig, "last_10_matches", filename)
+
+    def _last_10_matches_figure(self, player_data: pd.DataFrame, player_name: str):
+        with span("graphs.last_10_matches.build", rows=len(player_data)):
+            # Latest 10 innings by match_date, not file order (no frame copy)
+            last_10_runs = latest_runs(player_data, 10)
+            
+            # Create figure
+            fig, ax = plt.subplots(figsize=(12, 6))
+            self._draw_last_10(ax, last_10_runs, player_name)
+            fig.tight_layout()
+        return fig
     
     def runs_distribution(
         self,
@@ -134,45 +355,19 @@ class GraphGenerator:
         Returns:
             Path to saved graph
         """
-        fig, ax = plt.subplots(figsize=(12, 6))
-        
-        runs = player_data['runs'].values
-        
-        # Create histogram with custom bins
-        bins = [0, 20, 40, 60, 80, 100, 150, 200]
-        n, bins, patches = ax.hist(runs, bins=bins, color='#ff6b6b', 
-                                   alpha=0.7, edgecolor='white', linewidth=1)
-        
-        # Color the 100+ bin differently
-        for i, patch in enumerate(patches):
-            if bins[i] >= 100:
-                patch.set_facecolor('#4ecdc4')
-        
-        # Styling
-        ax.set_xlabel('Run Ranges', fontsize=12)
-        ax.set_ylabel('Frequency (Number of Matches)', fontsize=12)
-        ax.set_title(f'{player_name.title()} - Runs Distribution', 
-                    fontsize=14, fontweight='bold', pad=20)
-        ax.grid(axis='y', alpha=0.3)
-        ax.set_axisbelow(True)
-        
-        # Add mean line
-        mean_runs = runs.mean()
-        ax.axvline(mean_runs, color='#fbbf24', linestyle='--', linewidth=2, 
-                  label=f'Average: {mean_runs:.1f}')
-        ax.legend()
+        fig = self._runs_distribution_figure(player_data, player_name)
         
         # Save
         if filename is None:
             filename = f"{player_name.replace(' ', '_')}_runs_distribution.png"
-        filepath = self.output_dir / filename
-        
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=150, bbox_inches='tight', facecolor='#0a0e1a')
-        plt.close()
-        
-        print(f" Saved: {filepath}")
-        return str(filepath)
+        return self._save(fig, "runs_distribution", filename)
+
+    def _runs_distribution_figure(self, player_data: pd.DataFrame, player_name: str):
+        with span("graphs.runs_distribution.build", rows=len(player_data)):
+            fig, ax = plt.subplots(figsize=(12, 6))
+            self._draw_runs_distribution(ax, player_data['runs'].values, player_name)
+            fig.tight_layout()
+        return fig
     
     def career_progression(
         self,
@@ -191,51 +386,35 @@ class GraphGenerator:
         Returns:
             Path to saved graph
         """
-        fig, ax = plt.subplots(figsize=(14, 6))
-        
-        # Calculate cumulative average
-        player_data = player_data.copy()
-        player_data['cumulative_runs'] = player_data['runs'].cumsum()
-        player_data['match_number'] = range(1, len(player_data) + 1)
-        player_data['cumulative_average'] = player_data['cumulative_runs'] / player_data['match_number']
-        
-        # Plot
-        ax.plot(player_data['match_number'], player_data['cumulative_average'], 
-               color='#4ecdc4', linewidth=2.5, marker='o', markersize=4, 
-               markerfacecolor='#ff6b6b', markeredgecolor='white', markeredgewidth=1)
-        
-        # Fill area under curve
-        ax.fill_between(player_data['match_number'], 
-                       player_data['cumulative_average'], 
-                       alpha=0.2, color='#4ecdc4')
-        
-        # Styling
-        ax.set_xlabel('Career Matches', fontsize=12)
-        ax.set_ylabel('Cumulative Batting Average', fontsize=12)
-        ax.set_title(f'{player_name.title()} - Career Progression', 
-                    fontsize=14, fontweight='bold', pad=20)
-        ax.grid(True, alpha=0.3)
-        ax.set_axisbelow(True)
-        
-        # Add final average annotation
-        final_avg = player_data['cumulative_average'].iloc[-1]
-        ax.annotate(f'Current Avg: {final_avg:.1f}',
-                   xy=(player_data['match_number'].iloc[-1], final_avg),
-                   xytext=(10, 10), textcoords='offset points',
-                   bbox=dict(boxstyle='round,pad=0.5', facecolor='#ff6b6b', alpha=0.7),
-                   fontsize=10, fontweight='bold')
+        fig = self._career_progression_figure(player_data, player_name)
         
         # Save
         if filename is None:
             filename = f"{player_name.replace(' ', '_')}_career_progression.png"
-        filepath = self.output_dir / filename
+        return self._save(fig, "career_progression", filename)
+
+    def _career_progression_figure(self, player_data: pd.DataFrame, player_name: str):
+        with span("graphs.career_progression.build", rows=len(player_data)):
+            fig, ax = plt.subplots(figsize=(14, 6))
+            self._draw_career_progression(ax, runs_by_date(player_data), player_name)
+            fig.tight_layout()
+        return fig
+    
+    def career_progression_data(self, player_data: pd.DataFrame) -> dict:
+        """
+        Get the career progression series as JSON-ready data.
         
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=150, bbox_inches='tight', facecolor='#0a0e1a')
-        plt.close()
+        Uses the same match_date order and downsampling as
+        ``career_progression``, so the exported points match the rendered
+        chart.
         
-        print(f" Saved: {filepath}")
-        return str(filepath)
+        Args:
+            player_data: DataFrame with player's match data
+            
+        Returns:
+            Dictionary with match numbers and cumulative averages
+        """
+        return career_progression_series(runs_by_date(player_data), self.max_points)
     
     def generate_all_graphs(
         self,
@@ -252,7 +431,7 @@ class GraphGenerator:
         Returns:
             Dictionary with paths to all generated graphs
         """
-        print(f"\n Generating graphs for {player_name}...")
+        logger.info("Generating graphs for %s...", player_name)
         
         graphs = {
             "last_10_matches": self.last_10_matches(player_data, player_name),
@@ -260,9 +439,96 @@ class GraphGenerator:
             "career_progression": self.career_progression(player_data, player_name)
         }
         
-        print(f" All graphs generated for {player_name}")
+        logger.info("All graphs generated for %s", player_name)
         return graphs
 
+    def player_report(
+        self,
+        player_data: pd.DataFrame,
+        player_name: str,
+        include_formats: bool = False,
+        filename: Optional[str] = None
+    ) -> str:
+        """
+        Generate a single multi-panel report for a player.
+
+        Draws the last 10 matches, runs distribution and career progression
+        panels (plus an optional runs-by-format panel) into one figure, so
+        the figure setup, layout pass and PNG encode happen once per player
+        instead of once per chart.
+
+        Args:
+            player_data: DataFrame with player's match data
+            player_name: Name of player
+            include_formats: Add a runs-by-format panel
+            filename: Custom filename (optional)
+
+        Returns:
+            Path to saved report
+        """
+        fig = self._report_figure(player_data, player_name, include_formats)
+
+        # Save
+        if filename is None:
+            filename = f"{player_name.replace(' ', '_')}_report.png"
+        return self._save(fig, "report", filename)
+
+    def _report_figure(self, player_data: pd.DataFrame, player_name: str, include_formats: bool):
+        include_formats = include_formats and 'format' in player_data.columns
+        runs = player_data['runs'].values
+
+        with span("graphs.report.build", rows=len(player_data)):
+            # 2x2 grid: last 10 | distribution on top, progression (and
+            # optionally the format split) underneath
+            fig = plt.figure(figsize=(18, 11))
+            grid = fig.add_gridspec(2, 2, height_ratios=[1, 1])
+            ax_last_10 = fig.add_subplot(grid[0, 0])
+            ax_distribution = fig.add_subplot(grid[0, 1])
+            if include_formats:
+                ax_progression = fig.add_subplot(grid[1, 0])
+                ax_formats = fig.add_subplot(grid[1, 1])
+            else:
+                ax_progression = fig.add_subplot(grid[1, :])
+
+            self._draw_last_10(ax_last_10, latest_runs(player_data, 10), player_name, title_size=13)
+            self._draw_runs_distribution(ax_distribution, runs, player_name, title_size=13)
+            self._draw_career_progression(ax_progression, runs_by_date(player_data), player_name, title_size=13)
+            if include_formats:
+                self._draw_format_split(ax_formats, player_data, player_name, title_size=13)
+
+            fig.suptitle(f'{player_name.title()} - Performance Report',
+                         fontsize=16, fontweight='bold')
+            fig.tight_layout()
+        return fig
+
+    def generate_reports(
+        self,
+        players: Dict[str, pd.DataFrame],
+        include_formats: bool = False
+    ) -> Dict[str, str]:
+        """
+        Generate combined reports for many players.
+
+        Batch counterpart of ``generate_all_graphs``: one figure and one
+        PNG encode per player.
+
+        Args:
+            players: Mapping of player name to that player's match data
+            include_formats: Add a runs-by-format panel to each report
+
+        Returns:
+            Dictionary mapping player name to report path
+        """
+        logger.info("Generating reports for %d players...", len(players))
+
+        reports = {
+            player_name: self.player_report(player_data, player_name, include_formats)
+            for player_name, player_data in players.items()
+        }
+
+        logger.info("All reports generated")
+        return reports
+
 
 # Convenience functions
 def generate_last_10_matches_graph(
@@ -297,6 +563,10 @@ def generate_career_progression(
 
 # Example usage and testing
 if __name__ == "__main__":
+    import pandas as pd
+    
+    logging.basicConfig(level=logging.INFO, format=" %(message)s")
+    
     print("=" * 60)
     print("GRAPHS MODULE - STANDALONE TEST")
     print("=" * 60)
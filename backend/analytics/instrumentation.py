@@ -0,0 +1,568 @@
+"""
+INSTRUMENTATION MODULE
+======================
+Lightweight timing spans for the analytics pipeline.
+
+Responsibilities:
+- Time named stages with a context manager (``span``) or decorator (``timed``)
+- Record duration, rows and bytes into per-stage histograms
+- Export the histograms as JSON or Prometheus text format
+- Opt-in memory profiling: peak and net Python allocations per stage
+  (tracemalloc) plus RSS sampled at span boundaries
+- Per-stage memory budgets that warn or fail when a stage's peak grows
+
+Stage names are dotted by area, e.g. ``data.load``, ``data.clean.duplicates``,
+``metrics.batting_average``, ``graphs.report.build``, ``graphs.report.encode``.
+
+Recording is on by default. Set ANALYTICS_INSTRUMENTATION=0 (or call
+``instrumentation.disable()``) and every span becomes a shared no-op
+object, so instrumented code pays one attribute check per stage.
+
+Memory profiling is off by default (tracemalloc slows allocation-heavy
+code down noticeably). Turn it on with ANALYTICS_MEMORY_PROFILE=1 or
+``instrumentation.enable_memory()``. Nested spans each report their own
+peak; tracemalloc is process-wide, so profile single-threaded runs.
+
+Histograms are per process: chart worker processes keep their own.
+Only the standard library is imported, so this module is safe to use
+from every analytics module without affecting startup budgets.
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds, Prometheus-style (+Inf is implicit)
+DEFAULT_BUCKETS = (
+    0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+    0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+_MB = 1024 * 1024
+
+
+class MemoryBudgetError(RuntimeError):
+    """Raised when a stage exceeds a memory budget in "fail" mode."""
+
+
+def rss_bytes() -> int:
+    """
+    Current resident set size of this process.
+
+    Returns:
+        RSS in bytes (0 where /proc is unavailable)
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+    except OSError:
+        return 0
+    return pages * os.sysconf('SC_PAGE_SIZE')
+
+
+class StageHistogram:
+    """Duration histogram plus row and byte totals for one stage."""
+
+    __slots__ = ("buckets", "bucket_counts", "count", "total_seconds",
+                 "min_seconds", "max_seconds", "rows", "bytes",
+                 "memory_count", "peak_bytes_max", "peak_bytes_total",
+                 "net_bytes_total", "rss_delta_max")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            buckets: Sorted upper bounds in seconds
+        """
+        self.buckets = tuple(buckets)
+        # One extra slot for observations above the last bound (+Inf)
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total_seconds = 0.0
+        self.min_seconds = float("inf")
+        self.max_seconds = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.memory_count = 0
+        self.peak_bytes_max = 0
+        self.peak_bytes_total = 0
+        self.net_bytes_total = 0
+        self.rss_delta_max = 0
+
+    def observe(self, seconds: float, rows: Optional[int] = None, nbytes: Optional[int] = None):
+        """
+        Record one stage run.
+
+        Args:
+            seconds: Duration of the run
+            rows: Rows processed (optional)
+            nbytes: Bytes produced (optional)
+        """
+        self.bucket_counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total_seconds += seconds
+        self.min_seconds = min(self.min_seconds, seconds)
+        self.max_seconds = max(self.max_seconds, seconds)
+        if rows:
+            self.rows += int(rows)
+        if nbytes:
+            self.bytes += int(nbytes)
+
+    def observe_memory(self, peak_bytes: int, net_bytes: int, rss_delta: int):
+        """
+        Record the memory profile of one stage run.
+
+        Args:
+            peak_bytes: Peak traced allocation above the level at span start
+            net_bytes: Traced allocation still held at span end
+            rss_delta: RSS growth across the span
+        """
+        self.memory_count += 1
+        self.peak_bytes_max = max(self.peak_bytes_max, peak_bytes)
+        self.peak_bytes_total += peak_bytes
+        self.net_bytes_total += net_bytes
+        self.rss_delta_max = max(self.rss_delta_max, rss_delta)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile from the buckets (upper bound of its bucket).
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated duration in seconds (0.0 if nothing recorded)
+        """
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.buckets, self.bucket_counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(bound, self.max_seconds)
+        return self.max_seconds
+
+    def to_dict(self) -> Dict:
+        """
+        Summarize the histogram.
+
+        Returns:
+            JSON-ready dictionary with counts, totals and cumulative buckets
+        """
+        cumulative, buckets = 0, {}
+        for bound, bucket_count in zip(self.buckets, self.bucket_counts):
+            cumulative += bucket_count
+            buckets[repr(bound)] = cumulative
+        buckets["+Inf"] = self.count
+
+        summary = {
+            "count": self.count,
+            "total_seconds": round(self.total_seconds, 6),
+            "mean_seconds": round(self.total_seconds / self.count, 6) if self.count else 0.0,
+            "min_seconds": round(self.min_seconds, 6) if self.count else 0.0,
+            "max_seconds": round(self.max_seconds, 6),
+            "p50_seconds": round(self.quantile(0.5), 6),
+            "p95_seconds": round(self.quantile(0.95), 6),
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "buckets": buckets,
+        }
+        if self.memory_count:
+            summary["memory"] = {
+                "samples": self.memory_count,
+                "peak_mb_max": round(self.peak_bytes_max / _MB, 3),
+                "peak_mb_mean": round(self.peak_bytes_total / self.memory_count / _MB, 3),
+                "net_mb_mean": round(self.net_bytes_total / self.memory_count / _MB, 3),
+                "rss_delta_mb_max": round(self.rss_delta_max / _MB, 3),
+            }
+        return summary
+
+
+class Span:
+    """One timed run of a stage; set ``rows`` / ``bytes`` inside the block."""
+
+    __slots__ = ("registry", "stage", "rows", "bytes", "start")
+
+    active = True
+
+    def __init__(self, registry: "Instrumentation", stage: str, rows: Optional[int] = None):
+        self.registry = registry
+        self.stage = stage
+        self.rows = rows
+        self.bytes = None
+        self.start = 0.0
+
+    def __enter__(self) -> "Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.registry.observe(self.stage, time.perf_counter() - self.start, self.rows, self.bytes)
+        return False
+
+
+class MemorySpan(Span):
+    """Span that also profiles allocations (tracemalloc) and RSS."""
+
+    __slots__ = ("start_traced", "peak_traced", "start_rss")
+
+    def __enter__(self) -> "MemorySpan":
+        stack = self.registry._span_stack()
+        traced, peak = tracemalloc.get_traced_memory()
+        # Hand the peak so far to the enclosing span before resetting it
+        if stack:
+            stack[-1].peak_traced = max(stack[-1].peak_traced, peak)
+        tracemalloc.reset_peak()
+        self.start_traced = self.peak_traced = traced
+        self.start_rss = rss_bytes()
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        seconds = time.perf_counter() - self.start
+        traced, peak = tracemalloc.get_traced_memory()
+        self.peak_traced = max(self.peak_traced, peak)
+
+        stack = self.registry._span_stack()
+        stack.pop()
+        if stack:
+            stack[-1].peak_traced = max(stack[-1].peak_traced, self.peak_traced)
+
+        self.registry.observe(self.stage, seconds, self.rows, self.bytes)
+        self.registry.observe_memory(
+            self.stage,
+            peak_bytes=self.peak_traced - self.start_traced,
+            net_bytes=traced - self.start_traced,
+            rss_delta=rss_bytes() - self.start_rss,
+            rows=self.rows,
+            raise_on_fail=exc_type is None
+        )
+        return False
+
+
+class _NoopSpan:
+    """Shared stand-in for Span while instrumentation is disabled."""
+
+    __slots__ = ()
+
+    active = False
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def __setattr__(self, name, value):
+        # Instrumented code sets rows/bytes unconditionally; drop them
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Instrumentation:
+    """Registry of per-stage histograms."""
+
+    def __init__(self, enabled: bool = True, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Initialize the registry.
+
+        Args:
+            enabled: Record spans (False turns every span into a no-op)
+            buckets: Histogram upper bounds in seconds
+        """
+        self.enabled = enabled
+        self.memory = False
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[str, StageHistogram] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._started_tracemalloc = False
+        self.memory_budgets: Dict[str, Dict] = {}
+        self.budget_violations: List[str] = []
+
+    def enable(self):
+        """Start recording spans."""
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording spans; recorded histograms are kept."""
+        self.enabled = False
+
+    def enable_memory(self):
+        """Profile memory in every span (starts tracemalloc if needed)."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self.memory = True
+
+    def disable_memory(self):
+        """Stop memory profiling (and tracemalloc, if this registry started it)."""
+        self.memory = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def set_memory_budget(
+        self,
+        stage: str,
+        peak_mb: float = 0.0,
+        bytes_per_row: float = 0.0,
+        mode: str = "warn"
+    ):
+        """
+        Limit the peak memory of a stage.
+
+        The limit is ``peak_mb`` plus ``bytes_per_row`` for every row the
+        span reports, so one budget holds at any dataset size; a stage that
+        starts copying its input shows up as extra bytes per row.
+
+        Args:
+            stage: Dotted stage name
+            peak_mb: Fixed allowance in MB
+            bytes_per_row: Allowance per processed row
+            mode: "warn" logs a warning, "fail" raises MemoryBudgetError
+
+        Raises:
+            ValueError: If mode is not "warn" or "fail"
+        """
+        if mode not in ("warn", "fail"):
+            raise ValueError(f"Unknown budget mode '{mode}'. Use 'warn' or 'fail'")
+        self.memory_budgets[stage] = {
+            "peak_mb": peak_mb, "bytes_per_row": bytes_per_row, "mode": mode
+        }
+
+    def reset(self):
+        """Drop all recorded histograms and budget violations."""
+        with self._lock:
+            self._histograms.clear()
+            self.budget_violations.clear()
+
+    def span(self, stage: str, rows: Optional[int] = None):
+        """
+        Time a block of code as one run of ``stage``.
+
+        Args:
+            stage: Dotted stage name
+            rows: Rows processed, if known up front
+
+        Returns:
+            Context manager yielding a span (or a no-op when disabled)
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        if self.memory:
+            return MemorySpan(self, stage, rows)
+        return Span(self, stage, rows)
+
+    def observe(self, stage: str, seconds: float, rows: Optional[int] = None, nbytes: Optional[int] = None):
+        """
+        Record one run of a stage measured elsewhere.
+
+        Args:
+            stage: Dotted stage name
+            seconds: Duration of the run
+            rows: Rows processed (optional)
+            nbytes: Bytes produced (optional)
+        """
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = StageHistogram(self.buckets)
+            histogram.observe(seconds, rows, nbytes)
+
+    def observe_memory(
+        self,
+        stage: str,
+        peak_bytes: int,
+        net_bytes: int,
+        rss_delta: int,
+        rows: Optional[int] = None,
+        raise_on_fail: bool = True
+    ):
+        """
+        Record the memory profile of one stage run and check its budget.
+
+        Args:
+            stage: Dotted stage name
+            peak_bytes: Peak traced allocation during the run
+            net_bytes: Traced allocation still held after the run
+            rss_delta: RSS growth across the run
+            rows: Rows processed (scales the budget)
+            raise_on_fail: Raise for "fail" budgets (False while another
+                           exception is already propagating)
+
+        Raises:
+            MemoryBudgetError: If a "fail" budget is exceeded
+        """
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = StageHistogram(self.buckets)
+            histogram.observe_memory(peak_bytes, net_bytes, rss_delta)
+
+        budget = self.memory_budgets.get(stage)
+        if budget is None:
+            return
+        limit = budget["peak_mb"] * _MB + budget["bytes_per_row"] * (rows or 0)
+        if peak_bytes <= limit:
+            return
+
+        message = (
+            f"{stage}: peak {peak_bytes / _MB:.2f}MB over budget {limit / _MB:.2f}MB"
+            + (f" ({rows:,} rows)" if rows else "")
+        )
+        with self._lock:
+            self.budget_violations.append(message)
+        if budget["mode"] == "fail" and raise_on_fail:
+            raise MemoryBudgetError(message)
+        logger.warning("Memory budget exceeded: %s", message)
+
+    def _span_stack(self) -> List[MemorySpan]:
+        """Open memory spans on the current thread, innermost last."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def stages(self) -> Dict[str, Dict]:
+        """
+        Summarize every recorded stage.
+
+        Returns:
+            Dictionary mapping stage name to its histogram summary
+        """
+        with self._lock:
+            return {stage: h.to_dict() for stage, h in sorted(self._histograms.items())}
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """
+        Export all stages as JSON.
+
+        Args:
+            indent: JSON indentation (optional)
+
+        Returns:
+            JSON string with ``enabled`` and ``stages``
+        """
+        return json.dumps(
+            {"enabled": self.enabled, "memory": self.memory, "stages": self.stages()},
+            indent=indent
+        )
+
+    def to_prometheus(self, prefix: str = "analytics_stage") -> str:
+        """
+        Export all stages in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Text with a duration histogram and rows/bytes counters per stage
+        """
+        lines = [
+            f"# HELP {prefix}_duration_seconds Time spent in each analytics stage.",
+            f"# TYPE {prefix}_duration_seconds histogram",
+        ]
+        stages = self.stages()
+        for stage, summary in stages.items():
+            label = f'stage="{stage}"'
+            for bound, cumulative in summary["buckets"].items():
+                lines.append(f'{prefix}_duration_seconds_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f"{prefix}_duration_seconds_sum{{{label}}} {summary['total_seconds']}")
+            lines.append(f"{prefix}_duration_seconds_count{{{label}}} {summary['count']}")
+
+        for field, help_text in [("rows", "Rows processed by each analytics stage."),
+                                 ("bytes", "Bytes produced by each analytics stage.")]:
+            lines.append(f"# HELP {prefix}_{field}_total {help_text}")
+            lines.append(f"# TYPE {prefix}_{field}_total counter")
+            for stage, summary in stages.items():
+                lines.append(f'{prefix}_{field}_total{{stage="{stage}"}} {summary[field]}')
+
+        profiled = {stage: summary["memory"] for stage, summary in stages.items() if "memory" in summary}
+        if profiled:
+            lines.append(f"# HELP {prefix}_peak_memory_bytes Largest traced peak allocation per stage.")
+            lines.append(f"# TYPE {prefix}_peak_memory_bytes gauge")
+            for stage, memory in profiled.items():
+                lines.append(f'{prefix}_peak_memory_bytes{{stage="{stage}"}} {int(memory["peak_mb_max"] * _MB)}')
+
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry used by the analytics modules
+instrumentation = Instrumentation(enabled=os.environ.get("ANALYTICS_INSTRUMENTATION", "1") != "0")
+if os.environ.get("ANALYTICS_MEMORY_PROFILE") == "1":
+    instrumentation.enable_memory()
+
+
+def span(stage: str, rows: Optional[int] = None):
+    """
+    Time a block of code on the process-wide registry.
+
+    Args:
+        stage: Dotted stage name
+        rows: Rows processed, if known up front
+
+    Returns:
+        Context manager yielding a span (or a no-op when disabled)
+    """
+    return instrumentation.span(stage, rows)
+
+
+def timed(stage: str) -> Callable:
+    """
+    Decorator that times every call of a function as one run of ``stage``.
+
+    Args:
+        stage: Dotted stage name
+
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not instrumentation.enabled:
+                return func(*args, **kwargs)
+            if instrumentation.memory:
+                with instrumentation.span(stage):
+                    return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                instrumentation.observe(stage, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    print("=" * 60)
+    print("INSTRUMENTATION MODULE - STANDALONE TEST")
+    print("=" * 60)
+
+    @timed("example.sleep")
+    def nap():
+        time.sleep(0.002)
+
+    for _ in range(5):
+        nap()
+    with span("example.block", rows=100) as s:
+        s.bytes = 2048
+
+    print(instrumentation.to_json(indent=2))
+    print(instrumentation.to_prometheus())
+    print(" Instrumentation test passed!")
@@ -12,11 +12,22 @@ Key Metrics:
 - Matches Played
 
 All metrics are computed from raw match data, no hardcoding.
+
+Pandas is only needed by callers (who pass DataFrames in), so this
+module does not import it at load time.
+
+Each metric is timed as its own instrumentation stage (``metrics.*``).
 """
 
-import pandas as pd
+from __future__ import annotations
+
 import numpy as np
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
+
+from .instrumentation import span, timed
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class MetricsCalculator:
@@ -32,6 +43,7 @@ class MetricsCalculator:
         self.data = player_data
         self.player_name = player_data['player_name'].iloc[0] if len(player_data) > 0 else "Unknown"
     
+    @timed("metrics.total_runs")
     def total_runs(self) -> int:
         """
         Calculate total career runs.
@@ -41,6 +53,7 @@ class MetricsCalculator:
         """
         return int(self.data['runs'].sum())
     
+    @timed("metrics.total_matches")
     def total_matches(self) -> int:
         """
         Calculate total matches played.
@@ -50,6 +63,7 @@ class MetricsCalculator:
         """
         return len(self.data)
     
+    @timed("metrics.batting_average")
     def batting_average(self) -> float:
         """
         Calculate batting average.
@@ -66,7 +80,7 @@ class MetricsCalculator:
         # Count dismissals (if 'dismissal' column exists)
         if 'dismissal' in self.data.columns:
             # Count only matches where player was dismissed (not "not out")
-            dismissals = self.data[self.data['dismissal'] != 'not out'].shape[0]
+            dismissals = int((self.data['dismissal'] != 'not out').sum())
         else:
             # If no dismissal column, assume all innings count as dismissals
             dismissals = self.total_matches()
@@ -77,6 +91,7 @@ class MetricsCalculator:
         average = total_runs / dismissals
         return round(average, 1)
     
+    @timed("metrics.strike_rate")
     def strike_rate(self) -> float:
         """
         Calculate strike rate.
@@ -95,6 +110,7 @@ class MetricsCalculator:
         sr = (total_runs / total_balls) * 100
         return round(sr, 1)
     
+    @timed("metrics.consistency_index")
     def consistency_index(self) -> float:
         """
         Calculate consistency index using standard deviation.
@@ -125,6 +141,7 @@ class MetricsCalculator:
         consistency = (mean_runs / std_runs) * 2
         return round(consistency, 1)
     
+    @timed("metrics.total_centuries")
     def total_centuries(self) -> int:
         """
         Count total centuries (100+ scores).
@@ -138,6 +155,7 @@ class MetricsCalculator:
             # Calculate from runs if century column doesn't exist
             return int((self.data['runs'] >= 100).sum())
     
+    @timed("metrics.total_half_centuries")
     def total_half_centuries(self) -> int:
         """
         Count total half-centuries (50+ scores, excluding centuries).
@@ -151,6 +169,7 @@ class MetricsCalculator:
             # Calculate from runs: 50-99 range
             return int(((self.data['runs'] >= 50) & (self.data['runs'] < 100)).sum())
     
+    @timed("metrics.highest_score")
     def highest_score(self) -> int:
         """
         Get highest individual score.
@@ -167,20 +186,22 @@ class MetricsCalculator:
         Returns:
             Dictionary with all metrics
         """
-        metrics = {
-            "player_name": self.player_name,
-            "total_runs": self.total_runs(),
-            "matches_played": self.total_matches(),
-            "batting_average": self.batting_average(),
-            "strike_rate": self.strike_rate(),
-            "consistency_index": self.consistency_index(),
-            "centuries": self.total_centuries(),
-            "half_centuries": self.total_half_centuries(),
-            "highest_score": self.highest_score()
-        }
+        with span("metrics.all", rows=len(self.data)):
+            metrics = {
+                "player_name": self.player_name,
+                "total_runs": self.total_runs(),
+                "matches_played": self.total_matches(),
+                "batting_average": self.batting_average(),
+                "strike_rate": self.strike_rate(),
+                "consistency_index": self.consistency_index(),
+                "centuries": self.total_centuries(),
+                "half_centuries": self.total_half_centuries(),
+                "highest_score": self.highest_score()
+            }
         
         return metrics
     
+    @timed("metrics.format")
     def format_metrics(self, format_type: Optional[str] = None) -> Dict[str, float]:
         """
         Calculate metrics for specific format (ODI, Test, T20I).
@@ -253,6 +274,87 @@ def calculate_consistency_index(runs_array: np.ndarray) -> float:
     return round(consistency, 1)
 
 
+@timed("metrics.from_sums")
+def metrics_from_sums(player_name: str, sums: Dict[str, float]) -> Dict[str, float]:
+    """
+    Calculate all metrics from pre-aggregated totals.
+
+    Lets storage backends and parallel engines that aggregate elsewhere
+    (SQL, worker processes) return exactly what calculate_all_metrics
+    returns, without materialising the player's rows.
+
+    Args:
+        player_name: Name of player
+        sums: Dictionary with matches, runs, balls, dismissals,
+              runs_squared, centuries, half_centuries, highest_score
+
+    Returns:
+        Dictionary with all metrics
+    """
+    matches = int(sums['matches'])
+    total_runs = int(sums['runs'])
+    dismissals = int(sums['dismissals'])
+    balls = sums['balls']
+
+    average = round(total_runs / dismissals, 1) if dismissals else 0.0
+    strike_rate = round((total_runs / balls) * 100, 1) if balls else 0.0
+
+    # Population standard deviation from sum and sum of squares
+    if matches < 2:
+        consistency = 0.0
+    else:
+        mean_runs = sums['runs'] / matches
+        variance = max(sums['runs_squared'] / matches - mean_runs ** 2, 0.0)
+        # Treat floating-point noise as zero spread (all scores equal)
+        if variance <= 1e-9 * max(mean_runs ** 2, 1.0):
+            consistency = 100.0
+        else:
+            consistency = round((mean_runs / np.sqrt(variance)) * 2, 1)
+
+    return {
+        "player_name": player_name,
+        "total_runs": total_runs,
+        "matches_played": matches,
+        "batting_average": average,
+        "strike_rate": strike_rate,
+        "consistency_index": float(consistency),
+        "centuries": int(sums['centuries']),
+        "half_centuries": int(sums['half_centuries']),
+        "highest_score": int(sums['highest_score'])
+    }
+
+
+def format_metrics_from_sums(sums: Dict[str, float]) -> Dict[str, float]:
+    """
+    Calculate format metrics from pre-aggregated totals.
+
+    Same result as MetricsCalculator.format_metrics for one format.
+
+    Args:
+        sums: Totals for the player's matches in that format
+              (same keys as metrics_from_sums)
+
+    Returns:
+        Dictionary with format-specific metrics
+    """
+    if sums['matches'] == 0:
+        return {
+            "matches": 0,
+            "runs": 0,
+            "average": 0.0,
+            "strike_rate": 0.0,
+            "centuries": 0
+        }
+    metrics = metrics_from_sums("", sums)
+    return {
+        "matches": metrics['matches_played'],
+        "runs": metrics['total_runs'],
+        "average": metrics['batting_average'],
+        "strike_rate": metrics['strike_rate'],
+        "centuries": metrics['centuries']
+    }
+
+
 def calculate_format_metrics(player_data: pd.DataFrame, format_type: str) -> Dict[str, float]:
     """
     Calculate metrics for specific format.
@@ -270,6 +372,8 @@ def calculate_format_metrics(player_data: pd.DataFrame, format_type: str) -> Dic
 
 # Example usage and testing
 if __name__ == "__main__":
+    import pandas as pd
+    
     print("=" * 60)
     print("METRICS MODULE - STANDALONE TEST")
     print("=" * 60)
@@ -0,0 +1,531 @@
+"""
+PARALLEL MODULE
+===============
+Out-of-core, multi-process aggregation of league-wide metrics.
+
+Responsibilities:
+- Split the data into partitions and aggregate each one in a worker
+  process into per (player, format) sufficient statistics: matches,
+  runs, balls, dismissals, sum of squared runs, centuries, half
+  centuries and highest score (everything metrics_from_sums needs)
+- Merge the partial statistics exactly in the parent (sums add up,
+  highest score takes the maximum), so the league table matches the
+  single-process MetricsCalculator output
+
+Two sources:
+- CSV files are split into byte ranges on line boundaries; each worker
+  reads, cleans and aggregates its own range, so no rows cross process
+  boundaries and memory is bounded by workers x partition size
+- Workers write a hash of every line into a shared block; the parent
+  flags lines that repeat one from an earlier range, and only ranges
+  holding flagged lines aggregate those lines again so their sums can
+  be subtracted. Duplicate rows are removed across the whole file
+  exactly as clean_data removes them, and only sums cross processes
+- In-memory frames are encoded once into a numeric block in shared
+  memory; workers attach to it and write their statistics into a shared
+  result block, so no DataFrame is ever pickled
+
+Usage:
+    python backend/benchmarks/parallel.py --rows 10000000
+"""
+
+import contextlib
+import io
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .compare import LeagueTable, grouped_sums, merge_sums, sum_inputs
+from .data_loader import DataLoader
+from .instrumentation import span
+from .synthetic import COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Bytes of CSV per partition; a worker holds about 10x this while parsing
+DEFAULT_PARTITION_BYTES = 32 * 1024 * 1024
+
+# Rows of the shared block: group code, then the values grouped_sums adds up
+_SHARED_COLUMNS = ['group', 'runs', 'balls', 'dismissals', 'centuries', 'half_centuries']
+
+# Rows of the shared result block per partition
+_RESULT_ROWS = ['runs', 'balls', 'dismissals', 'runs_squared', 'centuries',
+                'half_centuries', 'matches', 'highest_score']
+
+
+def csv_partitions(path: str, partition_bytes: int = DEFAULT_PARTITION_BYTES) -> List[Tuple[int, int]]:
+    """
+    Split a CSV file into byte ranges that start and end on line boundaries.
+
+    Args:
+        path: CSV file with a header line
+        partition_bytes: Target bytes per range
+
+    Returns:
+        List of (start, end) byte offsets covering every data line once
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, 'rb') as f:
+        start = len(f.readline())
+        while start < size:
+            f.seek(min(start + partition_bytes, size))
+            if f.tell() < size:
+                f.readline()
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _quiet_worker():
+    """Per-partition cleaning messages would flood the parent's log."""
+    logging.getLogger("analytics").setLevel(logging.ERROR)
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Same as _quiet_worker, for partitions cleaned in this process."""
+    analytics_logger = logging.getLogger("analytics")
+    level = analytics_logger.level
+    analytics_logger.setLevel(logging.ERROR)
+    try:
+        yield
+    finally:
+        analytics_logger.setLevel(level)
+
+
+@contextlib.contextmanager
+def _mapper(workers: int):
+    """``map`` over partitions in this process, or in a quiet worker pool."""
+    if workers == 1:
+        with _quiet():
+            yield map
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_quiet_worker) as pool:
+            yield pool.map
+
+
+def _partition_lines(path: str, start: int, end: int) -> Tuple[bytes, List[bytes]]:
+    """Header line and the non-blank lines of one byte range."""
+    with open(path, 'rb') as f:
+        header = f.readline()
+        f.seek(start)
+        data = f.read(end - start)
+    # read_csv skips blank lines, so they are never rows to hash or flag
+    return header, [line for line in data.splitlines() if line.strip()]
+
+
+def _clean_lines(path: str, header: bytes, lines: List[bytes]) -> pd.DataFrame:
+    """Parse and clean CSV lines."""
+    frame = pd.read_csv(io.BytesIO(header + b'\n'.join(lines)))
+    return DataLoader(path).clean_data(frame)
+
+
+def _csv_line_bound(path: str, start: int, end: int) -> int:
+    """Upper bound on the lines in one byte range (worker)."""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start).count(b'\n') + 1
+
+
+def _csv_partition_sums(
+    path: str,
+    start: int,
+    end: int,
+    hash_name: str,
+    flag_name: str,
+    size: int,
+    offset: int
+) -> Tuple[pd.DataFrame, int, int]:
+    """
+    Read, clean and aggregate one byte range of a CSV file (worker).
+
+    The hash of each line goes to slot ``offset`` of the shared hash
+    block, and whether it is the line's first copy in this range to the
+    same slot of the shared flag block.
+
+    Returns:
+        (sums in the grouped_sums layout, rows read, rows kept)
+    """
+    header, lines = _partition_lines(path, start, end)
+    rows = len(lines)
+    hash_block = shared_memory.SharedMemory(name=hash_name)
+    flag_block = shared_memory.SharedMemory(name=flag_name)
+    try:
+        hashes = np.ndarray((size,), dtype=np.uint64, buffer=hash_block.buf)[offset:offset + rows]
+        first = np.ndarray((size,), dtype=np.uint8, buffer=flag_block.buf)[offset:offset + rows]
+        # Lines are hashed as bytes, so identical lines match whatever
+        # dtypes their partitions parse to
+        if lines:
+            hashes[:] = pd.util.hash_array(np.array(lines, dtype=object))
+        first[:] = ~pd.Series(hashes, copy=False).duplicated().to_numpy()
+        if not first.all():
+            lines = [line for line, keep in zip(lines, first) if keep]
+        del hashes, first
+    finally:
+        hash_block.close()
+        flag_block.close()
+
+    cleaned = _clean_lines(path, header, lines)
+    return grouped_sums(cleaned), rows, len(cleaned)
+
+
+def _csv_partition_repeats(
+    path: str,
+    start: int,
+    end: int,
+    flag_name: str,
+    size: int,
+    offset: int
+) -> Tuple[pd.DataFrame, int]:
+    """
+    Aggregate the lines of one byte range flagged as repeats (worker).
+
+    Returns:
+        (sums of the flagged rows that survive cleaning, their count)
+    """
+    header, lines = _partition_lines(path, start, end)
+    flag_block = shared_memory.SharedMemory(name=flag_name)
+    try:
+        flags = np.ndarray((size,), dtype=np.uint8, buffer=flag_block.buf)[offset:offset + len(lines)]
+        repeats = [line for line, flag in zip(lines, flags) if flag]
+        del flags
+    finally:
+        flag_block.close()
+
+    cleaned = _clean_lines(path, header, repeats)
+    return grouped_sums(cleaned), len(cleaned)
+
+
+def _shared_partition_sums(
+    data_name: str,
+    rows: int,
+    result_name: str,
+    groups: int,
+    index: int,
+    start: int,
+    end: int
+):
+    """Aggregate rows ``start:end`` of the shared block into result slot ``index`` (worker)."""
+    data_block = shared_memory.SharedMemory(name=data_name)
+    result_block = shared_memory.SharedMemory(name=result_name)
+    try:
+        data = np.ndarray((len(_SHARED_COLUMNS), rows), dtype=np.float64, buffer=data_block.buf)
+        result = np.ndarray((len(_RESULT_ROWS), groups), dtype=np.float64, buffer=result_block.buf,
+                            offset=index * len(_RESULT_ROWS) * groups * 8)
+        _partition_sums(data[:, start:end], result)
+        del data, result
+    finally:
+        data_block.close()
+        result_block.close()
+
+
+def _partition_sums(data: np.ndarray, out: np.ndarray):
+    """Per-group statistics of a slice of the shared block, written into ``out``."""
+    groups = out.shape[1]
+    group = data[0].astype(np.int64)
+    runs = data[1]
+    out[0] = np.bincount(group, weights=runs, minlength=groups)
+    out[1] = np.bincount(group, weights=data[2], minlength=groups)
+    out[2] = np.bincount(group, weights=data[3], minlength=groups)
+    out[3] = np.bincount(group, weights=runs * runs, minlength=groups)
+    out[4] = np.bincount(group, weights=data[4], minlength=groups)
+    out[5] = np.bincount(group, weights=data[5], minlength=groups)
+    out[6] = np.bincount(group, minlength=groups)
+    out[7] = -np.inf
+    np.maximum.at(out[7], group, runs)
+
+
+def _merge_partials(partials) -> pd.DataFrame:
+    """Fold grouped_sums partials into running sums as they arrive."""
+    merged = [grouped_sums(pd.DataFrame(columns=COLUMNS))]
+    for partial in partials:
+        merged.append(partial)
+        # Bound the parent's memory on files with many partitions
+        if len(merged) >= 16:
+            merged = [merge_sums(merged)]
+    return merge_sums(merged)
+
+
+def _repeated_lines(hashes: np.ndarray, first: np.ndarray, counts: List[int], offsets: List[int]) -> np.ndarray:
+    """
+    Slots of lines that repeat a line of an earlier range.
+
+    Args:
+        hashes: Shared hash block; each range's hashes start at its offset
+        first: Shared flag block, 1 where a line is first in its range
+        counts: Lines per range
+        offsets: Slot of each range's first line
+
+    Returns:
+        Sorted slots of lines kept by their own range although an earlier
+        range already holds the same line
+    """
+    # Pack the hashes in place so they are in file order with no gaps
+    packed = 0
+    for count, offset in zip(counts, offsets):
+        hashes[packed:packed + count] = hashes[offset:offset + count]
+        packed += count
+    hashes = hashes[:packed]
+
+    # Sorting finds the few repeated hashes without a hash table over
+    # every line; only lines carrying one of them are examined further
+    ordered = np.sort(hashes)
+    repeated = np.unique(ordered[1:][ordered[1:] == ordered[:-1]])
+    del ordered
+    if not len(repeated):
+        return np.array([], dtype=np.int64)
+    candidates = np.flatnonzero(pd.Series(hashes, copy=False).isin(repeated).to_numpy())
+    later = candidates[pd.Series(hashes[candidates]).duplicated().to_numpy()]
+
+    # Back from packed positions to slots
+    starts = np.cumsum([0] + counts[:-1])
+    ranges = np.searchsorted(starts, later, side='right') - 1
+    slots = np.asarray(offsets)[ranges] + (later - starts[ranges])
+    return slots[first[slots] == 1]
+
+
+def _csv_sums(path: str, ranges: List[Tuple[int, int]], workers: int) -> Tuple[pd.DataFrame, int, int]:
+    """
+    Aggregate every range, then subtract rows kept by more than one range.
+
+    Each range only removes its own duplicates, so a row repeated in k
+    ranges is counted k times. Every line's hash goes through shared
+    memory; the ranges holding the k - 1 later copies aggregate just
+    those lines again, and their sums are subtracted. The highest score
+    is unaffected since one copy always remains.
+
+    Args:
+        path: CSV file
+        ranges: Byte ranges from csv_partitions
+        workers: Worker processes (1 runs every range in this process)
+
+    Returns:
+        (sums in the grouped_sums layout, rows read, rows kept)
+    """
+    n = len(ranges)
+    if not n:
+        return _merge_partials([]), 0, 0
+    starts, ends = zip(*ranges)
+    with _mapper(workers) as map_func:
+        bounds = list(map_func(_csv_line_bound, [path] * n, starts, ends))
+    offsets = np.cumsum([0] + bounds[:-1]).tolist()
+    size = sum(bounds)
+
+    # The blocks exist before the pool that uses them starts, so its
+    # workers share this process's resource tracker, as in frame_sums
+    hash_block = shared_memory.SharedMemory(create=True, size=size * 8)
+    flag_block = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        with _mapper(workers) as map_func:
+            results = list(map_func(
+                _csv_partition_sums, [path] * n, starts, ends,
+                [hash_block.name] * n, [flag_block.name] * n, [size] * n, offsets
+            ))
+            sums = _merge_partials(partial for partial, _, _ in results)
+            counts = [rows for _, rows, _ in results]
+            kept = sum(cleaned for _, _, cleaned in results)
+
+            hashes = np.ndarray((size,), dtype=np.uint64, buffer=hash_block.buf)
+            flags = np.ndarray((size,), dtype=np.uint8, buffer=flag_block.buf)
+            slots = _repeated_lines(hashes, flags, counts, offsets)
+            flags[:] = 0
+            flags[slots] = 1
+            del hashes, flags
+
+            affected = np.unique(np.searchsorted(offsets, slots, side='right') - 1).tolist()
+            found = list(map_func(
+                _csv_partition_repeats, [path] * len(affected),
+                [starts[i] for i in affected], [ends[i] for i in affected],
+                [flag_block.name] * len(affected), [size] * len(affected),
+                [offsets[i] for i in affected]
+            ))
+    finally:
+        hash_block.close()
+        hash_block.unlink()
+        flag_block.close()
+        flag_block.unlink()
+
+    removed = sum(count for _, count in found)
+    if removed:
+        correction = -_merge_partials(partial for partial, _ in found)
+        correction['highest_score'] = -np.inf
+        sums = merge_sums([sums, correction])
+        kept -= removed
+        logger.info("Removed %d duplicate rows found in more than one partition", removed)
+    return sums, sum(counts), kept
+
+
+class ParallelAggregator:
+    """Computes league-wide sums and metrics across worker processes."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        partition_bytes: int = DEFAULT_PARTITION_BYTES
+    ):
+        """
+        Configure the engine.
+
+        Args:
+            workers: Worker processes (default: CPU count); 1 runs every
+                     partition in this process
+            partition_bytes: CSV bytes per partition (bounds worker memory)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.partition_bytes = partition_bytes
+        self.stats: Dict[str, float] = {}
+
+    def csv_sums(self, path: str) -> pd.DataFrame:
+        """
+        Clean and aggregate a CSV file without loading it in this process.
+
+        Duplicate lines are removed across the whole file, wherever they
+        are, so the sums match clean_data on the complete file.
+
+        Args:
+            path: CSV in the cricket_data.csv schema
+
+        Returns:
+            DataFrame in the grouped_sums layout
+
+        Raises:
+            FileNotFoundError: If the CSV file doesn't exist
+        """
+        if not Path(path).exists():
+            raise FileNotFoundError(f"Data file not found: {path}")
+
+        start = time.perf_counter()
+        ranges = csv_partitions(path, self.partition_bytes)
+        workers = max(1, min(self.workers, len(ranges)))
+        logger.info("Aggregating %s in %d partition(s) with %d worker(s)", path, len(ranges), workers)
+
+        with span("parallel.csv") as s:
+            sums, rows, kept = _csv_sums(path, ranges, workers)
+            s.rows = rows
+
+        if kept < rows:
+            logger.info("Cleaning removed %d of %d rows", rows - kept, rows)
+        self._record(start, workers, len(ranges), rows, kept)
+        return sums
+
+    def frame_sums(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Aggregate a cleaned frame across workers through shared memory.
+
+        Args:
+            df: Cleaned matches in the cricket_data.csv schema
+
+        Returns:
+            DataFrame in the grouped_sums layout
+        """
+        start = time.perf_counter()
+        rows = len(df)
+        work, format_key = sum_inputs(df)
+        player_codes, players = pd.factorize(df['player_name'])
+        format_codes, formats = pd.factorize(format_key, use_na_sentinel=False)
+        n_formats = max(len(formats), 1)
+        groups = max(len(players) * n_formats, 1)
+
+        workers = max(1, min(self.workers, rows))
+        bounds = np.linspace(0, rows, workers + 1).astype(np.int64)
+
+        with span("parallel.frame", rows=rows):
+            data_block = shared_memory.SharedMemory(
+                create=True, size=max(len(_SHARED_COLUMNS) * rows * 8, 1)
+            )
+            result_block = shared_memory.SharedMemory(
+                create=True, size=workers * len(_RESULT_ROWS) * groups * 8
+            )
+            try:
+                data = np.ndarray((len(_SHARED_COLUMNS), rows), dtype=np.float64, buffer=data_block.buf)
+                data[0] = player_codes * n_formats + format_codes
+                for row, column in enumerate(_SHARED_COLUMNS[1:], start=1):
+                    data[row] = work[column].to_numpy(dtype=np.float64)
+                result = np.ndarray((workers, len(_RESULT_ROWS), groups), dtype=np.float64,
+                                    buffer=result_block.buf)
+
+                if workers == 1:
+                    _partition_sums(data, result[0])
+                else:
+                    with ProcessPoolExecutor(max_workers=workers) as pool:
+                        list(pool.map(
+                            _shared_partition_sums,
+                            [data_block.name] * workers, [rows] * workers,
+                            [result_block.name] * workers, [groups] * workers,
+                            range(workers), bounds[:-1], bounds[1:]
+                        ))
+
+                totals = result[:, :7].sum(axis=0)
+                highest = result[:, 7].max(axis=0)
+                sums = self._sums_frame(totals, highest, players, formats)
+                del data, result
+            finally:
+                data_block.close()
+                data_block.unlink()
+                result_block.close()
+                result_block.unlink()
+
+        self._record(start, workers, workers, rows, rows)
+        return sums
+
+    @staticmethod
+    def _sums_frame(totals: np.ndarray, highest: np.ndarray, players, formats) -> pd.DataFrame:
+        """Turn per-group arrays back into the grouped_sums layout."""
+        played = np.flatnonzero(totals[6] > 0)
+        n_formats = max(len(formats), 1)
+        index = pd.MultiIndex.from_arrays(
+            [np.asarray(players, dtype=object)[played // n_formats],
+             np.asarray(formats, dtype=object)[played % n_formats]],
+            names=['player_name', 'format']
+        )
+        sums = pd.DataFrame(
+            {name: totals[row, played] for row, name in enumerate(_RESULT_ROWS[:7])},
+            index=index
+        )
+        sums['highest_score'] = highest[played]
+        return sums
+
+    def _record(self, start: float, workers: int, partitions: int, rows: int, kept: int):
+        seconds = time.perf_counter() - start
+        self.stats = {
+            "workers": workers,
+            "partitions": partitions,
+            "rows": rows,
+            "rows_kept": kept,
+            "seconds": round(seconds, 3),
+            "rows_per_sec": round(rows / seconds) if seconds > 0 else 0,
+        }
+        logger.info("Aggregated %d rows in %.2fs (%d rows/s)", rows, seconds, self.stats["rows_per_sec"])
+
+    def league_from_csv(self, path: str) -> LeagueTable:
+        """
+        League table for every player in a CSV file.
+
+        Args:
+            path: CSV in the cricket_data.csv schema
+
+        Returns:
+            LeagueTable with the same metrics as MetricsCalculator
+        """
+        return LeagueTable.from_sums(self.csv_sums(path))
+
+    def league_from_frame(self, df: pd.DataFrame) -> LeagueTable:
+        """
+        League table for every player in a cleaned frame.
+
+        Args:
+            df: Cleaned matches in the cricket_data.csv schema
+
+        Returns:
+            LeagueTable with the same metrics as MetricsCalculator
+        """
+        return LeagueTable.from_sums(self.frame_sums(df))
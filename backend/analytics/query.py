@@ -0,0 +1,411 @@
+"""
+QUERY MODULE
+============
+Lazy, composable queries over every data source the analytics layer uses.
+
+    Query(source).player('virat kohli').format('odi').since('2023-01-01').metrics()
+
+Builder calls only record the query; nothing is read until a terminal
+call (metrics, sums, to_frame). The plan is then optimised once:
+- Predicates are pushed into the read: a WHERE clause served by an index
+  for SQLite, a dictionary lookup for a service's per-player partitions,
+  a per-chunk filter while streaming a CSV, one combined mask for a frame
+- Only the columns the terminal call needs are read or copied
+- Metrics are computed from sums in the same pass; with SQLite the rows
+  never leave the database
+
+explain() shows the chosen access path, the pushed-down predicates and
+the columns read, without executing anything.
+
+Sources:
+- CSV path: streamed in chunks; rows failing the predicates are dropped
+  before cleaning. Whole rows are parsed, because clean_data removes
+  duplicates by comparing entire rows
+- DataFrame: cleaned matches in the cricket_data.csv schema
+- AnalyticsService: uses its per-player frames when a player is given
+- SQLiteDataLoader: compiled into a single SQL statement
+
+Date bounds compare as dates on frames and CSV files, and as ISO
+'YYYY-MM-DD' text in SQLite (the format the dataset uses).
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .compare import sum_inputs
+from .data_loader import DataLoader
+from .instrumentation import span
+from .metrics import metrics_from_sums
+from .sqlite_store import COLUMNS as SQL_COLUMNS, SQLiteDataLoader
+
+logger = logging.getLogger(__name__)
+
+# Columns metrics() and sums() read; the rest are never copied
+METRIC_COLUMNS = ['runs', 'balls_faced', 'dismissal', 'centuries', 'half_centuries']
+
+# Rows per chunk when streaming a CSV source
+DEFAULT_CHUNKSIZE = 200_000
+
+# Builder predicate -> column it filters
+_PREDICATE_COLUMNS = {
+    'player': 'player_name',
+    'format': 'format',
+    'since': 'match_date',
+    'until': 'match_date',
+}
+
+
+def _and(mask: Optional[pd.Series], condition: pd.Series) -> pd.Series:
+    return condition if mask is None else mask & condition
+
+
+def _date_bound(value) -> str:
+    """Normalise a date bound to 'YYYY-MM-DD' (raises ValueError if unparseable)."""
+    try:
+        return pd.Timestamp(value).strftime('%Y-%m-%d')
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid date: {value!r}")
+
+
+class Query:
+    """Lazy query over matches, optimised and executed in one pass."""
+
+    def __init__(self, source, chunksize: int = DEFAULT_CHUNKSIZE):
+        """
+        Start a query over a data source.
+
+        Args:
+            source: CSV path, cleaned DataFrame, AnalyticsService or
+                    SQLiteDataLoader
+            chunksize: Rows per chunk when streaming a CSV
+
+        Raises:
+            TypeError: If the source type is not supported
+        """
+        if isinstance(source, (str, Path)):
+            self._kind = 'csv'
+        elif isinstance(source, SQLiteDataLoader):
+            self._kind = 'sqlite'
+        elif isinstance(source, pd.DataFrame):
+            self._kind = 'frame'
+        elif isinstance(getattr(source, 'players', None), dict) and hasattr(source, 'data'):
+            self._kind = 'service'
+        else:
+            raise TypeError(f"Unsupported query source: {type(source).__name__}")
+        self.source = source
+        self.chunksize = chunksize
+        self._predicates: Dict[str, str] = {}
+        self._columns: Optional[List[str]] = None
+
+    def _with(self, **changes) -> "Query":
+        """A copy with updated predicates or columns; queries are immutable."""
+        query = object.__new__(Query)
+        query.__dict__.update(self.__dict__)
+        query._predicates = dict(self._predicates)
+        for key, value in changes.items():
+            if key == 'columns':
+                query._columns = value
+            else:
+                query._predicates[key] = value
+        return query
+
+    # ------------------------------------------------------------------
+    # Builder
+    # ------------------------------------------------------------------
+
+    def player(self, player_name: str) -> "Query":
+        """
+        Restrict to one player (case-insensitive).
+
+        Args:
+            player_name: Name of player
+
+        Returns:
+            New Query with the predicate added
+        """
+        return self._with(player=player_name.lower().strip())
+
+    def format(self, format_type: str) -> "Query":
+        """
+        Restrict to one format (case-insensitive).
+
+        Args:
+            format_type: Cricket format ('odi', 'test', 't20i')
+
+        Returns:
+            New Query with the predicate added
+        """
+        return self._with(format=format_type.lower())
+
+    def since(self, date) -> "Query":
+        """
+        Keep matches on or after a date.
+
+        Args:
+            date: Anything pandas.Timestamp accepts, e.g. '2023-01-01'
+
+        Returns:
+            New Query with the predicate added
+
+        Raises:
+            ValueError: If the date cannot be parsed
+        """
+        return self._with(since=_date_bound(date))
+
+    def until(self, date) -> "Query":
+        """
+        Keep matches on or before a date.
+
+        Args:
+            date: Anything pandas.Timestamp accepts, e.g. '2024-12-31'
+
+        Returns:
+            New Query with the predicate added
+
+        Raises:
+            ValueError: If the date cannot be parsed
+        """
+        return self._with(until=_date_bound(date))
+
+    def select(self, *columns: str) -> "Query":
+        """
+        Choose the columns to_frame returns (default: all).
+
+        Args:
+            columns: Column names in the cricket_data.csv schema
+
+        Returns:
+            New Query reading only those columns
+        """
+        return self._with(columns=list(columns))
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+
+    def _available_columns(self) -> List[str]:
+        if self._kind == 'csv':
+            return list(pd.read_csv(self.source, nrows=0).columns)
+        if self._kind == 'sqlite':
+            return list(SQL_COLUMNS)
+        if self._kind == 'service':
+            return list(self.source.data.columns)
+        return list(self.source.columns)
+
+    def _plan(self, output: str) -> Dict:
+        """
+        Decide columns and access path for a terminal call.
+
+        Args:
+            output: 'rows' (to_frame) or 'sums' (sums, metrics)
+
+        Returns:
+            Dictionary describing the plan; explain() prints it and the
+            executors follow it
+
+        Raises:
+            ValueError: If a predicate or selected column is not in the source
+        """
+        available = self._available_columns()
+        for name in self._predicates:
+            column = _PREDICATE_COLUMNS[name]
+            if column not in available:
+                raise ValueError(f"Cannot filter on '{column}': not a column of the source")
+
+        if output == 'sums':
+            columns = [col for col in METRIC_COLUMNS if col in available]
+        else:
+            columns = self._columns or available
+            unknown = [col for col in columns if col not in available]
+            if unknown:
+                raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+
+        plan = {
+            'output': output,
+            'columns': columns,
+            'predicates': dict(self._predicates),
+        }
+
+        if self._kind == 'sqlite':
+            plan['access'] = 'sql'
+            plan['detail'] = self.source.query_plan(
+                self._predicates.get('player'), self._predicates.get('format'),
+                self._predicates.get('since'), self._predicates.get('until')
+            )
+        elif self._kind == 'service' and 'player' in self._predicates:
+            partition = self.source.players.get(self._predicates['player'])
+            plan['access'] = 'partition'
+            plan['detail'] = [f"player partition ({0 if partition is None else len(partition)} rows)"]
+        elif self._kind == 'csv':
+            plan['access'] = 'csv'
+            plan['detail'] = [
+                f"streaming scan of {self.source} in {self.chunksize:,}-row chunks",
+                "predicates applied to each chunk before cleaning",
+                "whole rows parsed (duplicate removal compares entire rows)",
+            ]
+        else:
+            frame = self.source.data if self._kind == 'service' else self.source
+            plan['access'] = 'scan'
+            plan['detail'] = [f"scan of {len(frame):,} rows with one combined mask"]
+        return plan
+
+    def explain(self, output: str = 'sums') -> str:
+        """
+        Describe how the query would run, without running it.
+
+        Args:
+            output: 'sums' (for sums and metrics) or 'rows' (for to_frame)
+
+        Returns:
+            Multi-line plan: access path, pushed-down predicates, columns
+        """
+        plan = self._plan(output)
+        predicates = [
+            f"{_PREDICATE_COLUMNS[name]} {'>=' if name == 'since' else '<=' if name == 'until' else '='} "
+            f"'{value}'"
+            for name, value in plan['predicates'].items()
+        ]
+        if plan['access'] == 'sql':
+            compute = "aggregates in SQL (no rows fetched)" if output == 'sums' else "rows fetched by SQL"
+        elif output == 'sums':
+            compute = "sums of matching rows in one pass, then metrics_from_sums"
+        else:
+            compute = "matching rows, selected columns only"
+
+        lines = [
+            f"Query plan ({output})",
+            f"  source:     {self._kind}",
+            f"  access:     {plan['detail'][0]}",
+        ]
+        lines += [f"              {line}" for line in plan['detail'][1:]]
+        lines += [
+            f"  predicates: {' AND '.join(predicates) if predicates else 'none'}",
+            f"  columns:    {', '.join(plan['columns'])}",
+            f"  compute:    {compute}",
+        ]
+        return "\n".join(lines)
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def _mask(self, df: pd.DataFrame, raw: bool = False) -> Optional[pd.Series]:
+        """
+        All predicates as one boolean mask (None when there are none).
+
+        Args:
+            df: Frame to test
+            raw: Rows come straight from the CSV, so names are not yet
+                 standardized the way clean_data does it
+        """
+        predicates = self._predicates
+        mask = None
+        if 'player' in predicates:
+            names = df['player_name']
+            if raw:
+                names = names.str.lower().str.strip()
+            mask = _and(mask, names == predicates['player'])
+        if 'format' in predicates:
+            mask = _and(mask, df['format'].str.lower() == predicates['format'])
+        if 'since' in predicates or 'until' in predicates:
+            dates = pd.to_datetime(df['match_date'], errors='coerce')
+            if 'since' in predicates:
+                mask = _and(mask, dates >= pd.Timestamp(predicates['since']))
+            if 'until' in predicates:
+                mask = _and(mask, dates <= pd.Timestamp(predicates['until']))
+        return mask
+
+    def _filter(self, df: pd.DataFrame, columns: List[str], raw: bool = False) -> pd.DataFrame:
+        """Matching rows of the needed columns, copied once."""
+        mask = self._mask(df, raw)
+        return df[columns] if mask is None else df.loc[mask, columns]
+
+    def _scan_csv(self, columns: List[str]) -> pd.DataFrame:
+        """Stream the CSV, keep matching rows, clean them, project columns."""
+        if not Path(self.source).exists():
+            raise FileNotFoundError(f"Data file not found: {self.source}")
+
+        matched = []
+        # Strings throughout, so a row parses the same whatever chunk it is in
+        for chunk in pd.read_csv(self.source, chunksize=self.chunksize, dtype=str):
+            mask = self._mask(chunk, raw=True)
+            matched.append(chunk if mask is None else chunk[mask])
+        rows = pd.concat(matched) if matched else pd.read_csv(self.source, nrows=0, dtype=str)
+        return DataLoader(self.source).clean_data(rows)[columns]
+
+    def _rows(self, plan: Dict) -> pd.DataFrame:
+        columns = plan['columns']
+        access = plan['access']
+        if access == 'sql':
+            predicates = plan['predicates']
+            return self.source.query(
+                predicates.get('player'), predicates.get('format'),
+                predicates.get('since'), predicates.get('until'), columns=columns
+            )
+        if access == 'csv':
+            return self._scan_csv(columns)
+        if access == 'partition':
+            partition = self.source.players.get(plan['predicates']['player'])
+            if partition is None:
+                return self.source.data.iloc[:0][columns]
+            return self._filter(partition, columns)
+        frame = self.source.data if self._kind == 'service' else self.source
+        return self._filter(frame, columns)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Execute the query and return the matching rows.
+
+        Returns:
+            DataFrame with the selected columns (all by default)
+        """
+        plan = self._plan('rows')
+        with span("query.execute") as s:
+            rows = self._rows(plan)
+            s.rows = len(rows)
+        logger.debug("Query returned %d rows via %s", len(rows), plan['access'])
+        return rows
+
+    def sums(self) -> Dict[str, float]:
+        """
+        Execute the query and aggregate the matching rows.
+
+        Returns:
+            Dictionary of sums accepted by metrics_from_sums
+        """
+        plan = self._plan('sums')
+        with span("query.execute") as s:
+            if plan['access'] == 'sql':
+                predicates = plan['predicates']
+                sums = self.source.aggregates(
+                    predicates.get('player'), predicates.get('format'),
+                    predicates.get('since'), predicates.get('until')
+                )
+            else:
+                rows = self._rows(plan)
+                work, _ = sum_inputs(rows)
+                sums = {
+                    'matches': len(rows),
+                    'runs': work['runs'].sum(),
+                    'balls': work['balls'].sum(),
+                    'dismissals': int(work['dismissals'].sum()),
+                    'runs_squared': work['runs_squared'].sum(),
+                    'centuries': work['centuries'].sum(),
+                    'half_centuries': work['half_centuries'].sum(),
+                    'highest_score': work['runs'].max() if len(rows) else 0,
+                }
+            s.rows = int(sums['matches'])
+        return sums
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Execute the query and calculate metrics over the matching rows.
+
+        Returns:
+            Same dictionary as MetricsCalculator.calculate_all_metrics on
+            the filtered rows; no matches gives zero metrics
+        """
+        return metrics_from_sums(self._predicates.get('player', ''), self.sums())
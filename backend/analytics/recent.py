@@ -0,0 +1,420 @@
+"""
+RECENT MODULE
+=============
+Keeps every player's most recent innings in memory for form views.
+
+Responsibilities:
+- One fixed-size, array-backed ring buffer per player, ordered by
+  match_date; appending the newest innings is O(1) and overwrites the
+  oldest once the buffer is full
+- Serve last-N innings (charts) and form metrics (recent average,
+  strike rate, consistency and run trend) without touching the full
+  dataset
+- Order a player frame's innings by date (latest innings, career
+  progression), so charts never depend on file order
+
+An innings older than the newest one kept is inserted in date order
+(at most ``capacity`` moves); one older than everything in a full
+buffer is ignored. Innings on the same date keep their arrival order.
+
+Pandas is only needed to build from or return DataFrames, so this
+module does not import it at load time.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+import numpy as np
+
+from .compare import PlayerNotFoundError
+from .instrumentation import span
+from .metrics import metrics_from_sums
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Innings kept per player
+CAPACITY = 20
+
+# Innings used by charts and form views unless asked otherwise
+DEFAULT_WINDOW = 10
+
+# Undated innings sort before every real date
+_NO_DATE = np.iinfo(np.int64).min // 2
+
+# Per-innings fields returned alongside runs and balls
+_DETAILS = ['format', 'opponent', 'dismissal', 'match_date']
+
+
+def _date_numbers(df: pd.DataFrame) -> np.ndarray:
+    """match_date as comparable day numbers (undated innings first)."""
+    import pandas as pd
+
+    if 'match_date' not in df.columns:
+        return np.full(len(df), _NO_DATE, dtype=np.int64)
+    dates = pd.to_datetime(df['match_date'], errors='coerce')
+    return np.where(dates.isna(), _NO_DATE, dates.to_numpy(dtype='datetime64[D]').astype(np.int64))
+
+
+def date_order(player_data: pd.DataFrame) -> np.ndarray:
+    """
+    Row positions of a player's innings by match_date, oldest first.
+
+    The sort is stable, so innings on the same date keep their order in
+    the frame; without a match_date column the frame order is used.
+
+    Args:
+        player_data: DataFrame with player's match data
+
+    Returns:
+        numpy array of positions (for ``iloc`` or numpy indexing)
+    """
+    if 'match_date' not in player_data.columns:
+        return np.arange(len(player_data))
+    return np.argsort(_date_numbers(player_data), kind='stable')
+
+
+def runs_by_date(player_data: pd.DataFrame) -> np.ndarray:
+    """
+    Runs of every innings in career order (by match_date, stable).
+
+    Args:
+        player_data: DataFrame with player's match data
+
+    Returns:
+        numpy array of runs
+    """
+    return player_data['runs'].to_numpy()[date_order(player_data)]
+
+
+def latest_runs(player_data: pd.DataFrame, n: int = DEFAULT_WINDOW) -> np.ndarray:
+    """
+    Runs of a player's ``n`` most recent innings by match_date, oldest first.
+
+    Only the runs and dates columns are read; the frame is not copied.
+    Without a match_date column the last ``n`` rows are used.
+
+    Args:
+        player_data: DataFrame with player's match data
+        n: Number of innings
+
+    Returns:
+        numpy array of runs
+    """
+    return runs_by_date(player_data)[-n:]
+
+
+def recent_form(runs: np.ndarray, balls: np.ndarray, dismissed: np.ndarray) -> Dict:
+    """
+    Form metrics over a window of innings (oldest first).
+
+    Average, strike rate and consistency use the same formulas as
+    MetricsCalculator; trend is the least-squares slope of runs per
+    innings across the window (positive means improving).
+
+    Args:
+        runs: Runs per innings
+        balls: Balls faced per innings
+        dismissed: Whether the batter was out in each innings
+
+    Returns:
+        Dictionary with innings, runs, average, strike_rate,
+        consistency_index, highest_score and trend
+    """
+    runs = np.asarray(runs, dtype=float)
+    if len(runs) == 0:
+        return {"innings": 0, "runs": 0, "average": 0.0, "strike_rate": 0.0,
+                "consistency_index": 0.0, "highest_score": 0, "trend": 0.0}
+
+    metrics = metrics_from_sums("", {
+        'matches': len(runs),
+        'runs': runs.sum(),
+        'balls': float(np.sum(balls)),
+        'dismissals': int(np.sum(dismissed)),
+        'runs_squared': float((runs ** 2).sum()),
+        'centuries': int((runs >= 100).sum()),
+        'half_centuries': int(((runs >= 50) & (runs < 100)).sum()),
+        'highest_score': runs.max(),
+    })
+    trend = float(np.polyfit(np.arange(len(runs)), runs, 1)[0]) if len(runs) >= 2 else 0.0
+    return {
+        "innings": metrics['matches_played'],
+        "runs": metrics['total_runs'],
+        "average": metrics['batting_average'],
+        "strike_rate": metrics['strike_rate'],
+        "consistency_index": metrics['consistency_index'],
+        "highest_score": metrics['highest_score'],
+        "trend": round(trend, 2),
+    }
+
+
+class InningsRing:
+    """Fixed-size ring buffer of one player's innings, ordered by date."""
+
+    __slots__ = ('dates', 'runs', 'balls', 'dismissed', 'details', 'start', 'size')
+
+    def __init__(self, capacity: int = CAPACITY):
+        """
+        Allocate an empty buffer.
+
+        Args:
+            capacity: Innings kept
+        """
+        self.dates = np.zeros(capacity, dtype=np.int64)
+        self.runs = np.zeros(capacity, dtype=np.int64)
+        self.balls = np.zeros(capacity, dtype=np.int64)
+        self.dismissed = np.zeros(capacity, dtype=bool)
+        self.details = np.empty(capacity, dtype=object)
+        self.start = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _slot(self, position: int) -> int:
+        """Array index of the innings at ``position`` (0 = oldest)."""
+        return (self.start + position) % len(self.runs)
+
+    def _write(self, slot: int, date: int, runs: int, balls: int, dismissed: bool, details: tuple):
+        self.dates[slot] = date
+        self.runs[slot] = runs
+        self.balls[slot] = balls
+        self.dismissed[slot] = dismissed
+        self.details[slot] = details
+
+    def push(self, date: int, runs: int, balls: int, dismissed: bool, details: tuple) -> bool:
+        """
+        Add one innings in date order.
+
+        Args:
+            date: Day number of the match
+            runs: Runs scored
+            balls: Balls faced
+            dismissed: Whether the batter was out
+            details: (format, opponent, dismissal, match_date)
+
+        Returns:
+            False if the buffer is full and the innings is older than all of it
+        """
+        capacity = len(self.runs)
+        newest = self.dates[self._slot(self.size - 1)] if self.size else None
+
+        if newest is None or date >= newest:
+            # The common case: the newest innings goes at the end, O(1)
+            if self.size == capacity:
+                self.start = (self.start + 1) % capacity
+                self.size -= 1
+            self._write(self._slot(self.size), date, runs, balls, dismissed, details)
+            self.size += 1
+            return True
+
+        # Late arrival: after the last innings on or before its date
+        position = self.size
+        while position > 0 and self.dates[self._slot(position - 1)] > date:
+            position -= 1
+        if self.size == capacity:
+            if position == 0:
+                return False
+            self.start = (self.start + 1) % capacity
+            self.size -= 1
+            position -= 1
+        for moved in range(self.size, position, -1):
+            to, source = self._slot(moved), self._slot(moved - 1)
+            self._write(to, self.dates[source], self.runs[source], self.balls[source],
+                        self.dismissed[source], self.details[source])
+        self._write(self._slot(position), date, runs, balls, dismissed, details)
+        self.size += 1
+        return True
+
+    def last(self, n: int = DEFAULT_WINDOW) -> np.ndarray:
+        """
+        Array indices of the ``n`` most recent innings, oldest first.
+
+        Args:
+            n: Number of innings
+
+        Returns:
+            numpy array of indices into the buffer arrays
+        """
+        n = min(n, self.size)
+        return (self.start + np.arange(self.size - n, self.size)) % len(self.runs)
+
+
+class RecentInningsStore:
+    """Ring buffers of recent innings for every player."""
+
+    def __init__(self, capacity: int = CAPACITY):
+        """
+        Create an empty store (use ``from_frame`` to build one from data).
+
+        Args:
+            capacity: Innings kept per player
+        """
+        self.capacity = capacity
+        self.rings: Dict[str, InningsRing] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, capacity: int = CAPACITY) -> "RecentInningsStore":
+        """
+        Build every player's buffer from cleaned matches.
+
+        Only each player's latest ``capacity`` innings by date are kept.
+
+        Args:
+            df: Cleaned matches in the cricket_data.csv schema
+            capacity: Innings kept per player
+
+        Returns:
+            RecentInningsStore for every player in ``df``
+        """
+        import pandas as pd
+
+        store = cls(capacity)
+        with span("recent.build", rows=len(df)):
+            columns = store._columns(df)
+            # Player, then date; equal dates keep their order in the data
+            order = np.lexsort((columns['date'], pd.factorize(columns['player_name'])[0]))
+            names = columns['player_name'][order]
+            boundaries = np.flatnonzero(names[1:] != names[:-1]) + 1
+            starts = np.concatenate([[0], boundaries]) if len(order) else np.array([], dtype=int)
+            ends = np.concatenate([boundaries, [len(order)]]) if len(order) else starts
+
+            for first, end in zip(starts, ends):
+                rows = order[max(first, end - capacity):end]
+                ring = InningsRing(capacity)
+                count = len(rows)
+                ring.dates[:count] = columns['date'][rows]
+                ring.runs[:count] = columns['runs'][rows]
+                ring.balls[:count] = columns['balls_faced'][rows]
+                ring.dismissed[:count] = columns['dismissed'][rows]
+                ring.details[:count] = [
+                    tuple(columns[field][row] for field in _DETAILS) for row in rows
+                ]
+                ring.size = count
+                store.rings[names[first]] = ring
+        return store
+
+    @staticmethod
+    def _columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Numpy columns the buffers hold, with JSON-friendly details."""
+        n = len(df)
+
+        def details(column: str) -> np.ndarray:
+            if column not in df.columns:
+                return np.full(n, None, dtype=object)
+            values = df[column].to_numpy(dtype=object)
+            return np.where(df[column].isna().to_numpy(), None, values)
+
+        dismissal = details('dismissal')
+        return {
+            'player_name': df['player_name'].to_numpy(dtype=object),
+            'date': _date_numbers(df),
+            'runs': df['runs'].to_numpy(dtype=np.int64),
+            'balls_faced': df['balls_faced'].to_numpy(dtype=np.int64),
+            'dismissed': dismissal != 'not out',
+            'format': np.array(
+                [f.lower() if isinstance(f, str) else f for f in details('format')], dtype=object
+            ),
+            'opponent': details('opponent'),
+            'dismissal': dismissal,
+            'match_date': details('match_date'),
+        }
+
+    def add(self, df: pd.DataFrame):
+        """
+        Add newly ingested innings, O(1) each when they are the newest.
+
+        Args:
+            df: Cleaned new matches in the cricket_data.csv schema
+        """
+        if len(df) == 0:
+            return
+        with span("recent.update", rows=len(df)):
+            columns = self._columns(df)
+            with self._lock:
+                for row in range(len(df)):
+                    name = columns['player_name'][row]
+                    ring = self.rings.get(name)
+                    if ring is None:
+                        ring = self.rings[name] = InningsRing(self.capacity)
+                    ring.push(
+                        int(columns['date'][row]), int(columns['runs'][row]),
+                        int(columns['balls_faced'][row]), bool(columns['dismissed'][row]),
+                        tuple(columns[field][row] for field in _DETAILS)
+                    )
+
+    def __contains__(self, player_name: str) -> bool:
+        return player_name in self.rings
+
+    def _ring(self, player_name: str) -> InningsRing:
+        ring = self.rings.get(player_name)
+        if ring is None:
+            raise PlayerNotFoundError(f"Player '{player_name}' not found")
+        return ring
+
+    def innings(self, player_name: str, n: int = DEFAULT_WINDOW) -> List[Dict]:
+        """
+        A player's ``n`` most recent innings, oldest first.
+
+        Args:
+            player_name: Standardized player name
+            n: Number of innings (at most the store capacity)
+
+        Returns:
+            List of dictionaries with runs, balls_faced, format, opponent,
+            dismissal and match_date
+
+        Raises:
+            ValueError: If the player has no innings in the store
+        """
+        with self._lock:
+            ring = self._ring(player_name)
+            return [
+                {
+                    "runs": int(ring.runs[i]),
+                    "balls_faced": int(ring.balls[i]),
+                    **dict(zip(_DETAILS, ring.details[i])),
+                }
+                for i in ring.last(n)
+            ]
+
+    def form(self, player_name: str, n: int = DEFAULT_WINDOW) -> Dict:
+        """
+        Form metrics over a player's ``n`` most recent innings.
+
+        Args:
+            player_name: Standardized player name
+            n: Window size
+
+        Returns:
+            recent_form result
+
+        Raises:
+            ValueError: If the player has no innings in the store
+        """
+        with self._lock:
+            ring = self._ring(player_name)
+            window = ring.last(n)
+            return recent_form(ring.runs[window], ring.balls[window], ring.dismissed[window])
+
+    def frame(self, player_name: str, n: int = DEFAULT_WINDOW) -> pd.DataFrame:
+        """
+        A player's ``n`` most recent innings as a small DataFrame (for charts).
+
+        Args:
+            player_name: Standardized player name
+            n: Number of innings
+
+        Returns:
+            DataFrame in the cricket_data.csv column names, oldest first
+        """
+        import pandas as pd
+
+        rows = self.innings(player_name, n)
+        frame = pd.DataFrame(rows, columns=['runs', 'balls_faced'] + _DETAILS)
+        frame.insert(0, 'player_name', player_name)
+        return frame
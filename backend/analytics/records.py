@@ -0,0 +1,378 @@
+"""
+RECORDS MODULE
+==============
+Maintains the league's record lists per format and overall.
+
+Records:
+- highest_score: most runs in an innings
+- most_sixes / most_fours: most sixes or fours in an innings
+- best_strike_rate: best innings strike rate with at least MIN_BALLS balls
+- most_centuries: most career centuries (same count as MetricsCalculator)
+
+Innings records are bounded min-heaps of the top k: one vectorized pass
+builds them, and each newly ingested innings costs O(log k) per list
+(heapreplace), so serving records never scans the dataset. Century
+counts only grow, so the top-k list is a small sorted list updated with
+bisect; players outside it are tracked in a dict of counts.
+
+Ties rank the earlier match first, then the innings seen first. Innings
+with a missing runs, balls, fours, sixes or centuries value are skipped.
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import itertools
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .instrumentation import span
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+FORMATS = ['odi', 'test', 't20i']
+
+# Key of the all-formats lists
+OVERALL = 'overall'
+
+INNINGS_RECORDS = ['highest_score', 'most_sixes', 'most_fours', 'best_strike_rate']
+RECORDS = INNINGS_RECORDS + ['most_centuries']
+
+# Entries kept per list
+DEFAULT_K = 10
+
+# Balls an innings needs to qualify for best_strike_rate
+MIN_BALLS = 30
+
+# Sorts after every real date, so undated innings lose ties
+_NO_DATE = np.iinfo(np.int64).max // 2
+
+_INNINGS_FIELDS = ['player_name', 'runs', 'balls_faced', 'fours', 'sixes', 'format',
+                   'opponent', 'match_date']
+
+# Numeric columns an innings needs to be ranked
+_NUMERIC_FIELDS = ['runs', 'balls_faced', 'fours', 'sixes', 'centuries']
+
+
+def _record_values(record: str, runs, balls, fours, sixes):
+    """Value ranked by an innings record (arrays or scalars)."""
+    if record == 'highest_score':
+        return runs
+    if record == 'most_sixes':
+        return sixes
+    if record == 'most_fours':
+        return fours
+    return runs / balls * 100
+
+
+def _valid_rows(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """Rows with every numeric field present (NaN cannot be ranked)."""
+    return np.all([~np.isnan(columns[field]) for field in _NUMERIC_FIELDS], axis=0)
+
+
+class RecordsIndex:
+    """Top-k record lists per format and overall, updated incrementally."""
+
+    def __init__(self, k: int = DEFAULT_K, min_balls: int = MIN_BALLS):
+        """
+        Create an empty index (use ``from_frame`` to build one from data).
+
+        Args:
+            k: Entries kept per record list
+            min_balls: Balls needed for the strike-rate record
+        """
+        self.k = k
+        self.min_balls = min_balls
+        # (record, format) -> min-heap of (value, -date, -sequence, entry)
+        self._heaps: Dict[Tuple[str, str], List[tuple]] = {
+            (record, format_type): []
+            for record in INNINGS_RECORDS for format_type in FORMATS + [OVERALL]
+        }
+        # format -> player -> (career centuries, date the tally was reached)
+        self._centuries: Dict[str, Dict[str, Tuple[int, int]]] = {f: {} for f in FORMATS + [OVERALL]}
+        # format -> ascending list of (centuries, -date reached, player)
+        self._century_top: Dict[str, List[tuple]] = {f: [] for f in FORMATS + [OVERALL]}
+        self._sequence = itertools.count()
+        self.innings = 0
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, k: int = DEFAULT_K, min_balls: int = MIN_BALLS) -> "RecordsIndex":
+        """
+        Build the index in one vectorized pass over cleaned matches.
+
+        Args:
+            df: Cleaned matches in the cricket_data.csv schema
+            k: Entries kept per record list
+            min_balls: Balls needed for the strike-rate record
+
+        Returns:
+            RecordsIndex holding every record list
+        """
+        index = cls(k, min_balls)
+        with span("records.build", rows=len(df)):
+            columns = index._columns(df)
+            formats = columns['format']
+            valid = _valid_rows(columns)
+            sequence = np.arange(len(df), dtype=np.int64)
+            index._sequence = itertools.count(len(df))
+
+            for format_type in FORMATS + [OVERALL]:
+                in_format = valid if format_type == OVERALL else valid & (formats == format_type)
+                for record in INNINGS_RECORDS:
+                    mask = in_format
+                    if record == 'best_strike_rate':
+                        mask = mask & (columns['balls_faced'] >= min_balls)
+                    rows = np.flatnonzero(mask)
+                    values = _record_values(
+                        record, columns['runs'][rows], columns['balls_faced'][rows],
+                        columns['fours'][rows], columns['sixes'][rows]
+                    ).astype(float)
+                    top = rows[index._top_k(values, columns['date'][rows], sequence[rows])]
+                    heap = [index._heap_item(record, columns, row) for row in top]
+                    heapq.heapify(heap)
+                    index._heaps[(record, format_type)] = heap
+
+                index._build_centuries(format_type, columns, in_format)
+
+            index.innings = int(valid.sum())
+        return index
+
+    def copy(self) -> "RecordsIndex":
+        """
+        Independent copy to update while this index keeps serving.
+
+        Returns:
+            RecordsIndex with its own lists (innings entries are shared,
+            they are never modified)
+        """
+        other = RecordsIndex(self.k, self.min_balls)
+        other._heaps = {key: list(heap) for key, heap in self._heaps.items()}
+        other._centuries = {key: dict(counts) for key, counts in self._centuries.items()}
+        other._century_top = {key: list(top) for key, top in self._century_top.items()}
+        # Shared, so innings added to either copy still rank in arrival order
+        other._sequence = self._sequence
+        other.innings = self.innings
+        return other
+
+    def _top_k(self, values: np.ndarray, dates: np.ndarray, sequence: np.ndarray) -> np.ndarray:
+        """Positions of the k best rows: highest value, then earliest date, then first seen."""
+        if len(values) > self.k:
+            # Only rows tied with or above the k-th value can make the list
+            cutoff = np.partition(values, len(values) - self.k)[len(values) - self.k]
+            candidates = np.flatnonzero(values >= cutoff)
+        else:
+            candidates = np.arange(len(values))
+        order = np.lexsort((sequence[candidates], dates[candidates], -values[candidates]))
+        return candidates[order[:self.k]]
+
+    def _build_centuries(self, format_type: str, columns: Dict[str, np.ndarray], mask: np.ndarray):
+        """Career century counts for one format and their top-k list."""
+        import pandas as pd
+
+        hundreds = mask & (columns['centuries'] > 0)
+        if not hundreds.any():
+            return
+        frame = pd.DataFrame({
+            'player_name': columns['player_name'][hundreds],
+            'centuries': columns['centuries'][hundreds],
+            'date': columns['date'][hundreds],
+        })
+        # Date each player's current tally was first reached breaks ties
+        grouped = frame.groupby('player_name', sort=False)
+        counts = grouped['centuries'].sum().astype(int)
+        reached = grouped['date'].max()
+        self._centuries[format_type] = {
+            name: (int(count), int(reached[name])) for name, count in counts.items()
+        }
+
+        best = sorted(
+            ((count, -date, name) for name, (count, date) in self._centuries[format_type].items()),
+            reverse=True
+        )[:self.k]
+        self._century_top[format_type] = sorted(best)
+
+    @staticmethod
+    def _columns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Numpy columns the records read, with the same fallbacks as the metrics."""
+        import pandas as pd
+
+        n = len(df)
+        runs = df['runs'].to_numpy(dtype=float)
+        dates = pd.to_datetime(df['match_date'], errors='coerce') if 'match_date' in df.columns else None
+        return {
+            'player_name': df['player_name'].to_numpy(dtype=object),
+            'runs': runs,
+            'balls_faced': df['balls_faced'].to_numpy(dtype=float),
+            'fours': df['fours'].to_numpy(dtype=float) if 'fours' in df.columns else np.zeros(n),
+            'sixes': df['sixes'].to_numpy(dtype=float) if 'sixes' in df.columns else np.zeros(n),
+            'centuries': (
+                df['centuries'].to_numpy(dtype=float) if 'centuries' in df.columns
+                else (runs >= 100).astype(float)
+            ),
+            'format': (
+                df['format'].str.lower().to_numpy(dtype=object) if 'format' in df.columns
+                else np.full(n, None, dtype=object)
+            ),
+            'opponent': df['opponent'].to_numpy(dtype=object) if 'opponent' in df.columns else np.full(n, None),
+            'match_date': df['match_date'].to_numpy(dtype=object) if 'match_date' in df.columns else np.full(n, None),
+            'date': (
+                np.where(dates.isna(), _NO_DATE, dates.to_numpy(dtype='datetime64[D]').astype(np.int64))
+                if dates is not None else np.full(n, _NO_DATE, dtype=np.int64)
+            ),
+        }
+
+    def _heap_item(self, record: str, columns: Dict[str, np.ndarray], row: int) -> tuple:
+        """Heap tuple for one innings: larger tuples are better records."""
+        entry = {field: _plain(columns[field][row]) for field in _INNINGS_FIELDS}
+        value = float(_record_values(
+            record, columns['runs'][row], columns['balls_faced'][row],
+            columns['fours'][row], columns['sixes'][row]
+        ))
+        return (value, -int(columns['date'][row]), -row, entry)
+
+    def add(self, df: pd.DataFrame):
+        """
+        Add newly ingested innings, O(log k) per record list they reach.
+
+        Args:
+            df: Cleaned new matches in the cricket_data.csv schema
+        """
+        if len(df) == 0:
+            return
+        with span("records.update", rows=len(df)):
+            columns = self._columns(df)
+            rows = np.flatnonzero(_valid_rows(columns))
+            for row in rows:
+                sequence = next(self._sequence)
+                format_type = columns['format'][row]
+                targets = [OVERALL] + ([format_type] if format_type in FORMATS else [])
+
+                for record in INNINGS_RECORDS:
+                    if record == 'best_strike_rate' and not columns['balls_faced'][row] >= self.min_balls:
+                        continue
+                    value, date, _, entry = self._heap_item(record, columns, row)
+                    item = (value, date, -sequence, entry)
+                    for target in targets:
+                        heap = self._heaps[(record, target)]
+                        if len(heap) < self.k:
+                            heapq.heappush(heap, item)
+                        elif item[:3] > heap[0][:3]:
+                            heapq.heapreplace(heap, item)
+
+                hundreds = int(columns['centuries'][row])
+                if hundreds > 0:
+                    for target in targets:
+                        self._add_centuries(target, columns['player_name'][row], hundreds,
+                                            int(columns['date'][row]))
+            self.innings += len(rows)
+
+    def _add_centuries(self, format_type: str, player_name: str, hundreds: int, date: int):
+        """Raise one player's century count and keep the top-k list sorted."""
+        counts = self._centuries[format_type]
+        top = self._century_top[format_type]
+        old, reached = counts.get(player_name, (0, date))
+        reached = max(reached, date)
+        counts[player_name] = (old + hundreds, reached)
+
+        # Counts only grow, so a player outside the list can only enter it
+        for position, item in enumerate(top):
+            if item[2] == player_name:
+                del top[position]
+                break
+        item = (old + hundreds, -reached, player_name)
+        if len(top) < self.k:
+            bisect.insort(top, item)
+        elif item > top[0]:
+            bisect.insort(top, item)
+            del top[0]
+
+    def top(self, record: str, format_type: Optional[str] = None, limit: Optional[int] = None) -> List[Dict]:
+        """
+        One record list, best first.
+
+        Args:
+            record: One of RECORDS
+            format_type: odi, test or t20i (None or "overall" for all formats)
+            limit: Entries to return (at most k)
+
+        Returns:
+            List of entries, each with rank and value plus the innings
+            details (innings records) or the player's century count
+
+        Raises:
+            ValueError: If the record or format is unknown
+        """
+        if record not in RECORDS:
+            raise ValueError(f"Unknown record '{record}'. Available: {', '.join(RECORDS)}")
+        format_type = (format_type or OVERALL).lower()
+        if format_type not in FORMATS + [OVERALL]:
+            raise ValueError(f"Unknown format '{format_type}'. Available: {', '.join(FORMATS)}, {OVERALL}")
+        limit = self.k if limit is None else min(limit, self.k)
+
+        if record == 'most_centuries':
+            best = list(reversed(self._century_top[format_type]))[:limit]
+            return [
+                {"rank": rank, "player_name": name, "value": count}
+                for rank, (count, _, name) in enumerate(best, start=1)
+            ]
+
+        best = sorted(self._heaps[(record, format_type)], key=lambda item: item[:3], reverse=True)[:limit]
+        return [
+            {"rank": rank, "value": _value(record, value), **entry}
+            for rank, (value, _, _, entry) in enumerate(best, start=1)
+        ]
+
+    def records(self, format_type: Optional[str] = None, limit: Optional[int] = None) -> Dict:
+        """
+        Every record list for one format (or overall).
+
+        Args:
+            format_type: odi, test or t20i (None or "overall" for all formats)
+            limit: Entries per list (at most k)
+
+        Returns:
+            Dictionary with format, min_balls and record -> entries
+        """
+        return {
+            "format": (format_type or OVERALL).lower(),
+            "min_balls": self.min_balls,
+            "records": {record: self.top(record, format_type, limit) for record in RECORDS},
+        }
+
+
+def _plain(value):
+    """Numpy scalar or NaN -> JSON-friendly Python value."""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, (np.integer, np.floating)):
+        value = value.item()
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _value(record: str, value: float):
+    """Ranked value for output: strike rate to 1 decimal, counts as ints."""
+    return round(value, 1) if record == 'best_strike_rate' else int(value)
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    import json
+    import pandas as pd
+
+    print("=" * 60)
+    print("RECORDS MODULE - STANDALONE TEST")
+    print("=" * 60)
+
+    data = pd.read_csv("../data/cricket_data.csv")
+    data['player_name'] = data['player_name'].str.lower().str.strip()
+
+    index = RecordsIndex.from_frame(data, k=3)
+    print(json.dumps(index.records(), indent=2))
+
+    print("\n Records test passed!")
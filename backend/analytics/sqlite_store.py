@@ -0,0 +1,400 @@
+"""
+SQLITE STORAGE MODULE
+=====================
+Alternative DataLoader backend that keeps matches in an indexed SQLite
+database instead of one in-memory DataFrame.
+
+Responsibilities:
+- Ingest cleaned matches into SQLite (CSV in chunks, or a DataFrame)
+- Indexes on player, format, match_date and opponent
+- Push filter_by_player / get_format_data down into SQL
+- Push the MetricsCalculator aggregates (sum, count, max, dismissals)
+  down into SQL, so a metrics request only touches that player's rows
+- Optional match_date bounds and column lists, so analytics.query can
+  compile a whole query plan into one statement
+
+Ingest notes:
+- Formats are stored lowercase (format filters are case-insensitive anyway)
+- A unique index over every column rejects rows already stored, so
+  duplicates are removed across batches and chunk boundaries, as
+  clean_data does for the whole CSV. Missing values compare equal, like
+  in drop_duplicates; rows are compared after name and format
+  standardization
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from .data_loader import DataLoader
+from .metrics import format_metrics_from_sums, metrics_from_sums
+
+
+COLUMNS = [
+    'player_name', 'runs', 'balls_faced', 'format', 'dismissal', 'fours', 'sixes',
+    'centuries', 'half_centuries', 'opponent', 'match_date'
+]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS matches (
+    player_name TEXT NOT NULL,
+    runs INTEGER NOT NULL,
+    balls_faced INTEGER NOT NULL,
+    format TEXT,
+    dismissal TEXT,
+    fours INTEGER,
+    sixes INTEGER,
+    centuries INTEGER,
+    half_centuries INTEGER,
+    opponent TEXT,
+    match_date TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_matches_player_format ON matches (player_name, format);
+CREATE INDEX IF NOT EXISTS idx_matches_format ON matches (format);
+CREATE INDEX IF NOT EXISTS idx_matches_date ON matches (match_date);
+CREATE INDEX IF NOT EXISTS idx_matches_opponent ON matches (opponent);
+"""
+
+# One row per distinct match. NULLs are distinct in a plain UNIQUE index,
+# so nullable columns are indexed with a sentinel no stored value can equal
+_NULLABLE = ['format', 'dismissal', 'fours', 'sixes', 'centuries', 'half_centuries',
+             'opponent', 'match_date']
+_UNIQUE_INDEX = "idx_matches_unique"
+_UNIQUE = f"""
+CREATE UNIQUE INDEX IF NOT EXISTS {_UNIQUE_INDEX} ON matches ({', '.join(
+    f"IFNULL({col}, x'00')" if col in _NULLABLE else col for col in COLUMNS
+)})
+"""
+
+# Keeps the first copy of every match (GROUP BY treats NULLs as equal)
+_DEDUPLICATE = f"""
+DELETE FROM matches WHERE rowid NOT IN (
+    SELECT MIN(rowid) FROM matches GROUP BY {', '.join(COLUMNS)}
+)
+"""
+
+# Every aggregate behind MetricsCalculator, in one scan of the index range
+_AGGREGATES = """
+SELECT
+    COUNT(*),
+    COALESCE(SUM(runs), 0),
+    COALESCE(SUM(balls_faced), 0),
+    COALESCE(SUM(CASE WHEN dismissal IS NULL OR dismissal != 'not out' THEN 1 ELSE 0 END), 0),
+    COALESCE(SUM(runs * runs), 0),
+    COALESCE(SUM(centuries), 0),
+    COALESCE(SUM(half_centuries), 0),
+    COALESCE(MAX(runs), 0)
+FROM matches
+"""
+
+_SUM_KEYS = [
+    'matches', 'runs', 'balls', 'dismissals', 'runs_squared',
+    'centuries', 'half_centuries', 'highest_score'
+]
+
+
+class SQLiteDataLoader(DataLoader):
+    """DataLoader backed by an indexed SQLite database."""
+
+    def __init__(self, csv_path: str = "data/cricket_data.csv", db_path: str = ":memory:"):
+        """
+        Initialize loader and open (or create) the database.
+
+        Args:
+            csv_path: Path to cricket data CSV file (source for ingest_csv)
+            db_path: SQLite database file (":memory:" for a private in-memory DB)
+        """
+        super().__init__(csv_path)
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.executescript(_SCHEMA)
+        self._ensure_unique()
+
+    def _ensure_unique(self):
+        """Create the unique index, first removing duplicates from older databases."""
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (_UNIQUE_INDEX,)
+        ).fetchone()
+        if exists:
+            return
+        with self.conn:
+            self.conn.execute(_DEDUPLICATE)
+            self.conn.execute(_UNIQUE)
+
+    def ingest(self, df: pd.DataFrame, clean: bool = True) -> int:
+        """
+        Insert matches into the database.
+
+        Args:
+            df: Matches in the cricket_data.csv schema
+            clean: Run clean_data first (set False if already cleaned)
+
+        Returns:
+            Number of rows inserted (rows already stored are skipped)
+        """
+        if clean:
+            df = self.clean_data(df)
+
+        frame = pd.DataFrame(index=df.index)
+        for col in COLUMNS:
+            frame[col] = df[col] if col in df.columns else None
+
+        # Derive milestone counts the way MetricsCalculator falls back to
+        if 'centuries' not in df.columns:
+            frame['centuries'] = (df['runs'] >= 100).astype(int)
+        if 'half_centuries' not in df.columns:
+            frame['half_centuries'] = ((df['runs'] >= 50) & (df['runs'] < 100)).astype(int)
+        if 'format' in df.columns:
+            frame['format'] = df['format'].str.lower()
+
+        frame = frame.astype(object).where(frame.notna(), None)
+        placeholders = ", ".join("?" * len(COLUMNS))
+        with self.conn:
+            cursor = self.conn.executemany(
+                f"INSERT OR IGNORE INTO matches ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+                frame.itertuples(index=False, name=None)
+            )
+        return cursor.rowcount
+
+    def ingest_csv(self, chunksize: int = 200_000) -> int:
+        """
+        Stream the CSV into the database in cleaned chunks.
+
+        Args:
+            chunksize: Rows read and cleaned per batch
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            FileNotFoundError: If CSV file doesn't exist
+        """
+        if not self.csv_path.exists():
+            raise FileNotFoundError(f"Data file not found: {self.csv_path}")
+
+        total = 0
+        for chunk in pd.read_csv(self.csv_path, chunksize=chunksize):
+            total += self.ingest(chunk)
+        self.conn.execute("ANALYZE")
+        return total
+
+    def load_data(self) -> pd.DataFrame:
+        """
+        Load every stored match.
+
+        Returns:
+            pandas DataFrame with cricket data
+        """
+        self.data = pd.read_sql_query(f"SELECT {', '.join(COLUMNS)} FROM matches", self.conn)
+        return self.data
+
+    def player_names(self) -> List[str]:
+        """
+        List all players in the database.
+
+        Returns:
+            Sorted list of standardized player names
+        """
+        rows = self.conn.execute("SELECT DISTINCT player_name FROM matches ORDER BY player_name")
+        return [name for (name,) in rows]
+
+    def query(
+        self,
+        player_name: Optional[str] = None,
+        format_type: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Fetch matches filtered in SQL.
+
+        Args:
+            player_name: Restrict to one player (optional)
+            format_type: Restrict to one format (optional)
+            since: Earliest match_date, 'YYYY-MM-DD' (optional)
+            until: Latest match_date, 'YYYY-MM-DD' (optional)
+            columns: Columns to fetch (default: all)
+
+        Returns:
+            DataFrame with matching rows only
+        """
+        where, params = self._where(player_name, format_type, since, until)
+        return pd.read_sql_query(
+            f"SELECT {', '.join(columns or COLUMNS)} FROM matches{where}", self.conn, params=params
+        )
+
+    def filter_by_player(self, df: Optional[pd.DataFrame], player_name: str) -> pd.DataFrame:
+        """
+        Filter data for a specific player.
+
+        Pass ``df=None`` to push the filter down into SQL; a DataFrame
+        is filtered in pandas exactly like DataLoader does.
+
+        Args:
+            df: DataFrame to filter, or None to query the database
+            player_name: Name of player (case-insensitive)
+
+        Returns:
+            Filtered DataFrame for the player
+
+        Raises:
+            ValueError: If player not found in data
+        """
+        if df is not None:
+            return super().filter_by_player(df, player_name)
+
+        player_data = self.query(player_name=player_name)
+        if len(player_data) == 0:
+            raise ValueError(
+                f"Player '{player_name}' not found. "
+                f"Available players: {', '.join(self.player_names())}"
+            )
+        return player_data
+
+    def get_format_data(self, df: Optional[pd.DataFrame], format_type: str) -> pd.DataFrame:
+        """
+        Filter data by cricket format (ODI, Test, T20I).
+
+        Pass ``df=None`` to push the filter down into SQL.
+
+        Args:
+            df: DataFrame to filter, or None to query the database
+            format_type: Cricket format ('odi', 'test', 't20i')
+
+        Returns:
+            Filtered DataFrame for the format
+        """
+        if df is not None:
+            return super().get_format_data(df, format_type)
+        return self.query(format_type=format_type)
+
+    def aggregates(
+        self,
+        player_name: Optional[str] = None,
+        format_type: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> Dict[str, float]:
+        """
+        Compute the MetricsCalculator aggregates in SQL.
+
+        Args:
+            player_name: Restrict to one player (optional)
+            format_type: Restrict to one format (optional)
+            since: Earliest match_date, 'YYYY-MM-DD' (optional)
+            until: Latest match_date, 'YYYY-MM-DD' (optional)
+
+        Returns:
+            Dictionary of sums accepted by metrics_from_sums
+        """
+        where, params = self._where(player_name, format_type, since, until)
+        row = self.conn.execute(_AGGREGATES + where, params).fetchone()
+        return dict(zip(_SUM_KEYS, row))
+
+    def query_plan(
+        self,
+        player_name: Optional[str] = None,
+        format_type: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ) -> List[str]:
+        """
+        SQLite's plan for the filtered aggregate query.
+
+        Args:
+            player_name: Restrict to one player (optional)
+            format_type: Restrict to one format (optional)
+            since: Earliest match_date, 'YYYY-MM-DD' (optional)
+            until: Latest match_date, 'YYYY-MM-DD' (optional)
+
+        Returns:
+            EXPLAIN QUERY PLAN detail lines, e.g. which index is searched
+        """
+        where, params = self._where(player_name, format_type, since, until)
+        rows = self.conn.execute("EXPLAIN QUERY PLAN " + _AGGREGATES + where, params)
+        return [row[-1] for row in rows]
+
+    def calculate_all_metrics(self, player_name: str) -> Dict[str, float]:
+        """
+        Same result as MetricsCalculator.calculate_all_metrics, computed in SQL.
+
+        Args:
+            player_name: Name of player
+
+        Returns:
+            Dictionary with all metrics
+
+        Raises:
+            ValueError: If player not found in data
+        """
+        search_name = player_name.lower().strip()
+        sums = self.aggregates(player_name=search_name)
+        if sums['matches'] == 0:
+            raise ValueError(
+                f"Player '{player_name}' not found. "
+                f"Available players: {', '.join(self.player_names())}"
+            )
+        return metrics_from_sums(search_name, sums)
+
+    def format_metrics(self, player_name: str, format_type: str) -> Dict[str, float]:
+        """
+        Same result as MetricsCalculator.format_metrics, computed in SQL.
+
+        Args:
+            player_name: Name of player
+            format_type: Cricket format to filter by
+
+        Returns:
+            Dictionary with format-specific metrics
+        """
+        return format_metrics_from_sums(
+            self.aggregates(player_name=player_name, format_type=format_type)
+        )
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    @staticmethod
+    def _where(
+        player_name: Optional[str],
+        format_type: Optional[str],
+        since: Optional[str] = None,
+        until: Optional[str] = None
+    ):
+        """Build a WHERE clause that the (player_name, format) or date index can serve."""
+        clauses, params = [], []
+        if player_name is not None:
+            clauses.append("player_name = ?")
+            params.append(player_name.lower().strip())
+        if format_type is not None:
+            clauses.append("format = ?")
+            params.append(format_type.lower())
+        # ISO dates compare correctly as text
+        if since is not None:
+            clauses.append("match_date >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("match_date <= ?")
+            params.append(until)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return where, params
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    print("=" * 60)
+    print("SQLITE STORAGE MODULE - STANDALONE TEST")
+    print("=" * 60)
+
+    loader = SQLiteDataLoader("../data/cricket_data.csv")
+    print(f"\n Ingested {loader.ingest_csv()} rows")
+    print(f"   Players: {', '.join(loader.player_names())}")
+
+    metrics = loader.calculate_all_metrics("Virat Kohli")
+    print(f"\n Virat Kohli (SQL): {metrics['total_runs']} runs, avg {metrics['batting_average']}")
+
+    print("\n SQLite storage test passed!")
@@ -0,0 +1,507 @@
+"""
+SYNTHETIC DATA MODULE
+=====================
+Generates cricket datasets in the exact cricket_data.csv schema, at any
+scale, for benchmarks and scaling tests.
+
+Features:
+- Seeded: the same settings always produce the same file
+- Realistic per-format distributions (Test / ODI / T20I scoring,
+  strike rates, boundaries and not-out rates) with per-player skill
+- Configurable players, innings per player, total rows and date range
+- Controlled dirty data (duplicates, NaNs, zero balls, negative runs,
+  messy player names) so every clean_data path is exercised
+- Streams fixed-size chunks, so multi-GB files are written with flat memory
+- Ball-by-ball delivery files (SyntheticDeliveryGenerator) for the
+  delivery ingestion stage
+
+Usage:
+    python -m analytics.synthetic --rows 1000000 --out data/synthetic.csv
+"""
+
+import argparse
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+COLUMNS = [
+    'player_name', 'runs', 'balls_faced', 'format', 'dismissal', 'fours', 'sixes',
+    'centuries', 'half_centuries', 'opponent', 'match_date'
+]
+
+FORMATS = ['test', 'odi', 't20i']
+
+# Per-format shape of an innings
+FORMAT_PROFILES = {
+    #          share   mean runs  strike rate  not out  six share  max runs  max balls
+    'test': {'weight': 0.30, 'mean_runs': 38, 'strike_rate': 52, 'not_out': 0.12,
+             'six_share': 0.05, 'max_runs': 400, 'max_balls': 600},
+    'odi': {'weight': 0.45, 'mean_runs': 36, 'strike_rate': 88, 'not_out': 0.14,
+            'six_share': 0.10, 'max_runs': 264, 'max_balls': 180},
+    't20i': {'weight': 0.25, 'mean_runs': 24, 'strike_rate': 132, 'not_out': 0.22,
+             'six_share': 0.20, 'max_runs': 175, 'max_balls': 80},
+}
+
+DISMISSALS = ['caught', 'bowled', 'lbw', 'run out', 'stumped']
+DISMISSAL_WEIGHTS = [0.58, 0.18, 0.14, 0.06, 0.04]
+
+OPPONENTS = [
+    'australia', 'england', 'south africa', 'new zealand', 'pakistan',
+    'sri lanka', 'west indies', 'bangladesh', 'afghanistan', 'ireland'
+]
+
+FIRST_NAMES = [
+    'virat', 'rohit', 'ms', 'steve', 'joe', 'kane', 'babar', 'david', 'ben', 'quinton',
+    'shubman', 'rishabh', 'marnus', 'travis', 'jos', 'devon', 'aiden', 'temba', 'shai', 'litton'
+]
+LAST_NAMES = [
+    'kohli', 'sharma', 'dhoni', 'smith', 'root', 'williamson', 'azam', 'warner', 'stokes', 'de kock',
+    'gill', 'pant', 'labuschagne', 'head', 'buttler', 'conway', 'markram', 'bavuma', 'hope', 'das'
+]
+
+# Per-format chance of each run value off the bat on a delivery the batter faces
+BALL_RUNS = [0, 1, 2, 3, 4, 6]
+BALL_RUN_PROBS = {
+    'test': [0.72, 0.17, 0.04, 0.005, 0.055, 0.01],
+    'odi': [0.50, 0.32, 0.07, 0.01, 0.08, 0.02],
+    't20i': [0.38, 0.36, 0.08, 0.01, 0.12, 0.05],
+}
+
+# Chance of each extras type on a delivery ('' is a normal delivery)
+EXTRAS_TYPES = ['', 'wide', 'noball', 'bye', 'legbye']
+EXTRAS_PROBS = [0.94, 0.03, 0.005, 0.01, 0.015]
+
+DELIVERY_COLUMNS = [
+    'match_id', 'innings', 'over', 'ball', 'match_date', 'format', 'opponent',
+    'batter', 'batter_runs', 'extras_type', 'wicket_kind', 'player_out'
+]
+
+# Rows generated per internal block (fixes the random streams)
+BLOCK_ROWS = 50_000
+
+# Default dirty-data rates (fraction of rows)
+DEFAULT_DIRTY = {
+    'duplicates': 0.0,
+    'nans': 0.0,
+    'zero_balls': 0.0,
+    'negative_runs': 0.0,
+    'messy_names': 0.0,
+}
+
+
+def player_name(index: int) -> str:
+    """
+    Deterministic, unique player name for an index.
+
+    Args:
+        index: Player number (0-based)
+
+    Returns:
+        Lowercase player name
+    """
+    combos = len(FIRST_NAMES) * len(LAST_NAMES)
+    first = FIRST_NAMES[index % len(FIRST_NAMES)]
+    last = LAST_NAMES[(index // len(FIRST_NAMES)) % len(LAST_NAMES)]
+    name = f"{first} {last}"
+    if index >= combos:
+        name += f" {index // combos + 1}"
+    return name
+
+
+class SyntheticDataGenerator:
+    """Seeded generator of innings-level cricket data."""
+
+    def __init__(
+        self,
+        players: int = 3,
+        innings_per_player: int = 20,
+        rows: Optional[int] = None,
+        start_date: str = "2010-01-01",
+        end_date: str = "2024-12-31",
+        seed: int = 42,
+        dirty: Optional[Dict[str, float]] = None
+    ):
+        """
+        Configure the generator.
+
+        Args:
+            players: Number of distinct players
+            innings_per_player: Innings generated for each player
+            rows: Exact total rows; overrides ``players`` (players are added
+                  until there are enough innings, the last one is truncated)
+            start_date: First possible match date (YYYY-MM-DD)
+            end_date: Last possible match date (YYYY-MM-DD)
+            seed: Random seed
+            dirty: Fraction of rows per dirty-data kind (keys of DEFAULT_DIRTY)
+        """
+        if innings_per_player < 1:
+            raise ValueError("innings_per_player must be at least 1")
+
+        self.innings_per_player = innings_per_player
+        if rows is not None:
+            self.rows = rows
+            self.players = -(-rows // innings_per_player)
+        else:
+            self.players = players
+            self.rows = players * innings_per_player
+
+        self.start = np.datetime64(start_date, 'D')
+        self.end = np.datetime64(end_date, 'D')
+        if self.end < self.start:
+            raise ValueError("end_date must not be before start_date")
+
+        self.seed = seed
+        self.dirty = dict(DEFAULT_DIRTY)
+        if dirty:
+            unknown = set(dirty) - set(DEFAULT_DIRTY)
+            if unknown:
+                raise ValueError(f"Unknown dirty-data kinds: {', '.join(sorted(unknown))}")
+            self.dirty.update(dirty)
+
+        # Counts of injected dirty rows, filled in while generating
+        self.injected = {kind: 0 for kind in DEFAULT_DIRTY}
+
+    def iter_chunks(self, chunk_rows: int = 100_000) -> Iterator[pd.DataFrame]:
+        """
+        Generate the dataset as a stream of DataFrames.
+
+        Data is generated in fixed internal blocks, each with its own
+        random stream, so the output is identical whatever ``chunk_rows``
+        is; ``chunk_rows`` only caps the size of each yielded frame.
+
+        Args:
+            chunk_rows: Maximum rows per chunk
+
+        Yields:
+            DataFrames in the cricket_data.csv schema
+        """
+        self.injected = {kind: 0 for kind in DEFAULT_DIRTY}
+        players_per_block = max(1, BLOCK_ROWS // self.innings_per_player)
+        remaining = self.rows
+
+        for block, first in enumerate(range(0, self.players, players_per_block)):
+            rng = np.random.default_rng([self.seed, block])
+            count = min(players_per_block, self.players - first)
+            frame = self._generate_block(rng, first, count)
+            if len(frame) > remaining:
+                frame = frame.iloc[:remaining]
+            remaining -= len(frame)
+            frame = self._inject_dirty(rng, frame)
+
+            for start in range(0, len(frame), chunk_rows):
+                yield frame.iloc[start:start + chunk_rows]
+            if remaining <= 0:
+                break
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Generate the whole dataset in memory (small datasets only).
+
+        Returns:
+            DataFrame in the cricket_data.csv schema
+        """
+        return pd.concat(list(self.iter_chunks()), ignore_index=True)
+
+    def write_csv(self, path: str, chunk_rows: int = 100_000) -> int:
+        """
+        Stream the dataset to a CSV file with flat memory use.
+
+        Args:
+            path: Output CSV path
+            chunk_rows: Rows generated and written per step
+
+        Returns:
+            Number of rows written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        written = 0
+        with open(path, 'w', newline='') as f:
+            for i, chunk in enumerate(self.iter_chunks(chunk_rows)):
+                chunk.to_csv(f, header=(i == 0), index=False)
+                written += len(chunk)
+        return written
+
+    def _generate_block(self, rng: np.random.Generator, first: int, count: int) -> pd.DataFrame:
+        """Generate all innings for players ``first .. first + count - 1``."""
+        n = count * self.innings_per_player
+        player_idx = np.repeat(np.arange(first, first + count), self.innings_per_player)
+
+        # Per-player skill scales scoring and strike rate
+        skill = rng.lognormal(0.0, 0.25, count)[player_idx - first]
+        tempo = rng.lognormal(0.0, 0.12, count)[player_idx - first]
+
+        weights = [FORMAT_PROFILES[f]['weight'] for f in FORMATS]
+        format_idx = rng.choice(len(FORMATS), size=n, p=weights)
+
+        mean_runs = np.array([FORMAT_PROFILES[f]['mean_runs'] for f in FORMATS])[format_idx]
+        strike = np.array([FORMAT_PROFILES[f]['strike_rate'] for f in FORMATS])[format_idx]
+        not_out = np.array([FORMAT_PROFILES[f]['not_out'] for f in FORMATS])[format_idx]
+        six_share = np.array([FORMAT_PROFILES[f]['six_share'] for f in FORMATS])[format_idx]
+        max_runs = np.array([FORMAT_PROFILES[f]['max_runs'] for f in FORMATS])[format_idx]
+        max_balls = np.array([FORMAT_PROFILES[f]['max_balls'] for f in FORMATS])[format_idx]
+
+        # Heavy-tailed scores: many low, a few big innings
+        shape = 0.9
+        runs = rng.gamma(shape, mean_runs * skill / shape)
+        runs = np.minimum(runs, max_runs).astype(np.int64)
+
+        balls = runs * 100 / (strike * tempo) * rng.lognormal(0.0, 0.25, n)
+        balls = np.clip(np.rint(balls), 1, max_balls).astype(np.int64)
+
+        # Boundaries never exceed runs: sixes first, fours from what is left
+        sixes = np.floor(runs * six_share * rng.uniform(0.5, 1.5, n) / 6).astype(np.int64)
+        fours = np.floor((runs - 6 * sixes) * rng.uniform(0.3, 0.6, n) / 4).astype(np.int64)
+
+        dismissal = np.array(DISMISSALS, dtype=object)[
+            rng.choice(len(DISMISSALS), size=n, p=DISMISSAL_WEIGHTS)
+        ]
+        dismissal[rng.random(n) < not_out] = 'not out'
+
+        span = int((self.end - self.start).astype(int)) + 1
+        dates = self.start + rng.integers(0, span, n).astype('timedelta64[D]')
+
+        # Latest match first within each player, like cricket_data.csv
+        order = np.lexsort((-dates.astype(np.int64), player_idx))
+
+        names = np.array([player_name(i) for i in range(first, first + count)], dtype=object)
+
+        frame = pd.DataFrame({
+            'player_name': names[player_idx - first],
+            'runs': runs,
+            'balls_faced': balls,
+            'format': np.array(FORMATS, dtype=object)[format_idx],
+            'dismissal': dismissal,
+            'fours': fours,
+            'sixes': sixes,
+            'centuries': (runs >= 100).astype(np.int64),
+            'half_centuries': ((runs >= 50) & (runs < 100)).astype(np.int64),
+            'opponent': np.array(OPPONENTS, dtype=object)[rng.integers(0, len(OPPONENTS), n)],
+            'match_date': np.datetime_as_string(dates, unit='D'),
+        })
+        return frame.iloc[order].reset_index(drop=True)
+
+    def _inject_dirty(self, rng: np.random.Generator, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Corrupt a controlled fraction of rows, keeping the row count."""
+        if not any(self.dirty.values()) or len(chunk) < 2:
+            return chunk
+
+        chunk = chunk.copy()
+        n = len(chunk)
+
+        def pick(kind: str) -> np.ndarray:
+            count = int(round(self.dirty[kind] * n))
+            self.injected[kind] += count
+            return rng.choice(n, size=count, replace=False) if count else np.array([], dtype=int)
+
+        # Numeric columns become float so they can hold NaN
+        for col in ['runs', 'balls_faced', 'fours', 'sixes']:
+            chunk[col] = chunk[col].astype(float)
+
+        rows = pick('negative_runs')
+        chunk.loc[chunk.index[rows], 'runs'] = -chunk['runs'].to_numpy()[rows] - 1
+
+        rows = pick('zero_balls')
+        chunk.loc[chunk.index[rows], 'balls_faced'] = 0
+
+        rows = pick('nans')
+        columns = rng.choice(['runs', 'balls_faced', 'player_name', 'fours', 'sixes'], size=len(rows))
+        for row, col in zip(rows, columns):
+            chunk.iat[row, chunk.columns.get_loc(col)] = np.nan
+
+        rows = pick('messy_names')
+        names = chunk['player_name'].to_numpy(copy=True)
+        for row in rows:
+            if isinstance(names[row], str):
+                names[row] = f"  {names[row].title()} "
+        chunk['player_name'] = names
+
+        # Duplicates overwrite the following row, so the row count is kept
+        rows = pick('duplicates')
+        rows = rows[rows < n - 1]
+        chunk.iloc[rows + 1] = chunk.iloc[rows].to_numpy()
+
+        return chunk
+
+
+class SyntheticDeliveryGenerator:
+    """Seeded generator of ball-by-ball delivery data."""
+
+    def __init__(
+        self,
+        players: int = 3,
+        innings_per_player: int = 20,
+        start_date: str = "2010-01-01",
+        end_date: str = "2024-12-31",
+        seed: int = 42
+    ):
+        """
+        Configure the generator.
+
+        Every innings is its own match (``match_id``, ``innings`` 1) with a
+        single batter; deliveries are numbered by over and ball.
+
+        Args:
+            players: Number of distinct players
+            innings_per_player: Innings generated for each player
+            start_date: First possible match date (YYYY-MM-DD)
+            end_date: Last possible match date (YYYY-MM-DD)
+            seed: Random seed
+        """
+        if innings_per_player < 1:
+            raise ValueError("innings_per_player must be at least 1")
+
+        self.players = players
+        self.innings_per_player = innings_per_player
+        self.start = np.datetime64(start_date, 'D')
+        self.end = np.datetime64(end_date, 'D')
+        if self.end < self.start:
+            raise ValueError("end_date must not be before start_date")
+        self.seed = seed
+
+    def to_frame(self, files: int = 1) -> pd.DataFrame:
+        """
+        Generate all deliveries in memory (small datasets only).
+
+        Args:
+            files: Number of file blocks to generate (same split as
+                   ``write_files``, so the deliveries are identical)
+
+        Returns:
+            DataFrame with DELIVERY_COLUMNS
+        """
+        return pd.concat(
+            [self._generate_file(index, files) for index in range(files)],
+            ignore_index=True
+        )
+
+    def write_files(self, directory: str, files: int = 4) -> List[str]:
+        """
+        Write the deliveries as several CSV files, one block of players each.
+
+        Each file is generated on its own, so memory is bounded by the
+        largest file rather than the whole dataset.
+
+        Args:
+            directory: Output directory
+            files: Number of files
+
+        Returns:
+            Paths of the written files
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        paths = []
+        for index in range(files):
+            path = directory / f"deliveries_{index:03d}.csv"
+            self._generate_file(index, files).to_csv(path, index=False)
+            paths.append(str(path))
+        return paths
+
+    def _generate_file(self, index: int, files: int) -> pd.DataFrame:
+        """Generate the deliveries of one file's block of players."""
+        rng = np.random.default_rng([self.seed, index])
+        first = index * self.players // files
+        count = (index + 1) * self.players // files - first
+        n = count * self.innings_per_player
+
+        player_idx = np.repeat(np.arange(first, first + count), self.innings_per_player)
+        skill = rng.lognormal(0.0, 0.25, max(count, 1))[player_idx - first]
+
+        weights = [FORMAT_PROFILES[f]['weight'] for f in FORMATS]
+        format_idx = rng.choice(len(FORMATS), size=n, p=weights)
+        mean_runs = np.array([FORMAT_PROFILES[f]['mean_runs'] for f in FORMATS])[format_idx]
+        strike = np.array([FORMAT_PROFILES[f]['strike_rate'] for f in FORMATS])[format_idx]
+        not_out = np.array([FORMAT_PROFILES[f]['not_out'] for f in FORMATS])[format_idx]
+        max_balls = np.array([FORMAT_PROFILES[f]['max_balls'] for f in FORMATS])[format_idx]
+
+        # Deliveries per innings, heavy-tailed like the innings generator
+        shape = 0.9
+        length = rng.gamma(shape, mean_runs * 100 / strike * skill / shape)
+        length = np.clip(np.rint(length), 1, max_balls).astype(np.int64)
+
+        span = int((self.end - self.start).astype(int)) + 1
+        dates = self.start + rng.integers(0, span, n).astype('timedelta64[D]')
+        opponent_idx = rng.integers(0, len(OPPONENTS), n)
+        dismissed = rng.random(n) >= not_out
+        kind_idx = rng.choice(len(DISMISSALS), size=n, p=DISMISSAL_WEIGHTS)
+
+        # One row per delivery from here on
+        total = int(length.sum())
+        innings_of = np.repeat(np.arange(n), length)
+        starts = np.cumsum(length) - length
+        last = np.zeros(total, dtype=bool)
+        last[starts + length - 1] = True
+
+        extras = rng.choice(len(EXTRAS_TYPES), size=total, p=EXTRAS_PROBS)
+        # A dismissal ends the innings on a normal delivery
+        wicket = last & dismissed[innings_of]
+        extras[wicket] = 0
+
+        cumulative = np.cumsum([BALL_RUN_PROBS[f] for f in FORMATS], axis=1)
+        outcome = (rng.random(total)[:, None] > cumulative[format_idx[innings_of]]).sum(axis=1)
+        outcome = np.minimum(outcome, len(BALL_RUNS) - 1)
+        batter_runs = np.array(BALL_RUNS)[outcome]
+        # Off-the-bat runs only happen on normal deliveries and no-balls
+        batter_runs[(extras != 0) & (extras != 2)] = 0
+        batter_runs[wicket] = 0
+
+        # Over and ball numbers count legal deliveries (not wides or no-balls)
+        legal = (extras != 1) & (extras != 2)
+        legal_before = np.cumsum(legal) - legal
+        legal_before -= np.repeat(legal_before[starts], length)
+
+        names = np.array([player_name(i) for i in range(first, first + count)], dtype=object)
+        batter = names[player_idx - first][innings_of]
+        kinds = np.array(DISMISSALS, dtype=object)[kind_idx][innings_of]
+
+        return pd.DataFrame({
+            'match_id': (first * self.innings_per_player + innings_of).astype(np.int64),
+            'innings': 1,
+            'over': legal_before // 6,
+            'ball': legal_before % 6 + 1,
+            'match_date': np.datetime_as_string(dates, unit='D')[innings_of],
+            'format': np.array(FORMATS, dtype=object)[format_idx][innings_of],
+            'opponent': np.array(OPPONENTS, dtype=object)[opponent_idx][innings_of],
+            'batter': batter,
+            'batter_runs': batter_runs,
+            'extras_type': np.array(EXTRAS_TYPES, dtype=object)[extras],
+            'wicket_kind': np.where(wicket, kinds, ''),
+            'player_out': np.where(wicket, batter, ''),
+        }, columns=DELIVERY_COLUMNS)
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic cricket data")
+    parser.add_argument("--rows", type=int, default=None, help="Exact number of rows")
+    parser.add_argument("--players", type=int, default=3)
+    parser.add_argument("--innings", type=int, default=20, help="Innings per player")
+    parser.add_argument("--start", default="2010-01-01")
+    parser.add_argument("--end", default="2024-12-31")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--dirty", type=float, default=0.0,
+                        help="Fraction of rows per dirty-data kind")
+    parser.add_argument("--chunk-rows", type=int, default=100_000)
+    parser.add_argument("--out", default="data/synthetic_cricket_data.csv")
+    args = parser.parse_args()
+
+    generator = SyntheticDataGenerator(
+        players=args.players,
+        innings_per_player=args.innings,
+        rows=args.rows,
+        start_date=args.start,
+        end_date=args.end,
+        seed=args.seed,
+        dirty={kind: args.dirty for kind in DEFAULT_DIRTY}
+    )
+    written = generator.write_csv(args.out, args.chunk_rows)
+
+    print(f" Wrote {written:,} rows for {generator.players:,} players to {args.out}")
+    if args.dirty:
+        print(f"   Dirty rows injected: {generator.injected}")
@@ -0,0 +1,4 @@
+"""
+Benchmark scripts for the analytics layer (startup, pipeline, storage,
+memory, parallel aggregation and API load).
+"""
@@ -0,0 +1,164 @@
+"""
+API LOAD TEST
+=============
+Fires concurrent requests at the analytics API and reports latency.
+
+By default the app runs in-process (httpx ASGI transport, no network),
+which is enough to compare changes locally. Pass --url to hit a running
+server instead.
+
+Reports per endpoint and overall:
+- p50 / p99 latency (ms)
+- requests per second
+
+Usage:
+    python backend/benchmarks/load_test.py [--requests 500] [--concurrency 20]
+                                          [--charts] [--url http://localhost:8000]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+PLAYERS = ['virat kohli', 'rohit sharma', 'ms dhoni']
+
+
+def build_paths(include_charts: bool = False) -> List[str]:
+    """
+    Build the round-robin list of request paths.
+
+    Args:
+        include_charts: Also request PNG charts (much heavier)
+
+    Returns:
+        List of URL paths
+    """
+    paths = []
+    for player in PLAYERS:
+        paths.append(f"/api/players/{player}/metrics")
+        paths.append(f"/api/players/{player}/formats")
+        paths.append(f"/api/players/{player}/chart-data")
+        if include_charts:
+            paths.append(f"/api/players/{player}/charts/report")
+    paths.append(f"/api/compare?players={','.join(PLAYERS)}")
+    return paths
+
+
+def summarize(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    """
+    Summarize latencies.
+
+    Args:
+        latencies: Per-request latency in seconds
+        elapsed: Wall time of the whole run in seconds
+
+    Returns:
+        Dictionary with count, p50_ms, p99_ms and rps
+    """
+    values = np.array(latencies) * 1000
+    return {
+        "count": len(values),
+        "p50_ms": round(float(np.percentile(values, 50)), 2),
+        "p99_ms": round(float(np.percentile(values, 99)), 2),
+        "rps": round(len(values) / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+
+
+async def _run(client: httpx.AsyncClient, paths: List[str], total: int, concurrency: int) -> Dict:
+    """Send ``total`` requests with at most ``concurrency`` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    per_endpoint: Dict[str, List[float]] = {}
+    all_latencies: List[float] = []
+    errors = 0
+
+    async def one(i: int):
+        nonlocal errors
+        path = paths[i % len(paths)]
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get(path)
+            latency = time.perf_counter() - start
+        if response.status_code != 200:
+            errors += 1
+        endpoint = path.split("?")[0].rsplit("/", 1)[-1]
+        per_endpoint.setdefault(endpoint, []).append(latency)
+        all_latencies.append(latency)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "overall": summarize(all_latencies, elapsed),
+        "endpoints": {name: summarize(lat, elapsed) for name, lat in per_endpoint.items()},
+        "errors": errors,
+    }
+
+
+async def run_load_test(
+    total: int = 500,
+    concurrency: int = 20,
+    include_charts: bool = False,
+    url: Optional[str] = None
+) -> Dict:
+    """
+    Run the load test.
+
+    Args:
+        total: Total number of requests
+        concurrency: Maximum requests in flight
+        include_charts: Also request PNG reports
+        url: Base URL of a running server (None runs the app in-process)
+
+    Returns:
+        Dictionary with overall and per-endpoint latency summaries
+    """
+    paths = build_paths(include_charts)
+
+    if url:
+        async with httpx.AsyncClient(base_url=url, timeout=60) as client:
+            return await _run(client, paths, total, concurrency)
+
+    from main import app
+
+    # ASGITransport does not run lifespan events, so drive them here
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=60) as client:
+            return await _run(client, paths, total, concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the analytics API")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--charts", action="store_true", help="Include PNG report requests")
+    parser.add_argument("--url", default=None, help="Base URL of a running server")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    results = asyncio.run(run_load_test(args.requests, args.concurrency, args.charts, args.url))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print("=" * 60)
+        print("API LOAD TEST")
+        print("=" * 60)
+        overall = results["overall"]
+        print(f"\n Requests: {overall['count']}  Errors: {results['errors']}")
+        print(f"   p50: {overall['p50_ms']} ms  p99: {overall['p99_ms']} ms  "
+              f"throughput: {overall['rps']} req/s")
+        print("\n Per endpoint:")
+        for name, summary in results["endpoints"].items():
+            print(f"   {name:<14} p50 {summary['p50_ms']:>8} ms   p99 {summary['p99_ms']:>8} ms")
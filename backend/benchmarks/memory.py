@@ -0,0 +1,195 @@
+"""
+MEMORY BENCHMARK
+================
+Profiles peak and net memory of every analytics stage and enforces
+per-stage memory budgets.
+
+The pipeline (load, clean, filter, metrics, charts) runs on seeded
+synthetic data with memory profiling switched on in the instrumentation
+spans, so every stage reports:
+- peak MB (tracemalloc peak above the level at stage start)
+- net MB (allocations still held when the stage ends)
+- RSS growth across the stage
+
+Budgets live in MEMORY_BUDGETS as a fixed allowance plus bytes per row
+the stage processed, so one budget holds at any dataset size. A stage
+that starts copying its input frame shows up as extra bytes per row.
+
+Usage:
+    python backend/benchmarks/memory.py [--rows 200000] [--mode warn|fail] [--json]
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from analytics.instrumentation import instrumentation
+from analytics.synthetic import SyntheticDataGenerator
+
+# Stage -> fixed MB + bytes per processed row. Measured at 2x10^4-2x10^5
+# rows with roughly 30% headroom; chart stages are dominated by the fixed
+# Matplotlib cost.
+MEMORY_BUDGETS: Dict[str, Dict[str, float]] = {
+    "data.load": {"peak_mb": 2, "bytes_per_row": 200},
+    "data.clean": {"peak_mb": 2, "bytes_per_row": 260},
+    "data.clean.duplicates": {"peak_mb": 1, "bytes_per_row": 190},
+    "data.clean.missing": {"peak_mb": 1, "bytes_per_row": 140},
+    "data.clean.types": {"peak_mb": 1, "bytes_per_row": 40},
+    "data.clean.validate": {"peak_mb": 1, "bytes_per_row": 140},
+    "data.clean.names": {"peak_mb": 1, "bytes_per_row": 110},
+    "data.filter_player": {"peak_mb": 1, "bytes_per_row": 24},
+    "data.filter_format": {"peak_mb": 0.5, "bytes_per_row": 100},
+    "metrics.all": {"peak_mb": 0.25, "bytes_per_row": 40},
+    "graphs.last_10_matches.build": {"peak_mb": 8, "bytes_per_row": 0},
+    "graphs.career_progression.build": {"peak_mb": 8, "bytes_per_row": 600},
+    "graphs.report.build": {"peak_mb": 12, "bytes_per_row": 600},
+    "graphs.last_10_matches.encode": {"peak_mb": 4, "bytes_per_row": 0},
+    "graphs.career_progression.encode": {"peak_mb": 4, "bytes_per_row": 0},
+    "graphs.report.encode": {"peak_mb": 4, "bytes_per_row": 0},
+}
+
+# Synthetic innings per player, so player-level stages see real careers
+INNINGS_PER_PLAYER = 2_000
+
+
+def apply_budgets(mode: str = "warn", budgets: Dict[str, Dict[str, float]] = MEMORY_BUDGETS):
+    """
+    Install memory budgets on the process-wide instrumentation registry.
+
+    Args:
+        mode: "warn" logs violations, "fail" raises MemoryBudgetError
+        budgets: Stage -> {"peak_mb", "bytes_per_row"}
+    """
+    for stage, budget in budgets.items():
+        instrumentation.set_memory_budget(stage, mode=mode, **budget)
+
+
+def run_memory_profile(rows: int = 200_000, mode: str = "warn", graphs: bool = True) -> Dict:
+    """
+    Run the pipeline once with memory profiling and budgets on.
+
+    Args:
+        rows: Synthetic dataset size
+        mode: Budget mode ("warn" or "fail")
+        graphs: Include chart stages
+
+    Returns:
+        Dictionary with per-stage memory summaries and budget violations
+
+    Raises:
+        MemoryBudgetError: In "fail" mode, on the first stage over budget
+    """
+    from analytics.data_loader import DataLoader
+    from analytics.metrics import MetricsCalculator
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = str(Path(tmp) / "matches.csv")
+        SyntheticDataGenerator(
+            rows=rows,
+            innings_per_player=min(INNINGS_PER_PLAYER, max(1, rows // 3)),
+            dirty={kind: 0.002 for kind in ['duplicates', 'nans', 'zero_balls', 'negative_runs']}
+        ).write_csv(csv_path)
+
+        was_enabled = instrumentation.enabled
+        instrumentation.enable()
+        instrumentation.reset()
+        apply_budgets(mode)
+        instrumentation.enable_memory()
+
+        try:
+            # Loader progress would swamp the report
+            with _quiet():
+                loader = DataLoader(csv_path)
+                cleaned = loader.clean_data(loader.load_data())
+                player = cleaned['player_name'].value_counts().index[0]
+                player_data = loader.filter_by_player(cleaned, player)
+                loader.get_format_data(player_data, 'odi')
+                MetricsCalculator(player_data).calculate_all_metrics()
+
+                if graphs:
+                    from analytics.graphs import GraphGenerator
+                    generator = GraphGenerator(str(Path(tmp) / "graphs"))
+                    generator.last_10_matches(player_data, player)
+                    generator.career_progression(player_data, player)
+                    generator.player_report(player_data, player, include_formats=True)
+
+            stages = {
+                stage: {"rows": summary["rows"], **summary["memory"]}
+                for stage, summary in instrumentation.stages().items()
+                if "memory" in summary
+            }
+            return {"rows": rows, "stages": stages, "violations": list(instrumentation.budget_violations)}
+
+        finally:
+            instrumentation.disable_memory()
+            instrumentation.memory_budgets.clear()
+            if not was_enabled:
+                instrumentation.disable()
+
+
+def unbudgeted_stages(report: Dict) -> List[str]:
+    """
+    List profiled stages that have no memory budget.
+
+    Args:
+        report: Output of run_memory_profile
+
+    Returns:
+        Stage names missing from MEMORY_BUDGETS (per-metric stages excluded)
+    """
+    return [
+        stage for stage in report["stages"]
+        if stage not in MEMORY_BUDGETS and not stage.startswith("metrics.")
+    ]
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Silence analytics progress and dirty-data logging for the block."""
+    analytics_logger = logging.getLogger("analytics")
+    budget_logger = logging.getLogger("analytics.instrumentation")
+    levels = analytics_logger.level, budget_logger.level
+    # Budget violations are logged by analytics.instrumentation at WARNING
+    analytics_logger.setLevel(logging.ERROR)
+    budget_logger.setLevel(logging.WARNING)
+    try:
+        yield
+    finally:
+        analytics_logger.setLevel(levels[0])
+        budget_logger.setLevel(levels[1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile analytics stage memory")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--mode", choices=["warn", "fail"], default="warn")
+    parser.add_argument("--no-graphs", action="store_true", help="Skip chart stages")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format=" %(message)s")
+    report = run_memory_profile(args.rows, args.mode, graphs=not args.no_graphs)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("=" * 72)
+        print(f"MEMORY PROFILE ({args.rows:,} rows)")
+        print("=" * 72)
+        for stage, m in report["stages"].items():
+            print(f"   {stage:<34} peak {m['peak_mb_max']:>8.2f} MB  "
+                  f"net {m['net_mb_mean']:>7.2f} MB  rss +{m['rss_delta_mb_max']:>6.2f} MB")
+        if report["violations"]:
+            print(f"\n {len(report['violations'])} budget violation(s):")
+            for violation in report["violations"]:
+                print(f"   {violation}")
+            sys.exit(1)
+        print("\n All stages within memory budgets")
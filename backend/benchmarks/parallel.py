@@ -0,0 +1,148 @@
+"""
+PARALLEL AGGREGATION BENCHMARK
+==============================
+Measures how league-wide aggregation scales with worker processes.
+
+A seeded synthetic CSV (10M rows by default) is aggregated by
+ParallelAggregator at every worker count. Each run is checked against
+the 1-worker result, and that against LeagueTable metrics of the file
+loaded and cleaned in one process (--no-verify skips this for files too
+big to load):
+- seconds and rows/s per worker count
+- speedup over 1 worker and parallel efficiency (speedup / workers)
+
+Usage:
+    python backend/benchmarks/parallel.py [--rows 10000000] [--workers 1,2,4,8] [--no-verify] [--json]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from analytics.compare import LeagueTable
+from analytics.data_loader import DataLoader
+from analytics.parallel import DEFAULT_PARTITION_BYTES, ParallelAggregator
+from analytics.synthetic import SyntheticDataGenerator
+
+# Innings per synthetic player (10M rows -> 20,000 players)
+INNINGS_PER_PLAYER = 500
+
+
+def default_workers() -> List[int]:
+    """Powers of two up to the CPU count, plus the CPU count itself."""
+    cpus = os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != cpus:
+        counts.append(cpus)
+    return counts
+
+
+def run_scaling(
+    rows: int,
+    workers: Optional[List[int]] = None,
+    partition_bytes: int = DEFAULT_PARTITION_BYTES,
+    csv_path: Optional[str] = None,
+    verify: bool = True
+) -> Dict:
+    """
+    Aggregate the same CSV at each worker count.
+
+    Args:
+        rows: Synthetic dataset size (ignored when ``csv_path`` is given)
+        workers: Worker counts to run (default: default_workers())
+        partition_bytes: CSV bytes per partition
+        csv_path: Existing CSV to aggregate instead of generating one
+        verify: Also check the metrics against DataLoader + clean_data on
+                the whole file (needs the file to fit in memory)
+
+    Returns:
+        Dictionary with per-worker-count timings and speedups
+
+    Raises:
+        AssertionError: If any run's sums differ from the 1-worker run, or
+                        its metrics from the single-process reference
+    """
+    workers = sorted(set(workers or default_workers()) | {1})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if csv_path is None:
+            csv_path = str(Path(tmp) / "matches.csv")
+            SyntheticDataGenerator(
+                rows=rows, innings_per_player=min(INNINGS_PER_PLAYER, rows)
+            ).write_csv(csv_path)
+
+        runs = {}
+        reference = None
+        for count in workers:
+            engine = ParallelAggregator(workers=count, partition_bytes=partition_bytes)
+            sums = engine.csv_sums(csv_path).sort_index()
+            if reference is None:
+                reference = sums
+            else:
+                assert sums.equals(reference), f"{count} workers changed the result"
+            runs[count] = engine.stats
+
+        if verify:
+            loader = DataLoader(csv_path)
+            expected = LeagueTable.from_frame(loader.clean_data(loader.load_data()))
+            league = LeagueTable.from_sums(reference)
+            assert league.metrics == expected.metrics, "Sums differ from the single-process metrics"
+            assert league.format_metrics == expected.format_metrics, \
+                "Per-format sums differ from the single-process metrics"
+
+    base = runs[1]["seconds"]
+    return {
+        "rows": runs[1]["rows"],
+        "cpus": os.cpu_count(),
+        "partitions": runs[1]["partitions"],
+        "runs": [
+            {
+                **stats,
+                "speedup": round(base / stats["seconds"], 2),
+                "efficiency": round(base / stats["seconds"] / count, 2),
+            }
+            for count, stats in runs.items()
+        ],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark parallel league aggregation")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--workers", default=None, help="Comma-separated worker counts")
+    parser.add_argument("--partition-mb", type=float, default=DEFAULT_PARTITION_BYTES / 2 ** 20)
+    parser.add_argument("--csv", default=None, help="Aggregate this CSV instead of synthetic data")
+    parser.add_argument("--no-verify", action="store_true",
+                        help="Skip the single-process check (for files that don't fit in memory)")
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format=" %(message)s")
+    counts = [int(w) for w in args.workers.split(",")] if args.workers else None
+    report = run_scaling(args.rows, counts, int(args.partition_mb * 2 ** 20), args.csv,
+                         verify=not args.no_verify)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print("=" * 60)
+        print(f"PARALLEL AGGREGATION ({report['rows']:,} rows, "
+              f"{report['partitions']} partitions, {report['cpus']} CPUs)")
+        print("=" * 60)
+        for run in report["runs"]:
+            print(f"   {run['workers']:>3} workers: {run['seconds']:>8.2f}s  "
+                  f"{run['rows_per_sec']:>12,} rows/s  x{run['speedup']:<5} "
+                  f"efficiency {run['efficiency']:.0%}")
+        print("\n All worker counts produced identical sums")
+        if not args.no_verify:
+            print(" Metrics match DataLoader + clean_data on the whole file")
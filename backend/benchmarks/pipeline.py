@@ -0,0 +1,274 @@
+"""
+PIPELINE BENCHMARK SUITE
+========================
+Times every analytics stage at increasing dataset sizes.
+
+Stages:
+- load_data, clean_data, filter_by_player
+- calculate_all_metrics, format_metrics
+- each GraphGenerator chart (last 10, distribution, progression, report)
+
+For every stage and scale we record:
+- seconds (best of --repeats runs, measured without tracing)
+- peak_mb (tracemalloc peak during one separate traced run)
+- rows and rows_per_sec
+
+Results are written as JSON. With --baseline, each stage is compared
+against a stored run and the suite exits non-zero if any stage got
+slower (or used more memory) than the threshold allows.
+
+Usage:
+    python backend/benchmarks/pipeline.py --scales 100,1000,10000,100000 --out bench.json
+    python backend/benchmarks/pipeline.py --baseline bench.json --threshold 0.25
+    python backend/benchmarks/pipeline.py --scales 10000000 --no-graphs
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from analytics.synthetic import SyntheticDataGenerator
+
+DEFAULT_SCALES = [100, 1_000, 10_000, 100_000]
+
+# Timings below this are too noisy to flag as regressions
+MIN_SECONDS = 0.005
+
+# Innings per synthetic player, and the share of each dirty-data kind so
+# every clean_data branch does real work
+INNINGS_PER_PLAYER = 200
+DIRTY_RATE = 0.002
+
+
+@contextlib.contextmanager
+def _quiet():
+    """Silence analytics progress and dirty-data logging for the block."""
+    analytics_logger = logging.getLogger("analytics")
+    level = analytics_logger.level
+    analytics_logger.setLevel(logging.ERROR)
+    try:
+        yield
+    finally:
+        analytics_logger.setLevel(level)
+
+
+def _measure(func: Callable, repeats: int) -> Dict[str, float]:
+    """
+    Time a stage and trace its peak memory.
+
+    Args:
+        func: Zero-argument callable running the stage
+        repeats: Timed runs; the fastest is kept
+
+    Returns:
+        Dictionary with seconds and peak_mb
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": round(best, 6), "peak_mb": round(peak / (1024 * 1024), 3)}
+
+
+def benchmark_scale(rows: int, repeats: int = 3, graphs: bool = True) -> Dict[str, Dict]:
+    """
+    Benchmark every stage at one dataset size.
+
+    Args:
+        rows: Number of innings in the synthetic dataset
+        repeats: Timed runs per stage
+        graphs: Include GraphGenerator stages
+
+    Returns:
+        Dictionary mapping stage name to its measurements
+    """
+    from analytics.data_loader import DataLoader
+    from analytics.metrics import MetricsCalculator
+
+    results: Dict[str, Dict] = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = str(Path(tmp) / "matches.csv")
+        SyntheticDataGenerator(
+            rows=rows,
+            innings_per_player=min(INNINGS_PER_PLAYER, max(1, rows // 3)),
+            dirty={kind: DIRTY_RATE for kind in ['duplicates', 'nans', 'zero_balls', 'negative_runs']}
+        ).write_csv(csv_path)
+        loader = DataLoader(csv_path)
+
+        # Loader progress and dirty-data logging would swamp the report
+        with _quiet():
+            raw = loader.load_data()
+            cleaned = loader.clean_data(raw)
+            player = cleaned['player_name'].value_counts().index[0]
+            player_data = loader.filter_by_player(cleaned, player)
+            calculator = MetricsCalculator(player_data)
+
+            stages: List = [
+                ("load_data", len(raw), lambda: loader.load_data()),
+                ("clean_data", len(raw), lambda: loader.clean_data(raw)),
+                ("filter_by_player", len(cleaned), lambda: loader.filter_by_player(cleaned, player)),
+                ("calculate_all_metrics", len(player_data), calculator.calculate_all_metrics),
+                ("format_metrics", len(player_data), lambda: calculator.format_metrics('odi')),
+            ]
+
+            if graphs:
+                from analytics.graphs import GraphGenerator
+                generator = GraphGenerator(str(Path(tmp) / "graphs"))
+                stages += [
+                    ("graph_last_10_matches", len(player_data),
+                     lambda: generator.last_10_matches(player_data, player)),
+                    ("graph_runs_distribution", len(player_data),
+                     lambda: generator.runs_distribution(player_data, player)),
+                    ("graph_career_progression", len(player_data),
+                     lambda: generator.career_progression(player_data, player)),
+                    ("graph_player_report", len(player_data),
+                     lambda: generator.player_report(player_data, player, include_formats=True)),
+                ]
+
+            for name, stage_rows, func in stages:
+                measured = _measure(func, repeats)
+                measured["rows"] = stage_rows
+                measured["rows_per_sec"] = (
+                    round(stage_rows / measured["seconds"], 1) if measured["seconds"] else 0.0
+                )
+                results[name] = measured
+
+    return results
+
+
+def run_suite(scales: List[int], repeats: int = 3, graphs: bool = True) -> Dict:
+    """
+    Benchmark every stage at every scale.
+
+    Args:
+        scales: Dataset sizes in rows
+        repeats: Timed runs per stage
+        graphs: Include GraphGenerator stages
+
+    Returns:
+        JSON-ready dictionary with machine info and per-scale results
+    """
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeats": repeats,
+        },
+        "results": {
+            str(rows): benchmark_scale(rows, repeats, graphs) for rows in scales
+        },
+    }
+
+
+def compare_to_baseline(
+    current: Dict,
+    baseline: Dict,
+    threshold: float = 0.25,
+    memory_threshold: Optional[float] = None
+) -> List[str]:
+    """
+    Find stages that regressed against a baseline run.
+
+    Only scales and stages present in both runs are compared.
+
+    Args:
+        current: Output of run_suite
+        baseline: A previously saved run_suite output
+        threshold: Allowed fractional slowdown (0.25 = 25% slower)
+        memory_threshold: Allowed fractional peak memory growth
+                          (defaults to ``threshold``)
+
+    Returns:
+        List of human-readable regressions (empty if none)
+    """
+    memory_threshold = threshold if memory_threshold is None else memory_threshold
+    regressions = []
+
+    for scale, stages in current["results"].items():
+        base_stages = baseline.get("results", {}).get(scale, {})
+        for stage, measured in stages.items():
+            base = base_stages.get(stage)
+            if base is None:
+                continue
+
+            if max(measured["seconds"], base["seconds"]) >= MIN_SECONDS:
+                limit = base["seconds"] * (1 + threshold)
+                if measured["seconds"] > limit:
+                    regressions.append(
+                        f"{stage} @ {scale} rows: {measured['seconds']:.4f}s "
+                        f"vs baseline {base['seconds']:.4f}s (+{threshold:.0%} allowed)"
+                    )
+
+            mem_limit = base["peak_mb"] * (1 + memory_threshold)
+            # Ignore sub-megabyte noise
+            if measured["peak_mb"] > mem_limit and measured["peak_mb"] - base["peak_mb"] > 1:
+                regressions.append(
+                    f"{stage} @ {scale} rows: peak {measured['peak_mb']:.1f}MB "
+                    f"vs baseline {base['peak_mb']:.1f}MB (+{memory_threshold:.0%} allowed)"
+                )
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the analytics pipeline")
+    parser.add_argument("--scales", default=",".join(str(s) for s in DEFAULT_SCALES),
+                        help="Comma-separated row counts (e.g. 100,1000,10000000)")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--no-graphs", action="store_true", help="Skip chart stages")
+    parser.add_argument("--out", help="Write results JSON here")
+    parser.add_argument("--baseline", help="Compare against this results JSON")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed slowdown before failing (fraction)")
+    parser.add_argument("--memory-threshold", type=float, default=None,
+                        help="Allowed peak memory growth before failing (fraction)")
+    args = parser.parse_args()
+
+    scales = [int(float(s)) for s in args.scales.split(",")]
+    report = run_suite(scales, args.repeats, graphs=not args.no_graphs)
+
+    print("=" * 72)
+    print("PIPELINE BENCHMARK")
+    print("=" * 72)
+    for scale, stages in report["results"].items():
+        print(f"\n {int(scale):,} rows")
+        for stage, m in stages.items():
+            print(f"   {stage:<26} {m['seconds'] * 1000:>10.2f} ms  "
+                  f"{m['peak_mb']:>9.2f} MB  {m['rows_per_sec']:>14,.0f} rows/s")
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=2))
+        print(f"\n Results written to {args.out}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare_to_baseline(report, baseline, args.threshold, args.memory_threshold)
+        if regressions:
+            print(f"\n {len(regressions)} regression(s) against {args.baseline}:")
+            for regression in regressions:
+                print(f"   {regression}")
+            sys.exit(1)
+        print(f"\n No regressions against {args.baseline}")
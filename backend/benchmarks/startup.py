@@ -0,0 +1,154 @@
+"""
+STARTUP BENCHMARK
+=================
+Measures import time and resident memory for each analytics entry point.
+
+Every entry point is imported in a fresh interpreter, so results are not
+skewed by modules an earlier import already loaded. For each one we
+record:
+- import time (ms)
+- RSS growth caused by the import (MB)
+- which heavy libraries (pandas, matplotlib) ended up loaded
+
+Budgets live in STARTUP_BUDGETS and are enforced by the test suite.
+
+Usage:
+    python backend/benchmarks/startup.py [--json]
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Heavy libraries we track per entry point
+HEAVY_MODULES = ["pandas", "matplotlib"]
+
+# Entry point -> budget. Times are generous enough for slow CI machines;
+# the "forbidden" lists are the real guard against eager heavy imports.
+STARTUP_BUDGETS: Dict[str, Dict] = {
+    "analytics": {"import_ms": 100, "rss_mb": 5, "forbidden": ["pandas", "matplotlib"]},
+    "analytics.metrics": {"import_ms": 400, "rss_mb": 40, "forbidden": ["pandas", "matplotlib"]},
+    "analytics.chart_data": {"import_ms": 400, "rss_mb": 40, "forbidden": ["pandas", "matplotlib"]},
+    "analytics.graphs": {"import_ms": 400, "rss_mb": 40, "forbidden": ["pandas", "matplotlib"]},
+    "analytics.data_loader": {"import_ms": 1500, "rss_mb": 120, "forbidden": ["matplotlib"]},
+    "analytics.instrumentation": {"import_ms": 100, "rss_mb": 5, "forbidden": ["pandas", "matplotlib"]},
+    "analytics.compare": {"import_ms": 400, "rss_mb": 40, "forbidden": ["pandas", "matplotlib"]},
+    "analytics.records": {"import_ms": 400, "rss_mb": 40, "forbidden": ["pandas", "matplotlib"]},
+    "analytics.recent": {"import_ms": 400, "rss_mb": 40, "forbidden": ["pandas", "matplotlib"]},
+}
+
+# Runs in the child interpreter; prints one JSON line. RSS is read inline
+# (as analytics.instrumentation.rss_bytes does) so nothing from the package
+# is imported before the measurement starts
+_PROBE = """
+import json, os, sys, time
+sys.path.insert(0, {backend!r})
+
+def rss_mb():
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+    except OSError:
+        return 0.0
+    return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+before = rss_mb()
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+after = rss_mb()
+
+print(json.dumps({{
+    "import_ms": round(elapsed, 2),
+    "rss_mb": round(after - before, 2),
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def measure_import(module: str, repeats: int = 3) -> Dict:
+    """
+    Measure importing one module in fresh interpreters.
+
+    Args:
+        module: Dotted module name, importable from backend/
+        repeats: Number of fresh interpreters; the fastest run is kept
+
+    Returns:
+        Dictionary with import_ms, rss_mb and loaded heavy modules
+    """
+    code = _PROBE.format(backend=str(BACKEND_DIR), module=module, heavy=HEAVY_MODULES)
+    runs = []
+    for _ in range(repeats):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, check=True
+        )
+        runs.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return min(runs, key=lambda r: r["import_ms"])
+
+
+def run_startup_benchmark(repeats: int = 3) -> Dict[str, Dict]:
+    """
+    Measure every entry point in STARTUP_BUDGETS.
+
+    Args:
+        repeats: Fresh interpreters per entry point
+
+    Returns:
+        Dictionary mapping entry point to its measurements
+    """
+    return {module: measure_import(module, repeats) for module in STARTUP_BUDGETS}
+
+
+def check_budgets(results: Dict[str, Dict]) -> List[str]:
+    """
+    Compare measurements against STARTUP_BUDGETS.
+
+    Args:
+        results: Output of run_startup_benchmark
+
+    Returns:
+        List of human-readable budget violations (empty if all pass)
+    """
+    violations = []
+    for module, measured in results.items():
+        budget = STARTUP_BUDGETS[module]
+        if measured["import_ms"] > budget["import_ms"]:
+            violations.append(
+                f"{module}: import took {measured['import_ms']}ms "
+                f"(budget {budget['import_ms']}ms)"
+            )
+        if measured["rss_mb"] > budget["rss_mb"]:
+            violations.append(
+                f"{module}: import grew RSS by {measured['rss_mb']}MB "
+                f"(budget {budget['rss_mb']}MB)"
+            )
+        for heavy in budget["forbidden"]:
+            if heavy in measured["loaded"]:
+                violations.append(f"{module}: imported {heavy} at load time")
+    return violations
+
+
+if __name__ == "__main__":
+    results = run_startup_benchmark()
+
+    if "--json" in sys.argv:
+        print(json.dumps(results, indent=2))
+    else:
+        print("=" * 60)
+        print("STARTUP BENCHMARK")
+        print("=" * 60)
+        for module, measured in results.items():
+            loaded = ", ".join(measured["loaded"]) or "-"
+            print(f"   {module:<24} {measured['import_ms']:>8.1f} ms "
+                  f"{measured['rss_mb']:>7.1f} MB   heavy: {loaded}")
+
+    violations = check_budgets(results)
+    for violation in violations:
+        print(f" BUDGET EXCEEDED: {violation}", file=sys.stderr)
+    sys.exit(1 if violations else 0)
@@ -0,0 +1,154 @@
+"""
+STORAGE BENCHMARK
+=================
+Compares the pandas DataLoader path with the SQLite backend.
+
+For each backend, in its own process (so RSS is not shared):
+- setup time (pandas: load + clean; SQLite: ingest into a file DB)
+- per-player query latency (filter + all metrics + format metrics)
+- resident memory after setup and after the queries
+
+Usage:
+    python backend/benchmarks/storage.py [--rows 1000000] [--players 500] [--queries 50]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from analytics.instrumentation import rss_bytes
+from analytics.synthetic import SyntheticDataGenerator
+
+FORMATS = ['odi', 'test', 't20i']
+
+
+def rss_mb() -> float:
+    """Current resident set size in MB."""
+    return rss_bytes() / (1024 * 1024)
+
+
+def run_backend(backend: str, csv_path: str, db_path: str, queries: int) -> Dict:
+    """
+    Benchmark one backend in the current process.
+
+    Args:
+        backend: "pandas" or "sqlite"
+        csv_path: Input CSV
+        db_path: SQLite file (sqlite backend only)
+        queries: Number of player queries
+
+    Returns:
+        Dictionary with setup time, query latencies and RSS
+    """
+    from analytics.data_loader import DataLoader
+    from analytics.metrics import MetricsCalculator
+    from analytics.sqlite_store import SQLiteDataLoader
+
+    start = time.perf_counter()
+    if backend == "pandas":
+        loader = DataLoader(csv_path)
+        cleaned = loader.clean_data(loader.load_data())
+        players = cleaned['player_name'].unique()[:queries]
+    else:
+        loader = SQLiteDataLoader(csv_path, db_path)
+        loader.ingest_csv()
+        # Drop the ingest working set; a server opens the built DB
+        loader.close()
+        loader = SQLiteDataLoader(csv_path, db_path)
+        players = loader.player_names()[:queries]
+    setup_seconds = time.perf_counter() - start
+    rss_after_setup = rss_mb()
+
+    latencies = []
+    for player in players:
+        start = time.perf_counter()
+        if backend == "pandas":
+            calculator = MetricsCalculator(loader.filter_by_player(cleaned, player))
+            calculator.calculate_all_metrics()
+            for format_type in FORMATS:
+                calculator.format_metrics(format_type)
+        else:
+            loader.calculate_all_metrics(player)
+            for format_type in FORMATS:
+                loader.format_metrics(player, format_type)
+        latencies.append(time.perf_counter() - start)
+
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        "backend": backend,
+        "setup_seconds": round(setup_seconds, 3),
+        "query_p50_ms": round(float(np.percentile(latencies_ms, 50)), 3),
+        "query_p99_ms": round(float(np.percentile(latencies_ms, 99)), 3),
+        "rss_after_setup_mb": round(rss_after_setup, 1),
+        "rss_after_queries_mb": round(rss_mb(), 1),
+    }
+
+
+def compare_backends(rows: int, players: int, queries: int) -> Dict[str, Dict]:
+    """
+    Run both backends on the same synthetic dataset, each in a fresh process.
+
+    Args:
+        rows: Dataset size
+        players: Distinct players in the dataset
+        queries: Player queries per backend
+
+    Returns:
+        Dictionary mapping backend to its results
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = str(Path(tmp) / "matches.csv")
+        db_path = str(Path(tmp) / "matches.db")
+        SyntheticDataGenerator(rows=rows, innings_per_player=max(1, rows // players)).write_csv(csv_path)
+
+        results = {}
+        for backend in ["pandas", "sqlite"]:
+            output = subprocess.run(
+                [sys.executable, __file__, "--worker", backend,
+                 "--csv", csv_path, "--db", db_path, "--queries", str(queries)],
+                capture_output=True, text=True, check=True
+            ).stdout
+            results[backend] = json.loads(output.strip().splitlines()[-1])
+        return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare pandas and SQLite storage")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--json", action="store_true", help="Print raw JSON results")
+    parser.add_argument("--worker", choices=["pandas", "sqlite"], help=argparse.SUPPRESS)
+    parser.add_argument("--csv", help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        # Child process: loader output goes to stdout first, result JSON last
+        print(json.dumps(run_backend(args.worker, args.csv, args.db, args.queries)))
+        sys.exit(0)
+
+    results = compare_backends(args.rows, args.players, args.queries)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print("=" * 60)
+        print(f"STORAGE BENCHMARK ({args.rows:,} rows, {args.players} players)")
+        print("=" * 60)
+        for backend, r in results.items():
+            print(f"\n {backend}:")
+            print(f"   setup: {r['setup_seconds']}s")
+            print(f"   query p50: {r['query_p50_ms']} ms  p99: {r['query_p99_ms']} ms")
+            print(f"   RSS after setup: {r['rss_after_setup_mb']} MB  "
+                  f"after queries: {r['rss_after_queries_mb']} MB")
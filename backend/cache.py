@@ -0,0 +1,284 @@
+"""
+RESPONSE CACHE
+==============
+In-memory cache for API responses (metrics JSON and chart PNGs).
+
+Features:
+- Keys: (endpoint, players, format, params) plus each player's data version
+- Bounded memory: LRU eviction by entry count and total body bytes
+- Optional TTL per cache
+- ETags for If-None-Match / 304 responses
+- Per-player invalidation when new matches are ingested
+- Hit, miss, eviction and invalidation counters
+- Per-player lookup counts, so a rebuilt cache can be pre-warmed with
+  the players requested most
+"""
+
+import hashlib
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+@dataclass
+class CacheEntry:
+    """One cached response body."""
+    body: bytes
+    media_type: str
+    etag: str
+    players: Tuple[str, ...]
+    expires_at: Optional[float]
+
+
+class ResponseCache:
+    """Thread-safe LRU response cache with TTL, ETags and player invalidation."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: Optional[float] = None
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached bodies
+            ttl: Seconds an entry stays valid (None = until invalidated)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._entries: "OrderedDict[tuple, CacheEntry]" = OrderedDict()
+        self._by_player: Dict[str, Set[tuple]] = {}
+        self._versions: Dict[str, int] = {}
+        self._lookups: Counter = Counter()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_etag(body: bytes) -> str:
+        """
+        Build a strong ETag from a response body.
+
+        Args:
+            body: Response bytes
+
+        Returns:
+            Quoted ETag string
+        """
+        return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+    @staticmethod
+    def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        """
+        Check an If-None-Match header against an ETag (RFC 7232 weak comparison).
+
+        Args:
+            if_none_match: Header value: "*" or a comma-separated list of
+                           tags, each optionally prefixed with W/
+            etag: Current ETag of the response
+
+        Returns:
+            True if the client's copy is current
+        """
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        current = etag[2:] if etag.startswith("W/") else etag
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            if tag == current:
+                return True
+        return False
+
+    def make_key(
+        self,
+        endpoint: str,
+        players: Iterable[str],
+        format_type: Optional[str] = None,
+        params: Optional[Dict] = None
+    ) -> tuple:
+        """
+        Build a cache key including the current version of each player.
+
+        Args:
+            endpoint: Endpoint name
+            players: Players the response depends on
+            format_type: Cricket format (optional)
+            params: Other query parameters (optional)
+
+        Returns:
+            Hashable cache key
+        """
+        players = tuple(players)
+        with self._lock:
+            versions = tuple(self._versions.get(p, 0) for p in players)
+        return (
+            endpoint,
+            players,
+            (format_type or "").lower(),
+            tuple(sorted((params or {}).items())),
+            versions,
+        )
+
+    def get(self, key: tuple) -> Optional[CacheEntry]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            CacheEntry, or None on a miss or expired entry
+        """
+        with self._lock:
+            self._lookups.update(key[1])
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: tuple, body: bytes, media_type: str = "application/json") -> CacheEntry:
+        """
+        Store a response, evicting least recently used entries if needed.
+
+        Args:
+            key: Key from make_key
+            body: Response bytes
+            media_type: Response content type
+
+        Returns:
+            The stored CacheEntry
+        """
+        entry = CacheEntry(
+            body=body,
+            media_type=media_type,
+            etag=self.make_etag(body),
+            players=key[1],
+            expires_at=time.monotonic() + self.ttl if self.ttl is not None else None,
+        )
+
+        # Too large to ever fit: hand it back without caching
+        if len(body) > self.max_bytes:
+            return entry
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += len(body)
+            for player in entry.players:
+                self._by_player.setdefault(player, set()).add(key)
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+        return entry
+
+    def invalidate_players(self, players: Iterable[str]) -> int:
+        """
+        Bump the data version of players and drop their entries.
+
+        Entries for other players are untouched.
+
+        Args:
+            players: Players whose data changed
+
+        Returns:
+            Number of entries dropped
+        """
+        dropped = 0
+        with self._lock:
+            for player in players:
+                self._versions[player] = self._versions.get(player, 0) + 1
+                for key in list(self._by_player.get(player, ())):
+                    self._remove(key)
+                    dropped += 1
+            self.invalidations += dropped
+        return dropped
+
+    def hot_players(self, n: int) -> List[str]:
+        """
+        Players whose responses were looked up most often.
+
+        Args:
+            n: Number of players
+
+        Returns:
+            Up to ``n`` player names, most requested first
+        """
+        with self._lock:
+            return [player for player, _ in self._lookups.most_common(n)]
+
+    def inherit_lookups(self, other: "ResponseCache"):
+        """
+        Start from another cache's lookup counts (when replacing it).
+
+        Args:
+            other: Cache being replaced
+        """
+        with other._lock:
+            counts = Counter(other._lookups)
+        with self._lock:
+            self._lookups.update(counts)
+
+    def clear(self):
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._by_player.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with sizes, hit rate and eviction counters
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: tuple):
+        """Remove one entry; caller must hold the lock."""
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.body)
+        for player in entry.players:
+            keys = self._by_player.get(player)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_player[player]
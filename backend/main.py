@@ -0,0 +1,586 @@
+"""
+FASTAPI APPLICATION
+===================
+Async HTTP API over the analytics layer.
+
+Endpoints:
+- GET /api/health
+- GET /api/players
+- GET /api/players/{name}/metrics
+- GET /api/players/{name}/formats
+- GET /api/players/{name}/chart-data
+- GET /api/players/{name}/charts/{chart_type}   (PNG)
+- GET /api/players/{name}/recent?n=10   (latest innings by date and form)
+- GET /api/compare?players=a,b&format=odi
+- GET /api/compare/batch?players=a,b,...&format=odi   (up to 50 players,
+  with differences, leaders and league percentile ranks)
+- GET /api/records?format=odi&limit=10   (league record lists)
+- POST /api/matches          (ingest new matches)
+- GET /api/cache/stats
+- GET /api/refresh           (data watcher: staleness, rebuild counts and duration)
+- GET /api/instrumentation   (per-stage timing histograms as JSON)
+- GET /metrics               (the same histograms in Prometheus text format)
+
+The dataset is loaded and cleaned once at startup and kept in app state.
+If ANALYTICS_SNAPSHOT points at a snapshot built by snapshot.py, the
+server opens that file instead and serves precomputed results.
+
+When serving the CSV, a background watcher (refresh.py) reloads it after
+it changes: the new service and a fresh response cache, pre-warmed with
+the most requested players' metrics and charts, are built off the
+request path and swapped in together on the event loop, so a request
+sees either the old dataset or the new one. Matches ingested through
+the API are not written to the CSV and do not survive a reload.
+Metric work runs on a bounded thread pool and chart rendering on a
+bounded process pool, so the event loop never blocks on pandas or
+Matplotlib.
+
+Pipeline stages are timed with analytics.instrumentation spans; chart
+requests record their full worker round trip as ``api.charts.<type>``
+(histograms inside the chart worker processes are not exported).
+
+Responses are cached (cache.py) and carry ETags; a matching
+If-None-Match gets a 304. Ingesting matches invalidates only the cached
+responses of the players involved.
+
+Configuration (environment variables):
+- ANALYTICS_DATA: CSV path (default: data/cricket_data.csv)
+- ANALYTICS_SNAPSHOT: Precomputed snapshot to serve from (default: none)
+- ANALYTICS_GRAPHS_DIR: Chart output directory (default: frontend/assets/graphs)
+- ANALYTICS_METRIC_WORKERS: Metric thread pool size (default: 4)
+- ANALYTICS_CHART_WORKERS: Chart process pool size (default: 2)
+- ANALYTICS_CACHE_ENTRIES: Maximum cached responses (default: 1024)
+- ANALYTICS_CACHE_MB: Maximum cached body size in MB (default: 64)
+- ANALYTICS_CACHE_TTL: Seconds before a cached response expires (default: none)
+- ANALYTICS_WATCH_INTERVAL: Seconds between checks of the CSV (default: 2, 0 disables)
+- ANALYTICS_PREWARM_PLAYERS: Most requested players warmed after a reload (default: 8)
+
+Run with:
+    uvicorn main:app --app-dir backend
+"""
+
+import asyncio
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+from fastapi import Body, FastAPI, HTTPException, Query, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, Response
+from pydantic import BaseModel
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from analytics.compare import PlayerNotFoundError
+from analytics.instrumentation import instrumentation, span
+from analytics.recent import CAPACITY as RECENT_CAPACITY, DEFAULT_WINDOW
+from cache import ResponseCache
+from refresh import DEFAULT_INTERVAL as DEFAULT_WATCH_INTERVAL, DataRefresher
+from service import AnalyticsService, CHART_TYPES, FORMATS, init_chart_worker, render_chart
+from snapshot import SnapshotService
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+DATA_PATH = os.environ.get("ANALYTICS_DATA", str(PROJECT_ROOT / "data" / "cricket_data.csv"))
+SNAPSHOT_PATH = os.environ.get("ANALYTICS_SNAPSHOT")
+GRAPHS_DIR = os.environ.get("ANALYTICS_GRAPHS_DIR", str(PROJECT_ROOT / "frontend" / "assets" / "graphs"))
+METRIC_WORKERS = int(os.environ.get("ANALYTICS_METRIC_WORKERS", "4"))
+CHART_WORKERS = int(os.environ.get("ANALYTICS_CHART_WORKERS", "2"))
+CACHE_ENTRIES = int(os.environ.get("ANALYTICS_CACHE_ENTRIES", "1024"))
+CACHE_MB = float(os.environ.get("ANALYTICS_CACHE_MB", "64"))
+CACHE_TTL = float(os.environ["ANALYTICS_CACHE_TTL"]) if os.environ.get("ANALYTICS_CACHE_TTL") else None
+WATCH_INTERVAL = float(os.environ.get("ANALYTICS_WATCH_INTERVAL", "2"))
+PREWARM_PLAYERS = int(os.environ.get("ANALYTICS_PREWARM_PLAYERS", "8"))
+
+
+class MatchRow(BaseModel):
+    """One ingested match in the cricket_data.csv schema (invalid rows get a 422)."""
+
+    player_name: str
+    runs: int
+    balls_faced: int
+    format: str
+    dismissal: str
+    fours: int
+    sixes: int
+    centuries: int
+    half_centuries: int
+    opponent: str
+    match_date: str
+
+# Most players one batch comparison may include
+MAX_COMPARE_PLAYERS = 50
+
+
+def new_cache() -> ResponseCache:
+    """An empty response cache with the configured limits."""
+    return ResponseCache(
+        max_entries=CACHE_ENTRIES,
+        max_bytes=int(CACHE_MB * 1024 * 1024),
+        ttl=CACHE_TTL
+    )
+
+
+def prewarm(app: FastAPI, service: AnalyticsService, cache: ResponseCache, players: List[str]) -> int:
+    """
+    Fill a cache with the per-player responses the API would compute.
+
+    Keys and bodies match what the endpoints store, so the first request
+    for a warmed player after a reload is a cache hit.
+
+    Args:
+        app: Application (for the chart pool)
+        service: Service the responses come from
+        cache: Cache to fill
+        players: Standardized player names, most important first
+
+    Returns:
+        Number of players warmed
+    """
+    warmed = 0
+    for player in players:
+        if player not in service.players:
+            continue
+        for endpoint, compute, params in [
+            ("metrics", service.player_metrics, None),
+            ("formats", service.format_breakdown, None),
+            ("chart-data", partial(service.chart_data, max_points=None), {"max_points": None}),
+            ("recent", partial(service.recent, n=DEFAULT_WINDOW), {"n": DEFAULT_WINDOW}),
+        ]:
+            body = json.dumps(compute(player)).encode()
+            cache.put(cache.make_key(endpoint, [player], None, params), body)
+
+        # Render every chart of the player at once on the chart pool
+        charts = {
+            chart_type: app.state.chart_pool.submit(
+                render_chart, service.chart_frame(player, chart_type), player, chart_type
+            )
+            for chart_type in CHART_TYPES
+        }
+        for chart_type, png in charts.items():
+            cache.put(cache.make_key(f"charts/{chart_type}", [player]), png.result(), "image/png")
+        warmed += 1
+    return warmed
+
+
+def rebuild_state(app: FastAPI):
+    """
+    Load the changed CSV and warm a new cache for it (refresher thread).
+
+    Returns:
+        Tuple of (AnalyticsService, ResponseCache) ready to install
+    """
+    service = AnalyticsService.from_csv(DATA_PATH)
+    cache = new_cache()
+    cache.inherit_lookups(app.state.cache)
+    hot = app.state.cache.hot_players(PREWARM_PLAYERS)
+    with span("refresh.prewarm") as s:
+        s.rows = prewarm(app, service, cache, hot)
+    return service, cache
+
+
+def install_state(app: FastAPI, loop: asyncio.AbstractEventLoop, state):
+    """
+    Swap in a rebuilt service and cache together (refresher thread).
+
+    The swap runs on the event loop, between requests' synchronous
+    steps, so no handler ever pairs the new service with the old cache.
+    """
+    service, cache = state
+
+    async def swap():
+        service.version = app.state.service.version + 1
+        app.state.service = service
+        app.state.cache = cache
+        app.state.inflight = {}
+
+    asyncio.run_coroutine_threadsafe(swap(), loop).result()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load the dataset once, create the worker pools and start the data watcher."""
+    loop = asyncio.get_running_loop()
+
+    app.state.metric_pool = ThreadPoolExecutor(
+        max_workers=METRIC_WORKERS, thread_name_prefix="metrics"
+    )
+    app.state.chart_pool = ProcessPoolExecutor(
+        max_workers=CHART_WORKERS,
+        initializer=init_chart_worker,
+        initargs=(GRAPHS_DIR,)
+    )
+    app.state.inflight = {}
+    app.state.cache = new_cache()
+    app.state.refresher = None
+    if SNAPSHOT_PATH:
+        app.state.service = SnapshotService(SNAPSHOT_PATH)
+    else:
+        # Created before loading, so a change during the load is picked up
+        app.state.refresher = DataRefresher(
+            DATA_PATH,
+            rebuild=partial(rebuild_state, app),
+            install=partial(install_state, app, loop),
+            interval=WATCH_INTERVAL or DEFAULT_WATCH_INTERVAL
+        )
+        app.state.service = await loop.run_in_executor(
+            app.state.metric_pool, AnalyticsService.from_csv, DATA_PATH
+        )
+        if WATCH_INTERVAL > 0:
+            app.state.refresher.start()
+
+    try:
+        yield
+    finally:
+        if app.state.refresher is not None:
+            # Off the loop: a rebuild in progress may still need it to install
+            await loop.run_in_executor(None, app.state.refresher.stop)
+        app.state.metric_pool.shutdown(wait=False, cancel_futures=True)
+        app.state.chart_pool.shutdown(wait=False, cancel_futures=True)
+        if isinstance(app.state.service, SnapshotService):
+            app.state.service.close()
+
+
+app = FastAPI(title="Player Performance Analytics", version="1.0.0", lifespan=lifespan)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["*"],
+    expose_headers=["ETag"],
+)
+
+
+async def run_metric(request: Request, func, *args):
+    """
+    Run a metric calculation on the metric thread pool.
+
+    Unknown players (PlayerNotFoundError) become 404 responses; any other
+    error is a server error, not a missing resource.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(request.app.state.metric_pool, partial(func, *args))
+    except PlayerNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+def validate_format(format_type: Optional[str]):
+    """
+    Reject unknown formats with a 400 before they reach the service or cache key.
+
+    Args:
+        format_type: Format from the request (None means all formats)
+    """
+    if format_type is not None and format_type.lower() not in FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown format '{format_type}'. Available: {', '.join(FORMATS)}"
+        )
+
+
+def normalize_players(service, names: List[str]) -> List[str]:
+    """
+    Standardize player names and reject unknown ones with a 404.
+
+    Args:
+        service: Analytics service
+        names: Player names from the request
+
+    Returns:
+        Standardized player names
+    """
+    try:
+        return [service.resolve_player(name) for name in names]
+    except PlayerNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+async def cached_response(
+    request: Request,
+    endpoint: str,
+    players: List[str],
+    compute,
+    format_type: Optional[str] = None,
+    params: Optional[Dict] = None,
+    media_type: str = "application/json"
+) -> Response:
+    """
+    Serve a response from the cache, computing and storing it on a miss.
+
+    Args:
+        request: Incoming request (for If-None-Match and app state)
+        endpoint: Endpoint name used in the cache key
+        players: Standardized players the response depends on
+        compute: Coroutine function producing the body (dict or bytes)
+        format_type: Cricket format in the key (optional)
+        params: Other parameters in the key (optional)
+        media_type: Content type of the body
+
+    Returns:
+        200 response with ETag, or 304 if the client's copy is current
+    """
+    cache: ResponseCache = request.app.state.cache
+    key = cache.make_key(endpoint, players, format_type, params)
+
+    entry = cache.get(key)
+    if entry is None:
+        # Concurrent misses for the same key share one computation
+        inflight = request.app.state.inflight
+        if key in inflight:
+            entry = await asyncio.shield(inflight[key])
+        else:
+            future = asyncio.get_running_loop().create_future()
+            inflight[key] = future
+            try:
+                result = await compute()
+                body = result if isinstance(result, bytes) else json.dumps(result).encode()
+                entry = cache.put(key, body, media_type)
+                future.set_result(entry)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+                # Mark retrieved so an unawaited failure is not logged
+                future.exception()
+                raise
+            finally:
+                del inflight[key]
+
+    if cache.etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers={"ETag": entry.etag})
+    return Response(content=entry.body, media_type=entry.media_type, headers={"ETag": entry.etag})
+
+
+@app.get("/api/health")
+async def health(request: Request):
+    """Report service status and dataset size."""
+    service = request.app.state.service
+    return {
+        "status": "ok",
+        "rows": service.row_count,
+        "players": len(service.player_names()),
+        "dataset_version": service.version,
+    }
+
+
+@app.get("/api/players")
+async def list_players(request: Request):
+    """List all players in the dataset."""
+    return {"players": request.app.state.service.player_names()}
+
+
+@app.get("/api/players/{player_name}/metrics")
+async def player_metrics(request: Request, player_name: str):
+    """All career metrics for a player."""
+    service = request.app.state.service
+    players = normalize_players(service, [player_name])
+    return await cached_response(
+        request, "metrics", players,
+        lambda: run_metric(request, service.player_metrics, player_name)
+    )
+
+
+@app.get("/api/players/{player_name}/formats")
+async def player_formats(request: Request, player_name: str):
+    """Per-format metrics (ODI, Test, T20I) for a player."""
+    service = request.app.state.service
+    players = normalize_players(service, [player_name])
+    return await cached_response(
+        request, "formats", players,
+        lambda: run_metric(request, service.format_breakdown, player_name)
+    )
+
+
+@app.get("/api/players/{player_name}/chart-data")
+async def player_chart_data(
+    request: Request,
+    player_name: str,
+    max_points: Optional[int] = Query(None, ge=3)
+):
+    """Career progression series as JSON (downsampled for long careers)."""
+    service = request.app.state.service
+    players = normalize_players(service, [player_name])
+    return await cached_response(
+        request, "chart-data", players,
+        lambda: run_metric(request, service.chart_data, player_name, max_points),
+        params={"max_points": max_points}
+    )
+
+
+@app.get("/api/players/{player_name}/recent")
+async def player_recent(
+    request: Request,
+    player_name: str,
+    n: int = Query(DEFAULT_WINDOW, ge=1, le=RECENT_CAPACITY, description="Innings in the window")
+):
+    """Latest innings by match date with recent average, strike rate and trend."""
+    service = request.app.state.service
+    players = normalize_players(service, [player_name])
+    return await cached_response(
+        request, "recent", players,
+        lambda: run_metric(request, service.recent, player_name, n),
+        params={"n": n}
+    )
+
+
+@app.get("/api/players/{player_name}/charts/{chart_type}")
+async def player_chart(request: Request, player_name: str, chart_type: str):
+    """Render a chart (or the combined report) as PNG."""
+    if chart_type not in CHART_TYPES:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown chart type '{chart_type}'. Available: {', '.join(CHART_TYPES)}"
+        )
+
+    # Validate the player here so unknown names never reach a worker
+    service = request.app.state.service
+    players = normalize_players(service, [player_name])
+
+    async def render():
+        loop = asyncio.get_running_loop()
+        with span(f"api.charts.{chart_type}") as s:
+            png = await loop.run_in_executor(
+                request.app.state.chart_pool, render_chart,
+                service.chart_frame(player_name, chart_type), player_name, chart_type
+            )
+            s.bytes = len(png)
+        return png
+
+    return await cached_response(
+        request, f"charts/{chart_type}", players, render, media_type="image/png"
+    )
+
+
+@app.get("/api/compare")
+async def compare_players(
+    request: Request,
+    players: str = Query(..., description="Comma-separated player names"),
+    format: Optional[str] = Query(None, description="odi, test or t20i")
+):
+    """Metrics for several players side by side."""
+    names = [name for name in players.split(",") if name.strip()]
+    if len(names) < 2:
+        raise HTTPException(status_code=400, detail="Provide at least two players to compare")
+    validate_format(format)
+
+    service = request.app.state.service
+    normalized = normalize_players(service, names)
+    return await cached_response(
+        request, "compare", normalized,
+        lambda: run_metric(request, service.compare, names, format),
+        format_type=format
+    )
+
+
+@app.get("/api/compare/batch")
+async def compare_batch(
+    request: Request,
+    players: str = Query(..., description="Comma-separated player names; the first is the baseline"),
+    format: Optional[str] = Query(None, description="odi, test or t20i")
+):
+    """Compare up to 50 players with differences and league percentile ranks."""
+    names = [name for name in players.split(",") if name.strip()]
+    if not 2 <= len(names) <= MAX_COMPARE_PLAYERS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Provide between 2 and {MAX_COMPARE_PLAYERS} players to compare"
+        )
+    validate_format(format)
+
+    service = request.app.state.service
+    normalized = normalize_players(service, names)
+    # Percentile ranks depend on every player, so any ingest changes the key
+    return await cached_response(
+        request, "compare-batch", normalized,
+        lambda: run_metric(request, service.compare_batch, normalized, format),
+        format_type=format,
+        params={"dataset_version": service.version}
+    )
+
+
+@app.get("/api/records")
+async def league_records(
+    request: Request,
+    format: Optional[str] = Query(None, description="odi, test, t20i or overall"),
+    limit: Optional[int] = Query(None, ge=1, description="Entries per record list")
+):
+    """Highest scores, most sixes/fours, best strike rates and most centuries."""
+    if format is not None and format.lower() not in FORMATS + ["overall"]:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown format '{format}'. Available: {', '.join(FORMATS)}, overall"
+        )
+
+    service = request.app.state.service
+    # Records span every player, so any ingest changes the key
+    return await cached_response(
+        request, "records", [],
+        lambda: run_metric(request, service.records, format, limit),
+        format_type=format,
+        params={"limit": limit, "dataset_version": service.version}
+    )
+
+
+@app.post("/api/matches")
+async def ingest_matches(request: Request, matches: List[MatchRow] = Body(...)):
+    """
+    Ingest newly played matches.
+
+    Every row must have all columns with the right types, or the request
+    is rejected with a 422. Only the cached responses of the affected
+    players are invalidated.
+    """
+    service = request.app.state.service
+    loop = asyncio.get_running_loop()
+    rows = pd.DataFrame([match.model_dump() for match in matches])
+    try:
+        affected = await loop.run_in_executor(request.app.state.metric_pool, service.ingest, rows)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    dropped = request.app.state.cache.invalidate_players(affected)
+    return {
+        "players": affected,
+        "dataset_version": service.version,
+        "cache_entries_dropped": dropped,
+    }
+
+
+@app.get("/api/cache/stats")
+async def cache_stats(request: Request):
+    """Cache hit rate, size and eviction counters."""
+    return request.app.state.cache.stats()
+
+
+@app.get("/api/refresh")
+async def refresh_stats(request: Request):
+    """Data watcher state: staleness, data age, rebuild counts and duration."""
+    refresher = request.app.state.refresher
+    if refresher is None:
+        return {"enabled": False}
+    return {"enabled": True, **refresher.stats()}
+
+
+@app.get("/api/instrumentation")
+async def instrumentation_stats():
+    """Per-stage timing histograms, row and byte totals."""
+    return {"enabled": instrumentation.enabled, "stages": instrumentation.stages()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics(request: Request):
+    """Per-stage timing histograms (and data refresh gauges) in Prometheus text format."""
+    text = instrumentation.to_prometheus()
+    if request.app.state.refresher is not None:
+        text += request.app.state.refresher.to_prometheus()
+    return PlainTextResponse(text, media_type="text/plain; version=0.0.4")
@@ -0,0 +1,215 @@
+"""
+DATA REFRESH
+============
+Watches the data source and swaps in rebuilt state off the request path.
+
+Features:
+- Polls the file's modification time and size on a background thread;
+  a change must hold for one poll interval before it is acted on, so a
+  file that is still being written is not read half-way
+- Rebuilds on that thread (load, clean, derived structures, cache
+  pre-warming are all up to the caller's ``rebuild``), then hands the
+  result to ``install``, which swaps it in as a whole
+- A failed rebuild is logged and counted; the previous state keeps
+  serving until the file changes again
+- Rebuild durations go to the ``refresh.rebuild`` instrumentation stage;
+  staleness, data age and counters are exported as gauges
+
+The file is only compared by stat signature, so replacing it with an
+atomic rename (write elsewhere, then move into place) is the safest way
+to update it.
+"""
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from analytics.instrumentation import span
+
+logger = logging.getLogger(__name__)
+
+# Seconds between checks of the data file
+DEFAULT_INTERVAL = 2.0
+
+
+class DataRefresher:
+    """Rebuilds state when a file changes and installs it atomically."""
+
+    def __init__(
+        self,
+        path: str,
+        rebuild: Callable[[], Any],
+        install: Callable[[Any], None],
+        interval: float = DEFAULT_INTERVAL
+    ):
+        """
+        Start tracking a file (create this before the initial load, so a
+        change during that load is not missed).
+
+        Args:
+            path: Data file to watch
+            rebuild: Builds the complete new state from the file
+            install: Swaps the new state in; must make it visible all at once
+            interval: Seconds between checks
+        """
+        self.path = Path(path)
+        self.interval = interval
+        self._rebuild = rebuild
+        self._install = install
+
+        self._loaded = self._signature()
+        self._seen = self._loaded
+        self._failed: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.loaded_at = time.time()
+        self.rebuilding = False
+        self.rebuilds = 0
+        self.failures = 0
+        self.last_seconds: Optional[float] = None
+
+    def _signature(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of the file, or None if it is missing."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def start(self):
+        """Check the file every ``interval`` seconds on a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="data-refresh", daemon=True)
+        self._thread.start()
+        logger.info("Watching %s every %.1fs", self.path, self.interval)
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Stop watching (waits for a running rebuild to finish).
+
+        Args:
+            timeout: Seconds to wait for the thread (None waits indefinitely)
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Checking %s failed", self.path)
+
+    def check(self) -> bool:
+        """
+        One poll: rebuild if the file changed and has since settled.
+
+        Returns:
+            True if new state was installed
+        """
+        signature = self._signature()
+        if signature is None or signature == self._loaded or signature == self._failed:
+            self._seen = signature
+            return False
+        if signature != self._seen:
+            # Still being written (or just changed): look again next time
+            self._seen = signature
+            return False
+        return self.refresh(signature)
+
+    def refresh(self, signature: Optional[Tuple[int, int]] = None) -> bool:
+        """
+        Rebuild and install now, whether or not the file changed.
+
+        Args:
+            signature: File signature the rebuild reads (default: current)
+
+        Returns:
+            True if new state was installed, False if the rebuild failed
+        """
+        with self._lock:
+            if signature is None:
+                signature = self._signature()
+            self.rebuilding = True
+            start = time.perf_counter()
+            try:
+                with span("refresh.rebuild"):
+                    state = self._rebuild()
+                self._install(state)
+            except Exception:
+                self.failures += 1
+                self._failed = signature
+                logger.exception("Rebuilding from %s failed; still serving the previous data", self.path)
+                return False
+            finally:
+                self.rebuilding = False
+
+            self.last_seconds = time.perf_counter() - start
+            self._loaded = signature
+            self._failed = None
+            self.loaded_at = time.time()
+            self.rebuilds += 1
+        logger.info("Reloaded %s in %.2fs", self.path, self.last_seconds)
+        return True
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get refresh state and counters.
+
+        Returns:
+            Dictionary with stale flag, stale_seconds (how long the file
+            has been newer than the served data), data_age_seconds,
+            rebuild counters and the last rebuild duration
+        """
+        signature = self._signature()
+        now = time.time()
+        stale = signature is not None and signature != self._loaded
+        return {
+            "path": str(self.path),
+            "watching": self._thread is not None,
+            "interval": self.interval,
+            "stale": stale,
+            "stale_seconds": round(max(now - signature[0] / 1e9, 0.0), 3) if stale else 0.0,
+            "data_age_seconds": round(now - self.loaded_at, 3),
+            "rebuilding": self.rebuilding,
+            "rebuilds": self.rebuilds,
+            "failures": self.failures,
+            "last_rebuild_seconds": round(self.last_seconds, 3) if self.last_seconds is not None else None,
+        }
+
+    def to_prometheus(self, prefix: str = "analytics_refresh") -> str:
+        """
+        Export the refresh state in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Text with staleness and duration gauges and rebuild counters
+        """
+        stats = self.stats()
+        metrics = [
+            ("stale_seconds", "gauge", "Seconds the data file has been newer than the served data.",
+             stats["stale_seconds"]),
+            ("data_age_seconds", "gauge", "Seconds since the served data was loaded.",
+             stats["data_age_seconds"]),
+            ("last_rebuild_seconds", "gauge", "Duration of the last successful rebuild.",
+             stats["last_rebuild_seconds"] or 0.0),
+            ("rebuilds_total", "counter", "Successful rebuilds since startup.", stats["rebuilds"]),
+            ("failures_total", "counter", "Failed rebuilds since startup.", stats["failures"]),
+        ]
+        lines = []
+        for name, kind, help_text, value in metrics:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            lines.append(f"{prefix}_{name} {value}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,401 @@
+"""
+ANALYTICS SERVICE
+=================
+Holds the cleaned dataset in memory and answers analytics queries.
+
+The CSV is loaded and cleaned exactly once, then split into one frame
+per player, so requests never reload the file or rescan the full
+dataset. All methods are synchronous and CPU-bound; the API layer
+(main.py) runs them on worker pools so the event loop never blocks.
+"""
+
+import logging
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from analytics.data_loader import DataLoader
+from analytics.metrics import MetricsCalculator
+from analytics.chart_data import career_progression_series
+from analytics.compare import LeagueTable, PlayerNotFoundError
+from analytics.recent import DEFAULT_WINDOW, RecentInningsStore, runs_by_date
+from analytics.records import RecordsIndex
+from analytics.synthetic import COLUMNS
+
+logger = logging.getLogger(__name__)
+
+
+FORMATS = ['odi', 'test', 't20i']
+
+CHART_TYPES = ['last_10_matches', 'runs_distribution', 'career_progression', 'report']
+
+# Ingested values in these columns must parse as numbers
+NUMERIC_COLUMNS = ['runs', 'balls_faced', 'fours', 'sixes', 'centuries', 'half_centuries']
+
+
+class AnalyticsService:
+    """Serves metrics and charts from a dataset loaded once at startup."""
+
+    def __init__(self, cleaned_data: pd.DataFrame, csv_path: Optional[str] = None):
+        """
+        Initialize service from already-cleaned data.
+
+        Args:
+            cleaned_data: Output of DataLoader.clean_data
+            csv_path: Source file the data came from (informational)
+        """
+        self.csv_path = csv_path
+        self.data = cleaned_data
+        self.version = 0
+        self._ingest_lock = threading.Lock()
+
+        # Pre-split by player so lookups are a dict access, not a scan
+        self.players: Dict[str, pd.DataFrame] = {
+            name: frame for name, frame in cleaned_data.groupby('player_name', sort=False)
+        }
+
+        # League table for comparisons, built on first use
+        self._league: Optional[LeagueTable] = None
+        self._league_lock = threading.Lock()
+
+        # Record lists are built up front so the records page never scans
+        self._records = RecordsIndex.from_frame(cleaned_data)
+        self._records_lock = threading.Lock()
+
+        # Latest innings per player for form views and last-N charts
+        self._recent = RecentInningsStore.from_frame(cleaned_data)
+
+    @classmethod
+    def from_csv(cls, csv_path: str) -> "AnalyticsService":
+        """
+        Load and clean a CSV file, then build the service.
+
+        Args:
+            csv_path: Path to cricket data CSV file
+
+        Returns:
+            AnalyticsService holding the cleaned dataset
+        """
+        loader = DataLoader(csv_path)
+        cleaned = loader.clean_data(loader.load_data())
+        return cls(cleaned, csv_path=str(csv_path))
+
+    def ingest(self, new_rows: pd.DataFrame) -> List[str]:
+        """
+        Add newly played matches to the in-memory dataset.
+
+        New rows are cleaned with the same rules as the CSV, rows with a
+        non-numeric value in a numeric column are dropped, rows already
+        present for a player are skipped, and only the affected players'
+        frames are rebuilt. Ingests are serialized. Every derived structure
+        is built before any of them is swapped in, so a failed ingest
+        leaves the service unchanged and concurrent readers never see a
+        partial one.
+
+        Args:
+            new_rows: Raw match rows in the cricket_data.csv schema
+
+        Returns:
+            Sorted list of players whose data changed
+
+        Raises:
+            ValueError: If a column of the schema is missing
+        """
+        if len(new_rows) == 0:
+            return []
+        missing = [column for column in COLUMNS if column not in new_rows.columns]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+        # clean_data only fills or drops values that are missing to begin
+        # with, so a value that fails to parse would otherwise become NaN
+        unparsable = new_rows[NUMERIC_COLUMNS].apply(pd.to_numeric, errors='coerce').isna() \
+            & new_rows[NUMERIC_COLUMNS].notna()
+        invalid = unparsable.any(axis=1)
+        if invalid.any():
+            logger.warning("Dropping %d ingested rows with non-numeric values", int(invalid.sum()))
+            new_rows = new_rows[~invalid]
+        cleaned = DataLoader().clean_data(new_rows)
+
+        # Concurrent ingests (metric pool threads) would otherwise lose
+        # each other's rows in the read-modify-write below
+        with self._ingest_lock:
+            updated: Dict[str, pd.DataFrame] = {}
+            added = []
+            for name, rows in cleaned.groupby('player_name', sort=False):
+                existing = self.players.get(name)
+                if existing is None:
+                    combined = rows
+                else:
+                    combined = pd.concat([existing, rows])
+                    combined = combined[~combined.duplicated()]
+                fresh = combined.iloc[0 if existing is None else len(existing):]
+                if len(fresh) == 0:
+                    continue
+                updated[name] = combined
+                added.append(fresh)
+            if not added:
+                return []
+
+            fresh = pd.concat(added)
+            data = pd.concat([self.data, fresh], ignore_index=True)
+            records = self._records.copy()
+            records.add(fresh)
+            with self._league_lock:
+                # Only the affected players are re-aggregated
+                league = self._league.updated(updated) if self._league is not None else None
+                # Validates every row before touching a buffer, so this is
+                # the last step that can fail
+                self._recent.add(fresh)
+
+                self.players.update(updated)
+                self.data = data
+                with self._records_lock:
+                    self._records = records
+                self._league = league
+                self.version += 1
+        return sorted(updated)
+
+    @property
+    def row_count(self) -> int:
+        """Number of cleaned rows in the dataset."""
+        return len(self.data)
+
+    def player_names(self) -> List[str]:
+        """
+        List all players in the dataset.
+
+        Returns:
+            Sorted list of standardized player names
+        """
+        return sorted(self.players)
+
+    def resolve_player(self, player_name: str) -> str:
+        """
+        Standardize a player name and check it exists.
+
+        Args:
+            player_name: Name of player (case-insensitive)
+
+        Returns:
+            Standardized player name
+
+        Raises:
+            PlayerNotFoundError: If player not found in data
+        """
+        search_name = player_name.lower().strip()
+        if search_name not in self.players:
+            raise PlayerNotFoundError(
+                f"Player '{player_name}' not found. "
+                f"Available players: {', '.join(self.player_names())}"
+            )
+        return search_name
+
+    def player_data(self, player_name: str) -> pd.DataFrame:
+        """
+        Get the match data for one player.
+
+        Args:
+            player_name: Name of player (case-insensitive)
+
+        Returns:
+            DataFrame with the player's matches
+
+        Raises:
+            PlayerNotFoundError: If player not found in data
+        """
+        return self.players[self.resolve_player(player_name)]
+
+    def player_metrics(self, player_name: str) -> Dict:
+        """
+        Calculate all career metrics for a player.
+
+        Args:
+            player_name: Name of player
+
+        Returns:
+            Dictionary with all metrics
+        """
+        return MetricsCalculator(self.player_data(player_name)).calculate_all_metrics()
+
+    def format_breakdown(self, player_name: str) -> Dict[str, Dict]:
+        """
+        Calculate per-format metrics for a player.
+
+        Args:
+            player_name: Name of player
+
+        Returns:
+            Dictionary mapping format to its metrics
+        """
+        calculator = MetricsCalculator(self.player_data(player_name))
+        return {format_type: calculator.format_metrics(format_type) for format_type in FORMATS}
+
+    def chart_data(self, player_name: str, max_points: Optional[int] = None) -> Dict:
+        """
+        Get the career progression series as JSON-ready data.
+
+        Args:
+            player_name: Name of player
+            max_points: Point budget for downsampling (None uses the default)
+
+        Returns:
+            Dictionary with match numbers and cumulative averages, in
+            match_date order
+        """
+        runs = runs_by_date(self.player_data(player_name))
+        if max_points is None:
+            return career_progression_series(runs)
+        return career_progression_series(runs, max_points)
+
+    def recent(self, player_name: str, n: int = DEFAULT_WINDOW) -> Dict:
+        """
+        A player's most recent innings by date and their form metrics.
+
+        Served from the recent-innings ring buffers, never the full data.
+
+        Args:
+            player_name: Name of player
+            n: Number of innings (at most the buffer capacity)
+
+        Returns:
+            Dictionary with player_name, innings (oldest first) and form
+        """
+        name = self.resolve_player(player_name)
+        return {
+            "player_name": name,
+            "innings": self._recent.innings(name, n),
+            "form": self._recent.form(name, n),
+        }
+
+    def chart_frame(self, player_name: str, chart_type: str) -> pd.DataFrame:
+        """
+        The rows a chart needs, so workers receive as little as possible.
+
+        Args:
+            player_name: Name of player
+            chart_type: One of CHART_TYPES
+
+        Returns:
+            The latest 10 innings for last_10_matches, otherwise all of
+            the player's matches
+        """
+        name = self.resolve_player(player_name)
+        if chart_type == 'last_10_matches':
+            return self._recent.frame(name, 10)
+        return self.players[name]
+
+    def league(self) -> LeagueTable:
+        """
+        Get the league table, aggregating the whole dataset on first use.
+
+        Returns:
+            LeagueTable for every player
+        """
+        with self._league_lock:
+            if self._league is None:
+                self._league = LeagueTable.from_frame(self.data)
+            return self._league
+
+    def compare(self, player_names: List[str], format_type: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Calculate metrics for several players side by side.
+
+        Args:
+            player_names: Players to compare
+            format_type: Restrict to one format (optional)
+
+        Returns:
+            Dictionary mapping player name to metrics
+        """
+        league = self.league()
+        results = {}
+        for player_name in player_names:
+            name = self.resolve_player(player_name)
+            if format_type:
+                results[name] = league.format_metrics[name].get(format_type.lower(), {
+                    "matches": 0, "runs": 0, "average": 0.0, "strike_rate": 0.0, "centuries": 0
+                })
+            else:
+                results[name] = league.metrics[name]
+        return results
+
+    def compare_batch(self, player_names: List[str], format_type: Optional[str] = None) -> Dict:
+        """
+        Compare players against each other and the whole league.
+
+        Args:
+            player_names: Players to compare; the first is the baseline
+            format_type: Compare one format's metrics (optional)
+
+        Returns:
+            LeagueTable.compare result
+
+        Raises:
+            PlayerNotFoundError: If a player is unknown
+            ValueError: If the format is unknown
+        """
+        names = [self.resolve_player(name) for name in player_names]
+        return self.league().compare(names, format_type)
+
+    def records(self, format_type: Optional[str] = None, limit: Optional[int] = None) -> Dict:
+        """
+        League record lists for one format or overall.
+
+        Args:
+            format_type: odi, test or t20i (None or "overall" for all formats)
+            limit: Entries per list (optional)
+
+        Returns:
+            RecordsIndex.records result
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        with self._records_lock:
+            return self._records.records(format_type, limit)
+
+
+# Chart rendering runs in worker processes (pyplot is not thread-safe).
+# Workers receive only the (small) player frame, so ingested matches are
+# always reflected without reloading anything in the worker.
+_worker_generator = None
+
+
+def init_chart_worker(output_dir: str):
+    """
+    Initialize a chart worker process.
+
+    Args:
+        output_dir: GraphGenerator output directory (API charts are
+                    rendered in memory and never written there)
+    """
+    global _worker_generator
+    from analytics.graphs import GraphGenerator
+
+    _worker_generator = GraphGenerator(output_dir)
+
+
+def render_chart(player_data: pd.DataFrame, player_name: str, chart_type: str) -> bytes:
+    """
+    Render one chart in a worker process.
+
+    Args:
+        player_data: DataFrame with player's match data
+        player_name: Name of player
+        chart_type: One of CHART_TYPES
+
+    Returns:
+        PNG bytes of the rendered chart
+    """
+    if chart_type not in CHART_TYPES:
+        raise ValueError(f"Unknown chart type '{chart_type}'. Available: {', '.join(CHART_TYPES)}")
+
+    name = player_name.lower().strip()
+    return _worker_generator.to_png(chart_type, player_data, name, include_formats=True)
@@ -0,0 +1,410 @@
+"""
+ANALYTICS SNAPSHOT
+==================
+Precomputes every player's analytics into one SQLite file.
+
+Build (offline):
+    python backend/snapshot.py build --data data/cricket_data.csv --out data/analytics.snapshot
+
+Serve: set ANALYTICS_SNAPSHOT=data/analytics.snapshot and start the API.
+Cold start is then "open one file" instead of "parse CSV and compute".
+
+Snapshot layout (one row per player, indexed by player_name):
+- metrics:    calculate_all_metrics output (JSON)
+- formats:    per-format metrics (JSON)
+- chart_data: career progression series at the default point budget (JSON)
+- runs, formats_raw: innings runs and formats (compact binary), so charts
+  and custom-budget series can still be drawn without the CSV
+- recent:     latest innings by date, as kept by the recent-innings store (JSON)
+
+League record lists (records.py) are stored per format in the meta table.
+
+The file is opened read-only and memory-mapped, so reads are served
+straight from the page cache without any pandas work.
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from analytics.chart_data import career_progression_series
+from analytics.compare import LeagueTable, PlayerNotFoundError
+from analytics.recent import CAPACITY as RECENT_CAPACITY, DEFAULT_WINDOW, date_order, recent_form
+from analytics.records import FORMATS as RECORD_FORMATS, OVERALL
+
+SNAPSHOT_FORMAT_VERSION = 4
+
+# Bytes of the snapshot SQLite may memory-map
+MMAP_SIZE = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE players (
+    player_name TEXT PRIMARY KEY,
+    metrics TEXT NOT NULL,
+    formats TEXT NOT NULL,
+    chart_data TEXT NOT NULL,
+    runs BLOB NOT NULL,
+    formats_raw TEXT NOT NULL,
+    recent TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def _dumps(value) -> str:
+    """Compact JSON encoding."""
+    return json.dumps(value, separators=(',', ':'))
+
+
+def build_snapshot(csv_path: str, out_path: str) -> Dict[str, float]:
+    """
+    Precompute all player analytics and write them to a snapshot file.
+
+    The file is written next to ``out_path`` and renamed into place, so a
+    running server never sees a half-written snapshot.
+
+    Args:
+        csv_path: Path to cricket data CSV file
+        out_path: Snapshot file to create
+
+    Returns:
+        Dictionary with player/row counts, build time and file size
+    """
+    from service import AnalyticsService
+
+    start = time.perf_counter()
+    service = AnalyticsService.from_csv(csv_path)
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(_SCHEMA)
+        rows = []
+        for name in service.player_names():
+            # Stored in match_date order, so charts built from it agree
+            # with the live service without needing the dates
+            player_data = service.player_data(name)
+            player_data = player_data.iloc[date_order(player_data)]
+            rows.append((
+                name,
+                _dumps(service.player_metrics(name)),
+                _dumps(service.format_breakdown(name)),
+                _dumps(service.chart_data(name)),
+                player_data['runs'].to_numpy(dtype=np.int32).tobytes(),
+                _dumps(player_data['format'].str.lower().tolist()),
+                _dumps(service.recent(name, RECENT_CAPACITY)["innings"]),
+            ))
+        conn.executemany("INSERT INTO players VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ("format_version", str(SNAPSHOT_FORMAT_VERSION)),
+            ("source", str(csv_path)),
+            ("rows", str(service.row_count)),
+            ("built_at", time.strftime("%Y-%m-%dT%H:%M:%S")),
+            ("records", _dumps({
+                format_type: service.records(format_type)
+                for format_type in RECORD_FORMATS + [OVERALL]
+            })),
+        ])
+        conn.commit()
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    tmp_path.replace(out_path)
+
+    return {
+        "players": len(rows),
+        "rows": service.row_count,
+        "build_seconds": round(time.perf_counter() - start, 3),
+        "bytes": out_path.stat().st_size,
+    }
+
+
+class SnapshotService:
+    """Read-only AnalyticsService counterpart backed by a snapshot file."""
+
+    def __init__(self, snapshot_path: str):
+        """
+        Open a snapshot.
+
+        Args:
+            snapshot_path: Path written by build_snapshot
+
+        Raises:
+            FileNotFoundError: If the snapshot doesn't exist
+            ValueError: If the snapshot was built by an incompatible version
+        """
+        self.snapshot_path = Path(snapshot_path)
+        if not self.snapshot_path.exists():
+            raise FileNotFoundError(f"Snapshot not found: {self.snapshot_path}")
+
+        self.conn = sqlite3.connect(
+            f"file:{self.snapshot_path}?mode=ro", uri=True, check_same_thread=False
+        )
+        self.conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        # One connection is shared by the metric threads
+        self._lock = threading.Lock()
+
+        meta = dict(self.conn.execute("SELECT key, value FROM meta"))
+        if int(meta.get("format_version", 0)) != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f"Snapshot format {meta.get('format_version')} is not supported "
+                f"(expected {SNAPSHOT_FORMAT_VERSION}); rebuild the snapshot"
+            )
+        self.csv_path = meta.get("source")
+        self.row_count = int(meta["rows"])
+        self.version = 0
+
+        # Player list is tiny; keep it in memory for lookups
+        self._names = [name for (name,) in self.conn.execute(
+            "SELECT player_name FROM players ORDER BY player_name"
+        )]
+        self._name_set = set(self._names)
+        self._league: Optional[LeagueTable] = None
+        self._records: Dict[str, Dict] = json.loads(meta["records"])
+
+    def player_names(self) -> List[str]:
+        """
+        List all players in the snapshot.
+
+        Returns:
+            Sorted list of standardized player names
+        """
+        return list(self._names)
+
+    def resolve_player(self, player_name: str) -> str:
+        """
+        Standardize a player name and check it exists.
+
+        Args:
+            player_name: Name of player (case-insensitive)
+
+        Returns:
+            Standardized player name
+
+        Raises:
+            PlayerNotFoundError: If player not found in snapshot
+        """
+        search_name = player_name.lower().strip()
+        if search_name not in self._name_set:
+            raise PlayerNotFoundError(
+                f"Player '{player_name}' not found. "
+                f"Available players: {', '.join(self._names)}"
+            )
+        return search_name
+
+    def _column(self, player_name: str, column: str):
+        """Read one column of a player's row."""
+        name = self.resolve_player(player_name)
+        with self._lock:
+            (value,) = self.conn.execute(
+                f"SELECT {column} FROM players WHERE player_name = ?", (name,)
+            ).fetchone()
+        return value
+
+    def player_metrics(self, player_name: str) -> Dict:
+        """Precomputed calculate_all_metrics output."""
+        return json.loads(self._column(player_name, "metrics"))
+
+    def format_breakdown(self, player_name: str) -> Dict[str, Dict]:
+        """Precomputed per-format metrics."""
+        return json.loads(self._column(player_name, "formats"))
+
+    def chart_data(self, player_name: str, max_points: Optional[int] = None) -> Dict:
+        """
+        Career progression series.
+
+        The default budget is served as stored; other budgets are
+        recomputed from the stored runs (NumPy only).
+        """
+        if max_points is None:
+            return json.loads(self._column(player_name, "chart_data"))
+        runs = np.frombuffer(self._column(player_name, "runs"), dtype=np.int32)
+        return career_progression_series(runs, max_points)
+
+    def player_data(self, player_name: str):
+        """
+        Rebuild the columns charts need (player_name, runs, format).
+
+        Returns:
+            DataFrame with the player's innings
+        """
+        import pandas as pd
+
+        name = self.resolve_player(player_name)
+        with self._lock:
+            runs, formats_raw = self.conn.execute(
+                "SELECT runs, formats_raw FROM players WHERE player_name = ?", (name,)
+            ).fetchone()
+        runs = np.frombuffer(runs, dtype=np.int32)
+        return pd.DataFrame({
+            'player_name': name,
+            'runs': runs,
+            'format': json.loads(formats_raw),
+        })
+
+    def recent(self, player_name: str, n: int = DEFAULT_WINDOW) -> Dict:
+        """
+        Stored recent innings and their form metrics.
+
+        Args:
+            player_name: Name of player
+            n: Number of innings (at most the stored count)
+
+        Returns:
+            Same dictionary as AnalyticsService.recent
+        """
+        name = self.resolve_player(player_name)
+        innings = json.loads(self._column(name, "recent"))[-n:]
+        form = recent_form(
+            np.array([i["runs"] for i in innings]),
+            np.array([i["balls_faced"] for i in innings]),
+            np.array([i["dismissal"] != 'not out' for i in innings], dtype=bool),
+        )
+        return {"player_name": name, "innings": innings, "form": form}
+
+    def chart_frame(self, player_name: str, chart_type: str):
+        """
+        The rows a chart needs (see AnalyticsService.chart_frame).
+
+        Returns:
+            DataFrame with the stored latest 10 innings for
+            last_10_matches, otherwise the rebuilt player_data
+        """
+        if chart_type == 'last_10_matches':
+            import pandas as pd
+
+            recent = self.recent(player_name, 10)
+            frame = pd.DataFrame(recent["innings"])
+            frame.insert(0, 'player_name', recent["player_name"])
+            return frame
+        return self.player_data(player_name)
+
+    def compare(self, player_names: List[str], format_type: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Precomputed metrics for several players side by side.
+
+        Args:
+            player_names: Players to compare
+            format_type: Restrict to one format (optional)
+
+        Returns:
+            Dictionary mapping player name to metrics
+        """
+        results = {}
+        for player_name in player_names:
+            name = self.resolve_player(player_name)
+            if format_type:
+                formats = self.format_breakdown(name)
+                results[name] = formats.get(format_type.lower(), {
+                    "matches": 0, "runs": 0, "average": 0.0, "strike_rate": 0.0, "centuries": 0
+                })
+            else:
+                results[name] = self.player_metrics(name)
+        return results
+
+    def league(self) -> LeagueTable:
+        """
+        League table from the stored metrics, read in one query on first use.
+
+        Returns:
+            LeagueTable for every player
+        """
+        with self._lock:
+            if self._league is None:
+                metrics, formats = {}, {}
+                for name, metrics_json, formats_json in self.conn.execute(
+                    "SELECT player_name, metrics, formats FROM players"
+                ):
+                    metrics[name] = json.loads(metrics_json)
+                    formats[name] = json.loads(formats_json)
+                self._league = LeagueTable(metrics, formats)
+            return self._league
+
+    def compare_batch(self, player_names: List[str], format_type: Optional[str] = None) -> Dict:
+        """
+        Compare players against each other and the whole league.
+
+        Args:
+            player_names: Players to compare; the first is the baseline
+            format_type: Compare one format's metrics (optional)
+
+        Returns:
+            LeagueTable.compare result
+        """
+        names = [self.resolve_player(name) for name in player_names]
+        return self.league().compare(names, format_type)
+
+    def records(self, format_type: Optional[str] = None, limit: Optional[int] = None) -> Dict:
+        """
+        Precomputed league record lists for one format or overall.
+
+        Args:
+            format_type: odi, test or t20i (None or "overall" for all formats)
+            limit: Entries per list (optional)
+
+        Returns:
+            Same dictionary as AnalyticsService.records
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        format_type = (format_type or OVERALL).lower()
+        if format_type not in self._records:
+            raise ValueError(
+                f"Unknown format '{format_type}'. Available: {', '.join(RECORD_FORMATS)}, {OVERALL}"
+            )
+        stored = self._records[format_type]
+        return {
+            **stored,
+            "records": {record: entries[:limit] for record, entries in stored["records"].items()},
+        }
+
+    def ingest(self, new_rows) -> List[str]:
+        """Snapshots are immutable; rebuild them to add matches."""
+        raise RuntimeError("Snapshot is read-only; rebuild it to ingest matches")
+
+    def close(self):
+        """Close the underlying connection."""
+        self.conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or inspect analytics snapshots")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="Precompute analytics into a snapshot file")
+    build.add_argument("--data", default="data/cricket_data.csv", help="Input CSV")
+    build.add_argument("--out", default="data/analytics.snapshot", help="Snapshot file")
+
+    info = sub.add_parser("info", help="Show snapshot metadata")
+    info.add_argument("snapshot")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        summary = build_snapshot(args.data, args.out)
+        print(f"\n Snapshot written: {args.out}")
+        print(f"   Players: {summary['players']}  Rows: {summary['rows']}")
+        print(f"   Size: {summary['bytes']:,} bytes  Build: {summary['build_seconds']}s")
+    else:
+        snapshot = SnapshotService(args.snapshot)
+        print(f" Snapshot: {args.snapshot}")
+        print(f"   Source: {snapshot.csv_path}")
+        print(f"   Rows: {snapshot.row_count}  Players: {len(snapshot.player_names())}")
@@ -8,19 +8,51 @@ This verifies:
 2. Data cleaning works
 3. Metrics calculations are correct
 4. Graph generation works
+5. Combined player reports are cheaper than separate charts
+6. Long career series are downsampled without losing peaks
+7. Entry points import within their startup budgets
+8. The async API serves metrics and charts from the preloaded dataset
+9. API responses are cached with ETags and per-player invalidation
+10. Precomputed snapshots match live results and open faster
+11. The SQLite backend pushes filters and aggregates down into SQL
+12. The pipeline benchmark produces JSON and detects regressions
+13. Synthetic data matches the CSV schema and exercises clean_data
+14. Pipeline stages are timed into exportable histograms
+15. Every stage stays within its memory budget
+16. Batch comparisons match per-player metrics and rank against the league
+17. Ball-by-ball files aggregate into the same innings however they are split
+18. Parallel league aggregation matches the single-process metrics exactly
+19. Record lists match a full sort and stay exact under incremental updates
+20. Recent-innings buffers follow match dates, not file order
+21. Lazy queries match the eager chain on every source and push filters down
+22. A changed data file is rebuilt in the background and swapped in pre-warmed
 
 Run this BEFORE building FastAPI to ensure analytics layer is solid.
+Pass -v to also show the analytics modules' progress logging.
 """
 
+import copy
+import json
+import logging
+import os
 import sys
+import time
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from analytics.data_loader import DataLoader
 from analytics.metrics import MetricsCalculator
 from analytics.graphs import GraphGenerator
+from analytics.chart_data import cumulative_average, career_progression_series
+from analytics.instrumentation import instrumentation
+from benchmarks.startup import run_startup_benchmark, check_budgets
+from benchmarks.pipeline import run_suite, compare_to_baseline
+from benchmarks.memory import MEMORY_BUDGETS, run_memory_profile, unbudgeted_stages
 
 
 def test_data_loading():
@@ -153,6 +185,1123 @@ def test_full_pipeline():
         return False
 
 
+def test_player_report():
+    """Test combined multi-panel report against separate charts."""
+    print("\n" + "=" * 60)
+    print("TEST 5: COMBINED PLAYER REPORT")
+    print("=" * 60)
+    
+    try:
+        loader = DataLoader("data/cricket_data.csv")
+        cleaned = loader.clean_data(loader.load_data())
+        players = {
+            player: loader.filter_by_player(cleaned, player)
+            for player in ['virat kohli', 'rohit sharma', 'ms dhoni']
+        }
+        
+        generator = GraphGenerator("test_output/graphs")
+        
+        # Warm up matplotlib so neither path pays first-figure costs
+        generator.player_report(players['virat kohli'], "Virat Kohli")
+        
+        def encodes():
+            """PNG encodes recorded so far (graphs.*.encode spans)."""
+            return sum(summary["count"] for stage, summary in instrumentation.stages().items()
+                       if stage.startswith("graphs.") and stage.endswith(".encode"))
+        
+        was_enabled = instrumentation.enabled
+        instrumentation.enable()
+        try:
+            before = encodes()
+            start = time.perf_counter()
+            for player, player_data in players.items():
+                generator.generate_all_graphs(player_data, player)
+            separate_time = time.perf_counter() - start
+            separate_encodes = encodes() - before
+            
+            # Same three panels as the separate charts, so the work is like for like
+            before = encodes()
+            start = time.perf_counter()
+            generator.generate_reports(players)
+            report_time = time.perf_counter() - start
+            report_encodes = encodes() - before
+        finally:
+            if not was_enabled:
+                instrumentation.disable()
+        
+        print(f"\n Separate charts: {separate_time:.2f}s ({separate_encodes} PNG encodes)")
+        print(f" Combined reports: {report_time:.2f}s ({report_encodes} PNG encodes)")
+        
+        reports = generator.generate_reports(players, include_formats=True)
+        assert len(reports) == len(players)
+        assert all(Path(path).exists() for path in reports.values())
+        # One encode per report instead of one per chart (wall-clock times are too noisy to compare)
+        assert separate_encodes == 3 * len(players)
+        assert report_encodes == len(players)
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
+def test_progression_downsampling():
+    """Test LTTB downsampling of long career progression series."""
+    print("\n" + "=" * 60)
+    print("TEST 6: PROGRESSION DOWNSAMPLING")
+    print("=" * 60)
+    
+    try:
+        rng = np.random.default_rng(42)
+        runs = rng.integers(0, 200, size=3000)
+        full = cumulative_average(runs)
+        
+        series = career_progression_series(runs, max_points=300)
+        points = len(series['match_number'])
+        print(f"\n Downsampled {len(runs)} innings to {points} points")
+        
+        # Budget respected (peaks may add up to two extra points)
+        assert points <= 302
+        # First and final values preserved
+        assert series['match_number'][0] == 1
+        assert series['match_number'][-1] == len(runs)
+        assert series['final_average'] == round(float(full[-1]), 2)
+        # Peaks preserved
+        assert int(np.argmax(full)) + 1 in series['match_number']
+        assert int(np.argmin(full)) + 1 in series['match_number']
+        
+        # Short series are untouched
+        short = career_progression_series(runs[:50], max_points=300)
+        assert len(short['match_number']) == 50
+        
+        # Chart and JSON export use the same points
+        generator = GraphGenerator("test_output/graphs", max_points=300)
+        long_career = pd.DataFrame({'player_name': 'long career', 'runs': runs})
+        assert generator.career_progression_data(long_career) == series
+        generator.career_progression(long_career, "Long Career")
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
+def test_startup_budget():
+    """Test import time, RSS and lazy heavy imports per entry point."""
+    print("\n" + "=" * 60)
+    print("TEST 7: STARTUP BUDGET")
+    print("=" * 60)
+    
+    try:
+        results = run_startup_benchmark(repeats=2)
+        for module, measured in results.items():
+            print(f"   {module}: {measured['import_ms']}ms, +{measured['rss_mb']}MB")
+        
+        violations = check_budgets(results)
+        assert not violations, "; ".join(violations)
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
+def test_api():
+    """Test API endpoints against the preloaded dataset."""
+    print("\n" + "=" * 60)
+    print("TEST 8: API SERVICE")
+    print("=" * 60)
+    
+    try:
+        os.environ.setdefault("ANALYTICS_GRAPHS_DIR", "test_output/graphs")
+        from fastapi.testclient import TestClient
+        from main import app
+        
+        with TestClient(app) as client:
+            response = client.get("/api/players/Virat Kohli/metrics")
+            assert response.status_code == 200
+            metrics = response.json()
+            print(f"\n Metrics via API: {metrics['total_runs']:,} runs, avg {metrics['batting_average']}")
+            
+            # API agrees with the analytics layer
+            loader = DataLoader("data/cricket_data.csv")
+            cleaned = loader.clean_data(loader.load_data())
+            expected = MetricsCalculator(loader.filter_by_player(cleaned, "virat kohli"))
+            assert metrics == expected.calculate_all_metrics()
+            
+            formats = client.get("/api/players/virat kohli/formats").json()
+            assert set(formats) == {'odi', 'test', 't20i'}
+            
+            compare = client.get("/api/compare", params={"players": "virat kohli,ms dhoni"}).json()
+            assert set(compare) == {'virat kohli', 'ms dhoni'}
+            
+            batch = client.get("/api/compare/batch", params={"players": "ms dhoni,virat kohli,rohit sharma"}).json()
+            assert batch["baseline"] == 'ms dhoni'
+            assert list(batch["players"]) == ['ms dhoni', 'virat kohli', 'rohit sharma']
+            assert client.get("/api/compare/batch", params={"players": "ms dhoni"}).status_code == 400
+            assert client.get("/api/compare/batch",
+                              params={"players": "ms dhoni,virat kohli", "format": "t10"}).status_code == 400
+            
+            records = client.get("/api/records", params={"format": "odi", "limit": 3}).json()
+            assert records["format"] == 'odi' and len(records["records"]["highest_score"]) == 3
+            assert client.get("/api/records", params={"format": "t10"}).status_code == 400
+            assert client.get("/api/compare", params={"players": "virat kohli,ms dhoni",
+                                                      "format": "xyz"}).status_code == 400
+            
+            recent = client.get("/api/players/virat kohli/recent", params={"n": 5}).json()
+            assert len(recent["innings"]) == 5 and recent["form"]["innings"] == 5
+            assert client.get("/api/players/virat kohli/recent", params={"n": 500}).status_code == 422
+            
+            assert client.get("/api/players/nobody/metrics").status_code == 404
+            assert client.get("/api/players/virat kohli/charts/pie").status_code == 404
+            assert client.get("/api/compare", params={"players": "virat kohli,nobody"}).status_code == 404
+            
+            # A data error inside the league table is a 500, not a missing player
+            def broken_league():
+                raise ValueError("cannot convert float NaN to integer")
+            app.state.service.league = broken_league
+            errors = TestClient(app, raise_server_exceptions=False)
+            assert errors.get("/api/compare", params={"players": "rohit sharma,ms dhoni"}).status_code == 500
+            del app.state.service.league
+            
+            graphs_dir = Path(os.environ["ANALYTICS_GRAPHS_DIR"])
+            files_before = set(graphs_dir.glob("*.png"))
+            chart = client.get("/api/players/virat kohli/charts/last_10_matches")
+            assert chart.status_code == 200
+            assert chart.content.startswith(b"\x89PNG")
+            report = client.get("/api/players/virat kohli/charts/report")
+            assert report.content.startswith(b"\x89PNG")
+            # Charts are rendered in memory, never left in the graphs directory
+            assert set(graphs_dir.glob("*.png")) == files_before
+            print(f" Chart via API: {len(chart.content):,} bytes")
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
+def test_response_cache():
+    """Test response caching, ETags and invalidation on ingestion."""
+    print("\n" + "=" * 60)
+    print("TEST 9: RESPONSE CACHE")
+    print("=" * 60)
+    
+    try:
+        from cache import ResponseCache
+        
+        # LRU eviction by entry count
+        cache = ResponseCache(max_entries=2)
+        for player in ['a', 'b', 'c']:
+            cache.put(cache.make_key("metrics", [player]), player.encode())
+        assert cache.get(cache.make_key("metrics", ['a'])) is None
+        assert cache.stats()['evictions'] == 1
+        
+        os.environ.setdefault("ANALYTICS_GRAPHS_DIR", "test_output/graphs")
+        from fastapi.testclient import TestClient
+        from main import app
+        
+        with TestClient(app) as client:
+            first = client.get("/api/players/virat kohli/metrics")
+            etag = first.headers["etag"]
+            client.get("/api/players/ms dhoni/metrics")
+            
+            # Conditional request gets a 304 without a body
+            second = client.get("/api/players/virat kohli/metrics", headers={"If-None-Match": etag})
+            assert second.status_code == 304
+            # Weak tags, lists and * match too (RFC 7232 weak comparison)
+            for header in (f"W/{etag}", f'"stale", {etag}', "*"):
+                response = client.get("/api/players/virat kohli/metrics", headers={"If-None-Match": header})
+                assert response.status_code == 304, header
+            stale = client.get("/api/players/virat kohli/metrics", headers={"If-None-Match": 'W/"stale"'})
+            assert stale.status_code == 200
+            
+            # Ingest a new Kohli innings: only Kohli's entries are dropped
+            new_match = {
+                "player_name": "Virat Kohli", "runs": 150, "balls_faced": 120,
+                "format": "odi", "dismissal": "caught", "fours": 15, "sixes": 4,
+                "centuries": 1, "half_centuries": 0, "opponent": "pakistan",
+                "match_date": "2024-02-01"
+            }
+            ingest = client.post("/api/matches", json=[new_match]).json()
+            assert ingest["players"] == ["virat kohli"]
+            assert ingest["cache_entries_dropped"] == 1
+            
+            third = client.get("/api/players/virat kohli/metrics", headers={"If-None-Match": etag})
+            assert third.status_code == 200
+            assert third.json()["total_runs"] == first.json()["total_runs"] + 150
+            
+            # Malformed rows are rejected before they reach the dataset
+            version = client.get("/api/health").json()["dataset_version"]
+            without_centuries = {k: v for k, v in new_match.items() if k != "centuries"}
+            for rows in ([{"foo": 1}], [without_centuries], [{**new_match, "runs": "abc"}]):
+                assert client.post("/api/matches", json=rows).status_code == 422
+            assert client.get("/api/health").json()["dataset_version"] == version
+            
+            # Called directly, the service drops unparsable numbers instead of keeping NaN
+            service = app.state.service
+            assert service.ingest(pd.DataFrame([{**new_match, "runs": "abc"}])) == []
+            compared = client.get("/api/compare", params={"players": "rohit sharma,ms dhoni"})
+            assert compared.status_code == 200
+            
+            stats = client.get("/api/cache/stats").json()
+            print(f"\n Cache stats: {stats}")
+            assert stats["hits"] >= 1 and stats["entries"] >= 1
+            
+            # Concurrent ingests (as on the metric pool) never lose rows
+            from concurrent.futures import ThreadPoolExecutor
+            rows_before = service.row_count
+            matches_before = len(service.player_data("ms dhoni"))
+            batches = [
+                pd.DataFrame([{**new_match, "player_name": "MS Dhoni", "match_date": f"2031-01-{day:02d}"}])
+                for day in range(1, 17)
+            ]
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(service.ingest, batches))
+            assert service.row_count == rows_before + 16
+            assert len(service.player_data("ms dhoni")) == matches_before + 16
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
+def test_snapshot():
+    """Test snapshot build, read-back and cold start time."""
+    print("\n" + "=" * 60)
+    print("TEST 10: ANALYTICS SNAPSHOT")
+    print("=" * 60)
+    
+    try:
+        from service import AnalyticsService
+        from snapshot import build_snapshot, SnapshotService
+        
+        summary = build_snapshot("data/cricket_data.csv", "test_output/analytics.snapshot")
+        print(f"\n Snapshot: {summary['players']} players, {summary['bytes']:,} bytes")
+        
+        start = time.perf_counter()
+        live = AnalyticsService.from_csv("data/cricket_data.csv")
+        csv_start = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        snapshot = SnapshotService("test_output/analytics.snapshot")
+        snapshot_start = time.perf_counter() - start
+        print(f" Cold start: CSV {csv_start * 1000:.1f}ms, snapshot {snapshot_start * 1000:.1f}ms")
+        
+        assert snapshot.player_names() == live.player_names()
+        assert snapshot.row_count == live.row_count
+        for player in live.player_names():
+            assert snapshot.player_metrics(player) == live.player_metrics(player)
+            assert snapshot.format_breakdown(player) == live.format_breakdown(player)
+            assert snapshot.chart_data(player) == live.chart_data(player)
+            assert snapshot.chart_data(player, 5) == live.chart_data(player, 5)
+        assert snapshot.compare(['virat kohli', 'ms dhoni'], 'odi') == live.compare(['virat kohli', 'ms dhoni'], 'odi')
+        
+        snapshot.close()
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
+def test_sqlite_backend():
+    """Test SQL pushdown matches the pandas path."""
+    print("\n" + "=" * 60)
+    print("TEST 11: SQLITE STORAGE BACKEND")
+    print("=" * 60)
+    
+    try:
+        from analytics.sqlite_store import SQLiteDataLoader
+        
+        sql_loader = SQLiteDataLoader("data/cricket_data.csv")
+        inserted = sql_loader.ingest_csv()
+        print(f"\n Ingested {inserted} rows into SQLite")
+        
+        loader = DataLoader("data/cricket_data.csv")
+        cleaned = loader.clean_data(loader.load_data())
+        
+        expected_metrics = {}
+        for player in sql_loader.player_names():
+            calculator = MetricsCalculator(loader.filter_by_player(cleaned, player))
+            expected_metrics[player] = calculator.calculate_all_metrics()
+            assert sql_loader.calculate_all_metrics(player) == expected_metrics[player]
+            for format_type in ['odi', 'test', 't20i']:
+                assert sql_loader.format_metrics(player, format_type) == calculator.format_metrics(format_type)
+        
+        assert len(sql_loader.filter_by_player(None, "Virat Kohli")) == 20
+        assert len(sql_loader.get_format_data(None, "ODI")) == len(loader.get_format_data(cleaned, "odi"))
+        
+        # Player + format lookups are served by the composite index
+        plan = sql_loader.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM matches WHERE player_name = ? AND format = ?",
+            ("virat kohli", "odi")
+        ).fetchall()
+        assert "idx_matches_player_format" in plan[0][-1]
+        
+        try:
+            sql_loader.calculate_all_metrics("nobody")
+            return False
+        except ValueError:
+            pass
+        
+        sql_loader.close()
+        
+        # Duplicates split across chunks (or ingests) are stored once
+        lines = Path("data/cricket_data.csv").read_text().splitlines()
+        Path("test_output/duplicates.csv").write_text("\n".join(lines + [lines[1], lines[-1]]) + "\n")
+        chunked = SQLiteDataLoader("test_output/duplicates.csv")
+        assert chunked.ingest_csv(chunksize=30) == len(cleaned)
+        assert chunked.ingest_csv(chunksize=30) == 0
+        for player in chunked.player_names():
+            assert chunked.calculate_all_metrics(player) == expected_metrics[player]
+        chunked.close()
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
+def test_benchmark_suite():
+    """Test benchmark output format and regression detection."""
+    print("\n" + "=" * 60)
+    print("TEST 12: PIPELINE BENCHMARK")
+    print("=" * 60)
+    
+    try:
+        report = run_suite([1_000], repeats=1, graphs=False)
+        stages = report["results"]["1000"]
+        print(f"\n Benchmarked {len(stages)} stages at 1,000 rows")
+        
+        for stage in ["load_data", "clean_data", "filter_by_player",
+                      "calculate_all_metrics", "format_metrics"]:
+            assert {"seconds", "peak_mb", "rows", "rows_per_sec"} <= set(stages[stage])
+        json.dumps(report)
+        
+        # Identical runs never regress
+        assert compare_to_baseline(report, report) == []
+        
+        # A baseline 10x faster than today flags the slower stages
+        faster = copy.deepcopy(report)
+        for measured in faster["results"]["1000"].values():
+            measured["seconds"] /= 10
+        faster["results"]["1000"]["load_data"]["seconds"] = 0.001
+        report["results"]["1000"]["load_data"]["seconds"] = 0.5
+        regressions = compare_to_baseline(report, faster, threshold=0.25)
+        print(f" Detected {len(regressions)} regression(s) against a faster baseline")
+        assert any("load_data" in r for r in regressions)
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
+def test_synthetic_data():
+    """Test the seeded synthetic dataset generator."""
+    print("\n" + "=" * 60)
+    print("TEST 13: SYNTHETIC DATA")
+    print("=" * 60)
+    
+    try:
+        from analytics.synthetic import SyntheticDataGenerator
+        
+        real_columns = list(pd.read_csv("data/cricket_data.csv", nrows=1).columns)
+        dirty = {'duplicates': 0.01, 'nans': 0.01, 'zero_balls': 0.01, 'negative_runs': 0.01}
+        
+        generator = SyntheticDataGenerator(rows=5_000, innings_per_player=100, seed=7, dirty=dirty)
+        data = generator.to_frame()
+        print(f"\n Generated {len(data):,} rows for {generator.players} players")
+        
+        assert list(data.columns) == real_columns
+        assert len(data) == 5_000
+        
+        # Same seed, same data, whatever the chunk size
+        again = pd.concat(
+            SyntheticDataGenerator(rows=5_000, innings_per_player=100, seed=7, dirty=dirty).iter_chunks(333)
+        )
+        assert data.equals(again.reset_index(drop=True))
+        
+        # Dirty rows are injected and removed by clean_data
+        assert (data['balls_faced'] == 0).sum() > 0 and (data['runs'] < 0).sum() > 0
+        assert data['runs'].isna().sum() + data['balls_faced'].isna().sum() > 0
+        assert data.duplicated().sum() > 0
+        cleaned = DataLoader().clean_data(data)
+        assert (cleaned['balls_faced'] > 0).all() and (cleaned['runs'] >= 0).all()
+        assert not cleaned.duplicated().any()
+        
+        # T20Is are scored fastest, Tests slowest
+        clean = SyntheticDataGenerator(rows=20_000, innings_per_player=200).to_frame()
+        totals = clean.groupby('format')[['runs', 'balls_faced']].sum()
+        strike_rates = totals['runs'] / totals['balls_faced'] * 100
+        print(f" Strike rates: {strike_rates.round(1).to_dict()}")
+        assert strike_rates['t20i'] > strike_rates['odi'] > strike_rates['test']
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
+def test_instrumentation():
+    """Test stage spans, histogram export and the disabled fast path."""
+    print("\n" + "=" * 60)
+    print("TEST 14: INSTRUMENTATION")
+    print("=" * 60)
+    
+    try:
+        instrumentation.enable()
+        instrumentation.reset()
+        
+        loader = DataLoader("data/cricket_data.csv")
+        cleaned = loader.clean_data(loader.load_data())
+        player_data = loader.filter_by_player(cleaned, "virat kohli")
+        MetricsCalculator(player_data).calculate_all_metrics()
+        GraphGenerator("test_output/graphs").player_report(player_data, "virat kohli")
+        
+        stages = instrumentation.stages()
+        print(f"\n Recorded {len(stages)} stages")
+        for stage in ["data.load", "data.clean.duplicates", "data.clean.validate",
+                      "data.filter_player", "metrics.all", "metrics.batting_average",
+                      "graphs.report.build", "graphs.report.encode"]:
+            assert stages[stage]["count"] >= 1, stage
+        assert stages["data.load"]["rows"] == len(loader.data)
+        assert stages["data.filter_player"]["rows"] == len(cleaned)
+        assert stages["graphs.report.encode"]["bytes"] > 0
+        print(f" Report encode: {stages['graphs.report.encode']['total_seconds'] * 1000:.1f} ms, "
+              f"{stages['graphs.report.encode']['bytes']:,} bytes")
+        
+        # Both export formats carry every stage
+        exported = json.loads(instrumentation.to_json())
+        assert set(exported["stages"]) == set(stages)
+        prometheus = instrumentation.to_prometheus()
+        assert 'analytics_stage_duration_seconds_count{stage="data.load"} 1' in prometheus
+        assert 'le="+Inf"' in prometheus
+        
+        # Disabled: nothing recorded, and a span costs well under a microsecond
+        instrumentation.disable()
+        instrumentation.reset()
+        MetricsCalculator(player_data).calculate_all_metrics()
+        assert instrumentation.stages() == {}
+        
+        from analytics.instrumentation import span
+        start = time.perf_counter()
+        for _ in range(100_000):
+            with span("noop"):
+                pass
+        per_span_ns = (time.perf_counter() - start) / 100_000 * 1e9
+        print(f" Disabled span overhead: {per_span_ns:.0f} ns")
+        assert per_span_ns < 2000
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+    
+    finally:
+        instrumentation.enable()
+
+
+def test_memory_budgets():
+    """Test per-stage memory profiling and budget enforcement."""
+    print("\n" + "=" * 60)
+    print("TEST 15: MEMORY BUDGETS")
+    print("=" * 60)
+    
+    try:
+        from analytics.instrumentation import MemoryBudgetError, span
+        
+        # Fail mode raises on the first stage over budget
+        report = run_memory_profile(rows=50_000, mode="fail")
+        for stage in ["data.load", "data.clean", "data.filter_player", "graphs.report.build"]:
+            m = report["stages"][stage]
+            print(f"   {stage}: peak {m['peak_mb_max']:.2f}MB over {m['rows']:,} rows")
+        assert not report["violations"]
+        assert not unbudgeted_stages(report), unbudgeted_stages(report)
+        
+        # A stage that starts copying its input is caught
+        from analytics.synthetic import SyntheticDataGenerator
+        frame = SyntheticDataGenerator(rows=50_000).to_frame()
+        instrumentation.enable_memory()
+        instrumentation.set_memory_budget(
+            "data.filter_player", mode="fail", **MEMORY_BUDGETS["data.filter_player"]
+        )
+        try:
+            with span("data.filter_player", rows=len(frame)):
+                frame.copy()
+            raise AssertionError("Copy regression was not caught")
+        except MemoryBudgetError as e:
+            print(f"\n Caught regression: {e}")
+        
+        # Warn mode records the violation without raising
+        instrumentation.set_memory_budget(
+            "data.filter_player", mode="warn", **MEMORY_BUDGETS["data.filter_player"]
+        )
+        instrumentation.reset()
+        with span("data.filter_player", rows=len(frame)):
+            frame.copy()
+        assert len(instrumentation.budget_violations) == 1
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+    
+    finally:
+        instrumentation.disable_memory()
+        instrumentation.memory_budgets.clear()
+        instrumentation.reset()
+
+
+def test_batch_compare():
+    """Test league-wide batch comparison against per-player calculators."""
+    print("\n" + "=" * 60)
+    print("TEST 16: BATCH COMPARE")
+    print("=" * 60)
+    
+    try:
+        from analytics.compare import LeagueTable, CAREER_FIELDS
+        from analytics.synthetic import SyntheticDataGenerator
+        from service import AnalyticsService
+        from snapshot import SnapshotService, build_snapshot
+        
+        league_data = DataLoader().clean_data(
+            SyntheticDataGenerator(rows=100_000, innings_per_player=500).to_frame()
+        )
+        league = LeagueTable.from_frame(league_data)
+        names = list(league_data['player_name'].unique())
+        print(f"\n League: {len(league)} players, {len(league_data):,} rows")
+        
+        # Same numbers as one MetricsCalculator per player
+        for name in names[:20]:
+            calculator = MetricsCalculator(league_data[league_data['player_name'] == name])
+            assert league.metrics[name] == calculator.calculate_all_metrics()
+            assert league.format_metrics[name]['t20i'] == calculator.format_metrics('t20i')
+        
+        result = league.compare(names[:3])
+        assert result["baseline"] == names[0] and result["league_size"] == len(league)
+        assert all(v == 0 for v in result["differences"][names[0]].values())
+        assert result["differences"][names[1]]["total_runs"] == (
+            league.metrics[names[1]]["total_runs"] - league.metrics[names[0]]["total_runs"]
+        )
+        top_scorer = max(names[:3], key=lambda n: league.metrics[n]["total_runs"])
+        assert result["leaders"]["total_runs"] == top_scorer
+        assert all(0 < p <= 100 for ranks in result["percentiles"].values() for p in ranks.values())
+        assert set(result["percentiles"][names[0]]) == set(CAREER_FIELDS)
+        
+        # Cost is flat in the number of players compared
+        timings = {}
+        for count in [2, 50]:
+            start = time.perf_counter()
+            for _ in range(20):
+                league.compare(names[:count], 'odi')
+            timings[count] = (time.perf_counter() - start) / 20
+            print(f" {count} players: {timings[count] * 1000:.2f}ms")
+        assert timings[50] < 0.02
+        
+        # Services: live and snapshot agree, ingest refreshes the league
+        live = AnalyticsService.from_csv("data/cricket_data.csv")
+        build_snapshot("data/cricket_data.csv", "test_output/analytics.snapshot")
+        snapshot = SnapshotService("test_output/analytics.snapshot")
+        trio = ['virat kohli', 'rohit sharma', 'ms dhoni']
+        assert live.compare_batch(trio, 'odi') == snapshot.compare_batch(trio, 'odi')
+        snapshot.close()
+        
+        before = live.compare_batch(trio)["players"]["ms dhoni"]["total_runs"]
+        live.ingest(pd.DataFrame([{
+            'player_name': 'MS Dhoni', 'runs': 150, 'balls_faced': 120, 'format': 'ODI',
+            'dismissal': 'caught', 'fours': 12, 'sixes': 5, 'centuries': 1,
+            'half_centuries': 0, 'opponent': 'Nepal', 'match_date': '2030-01-01'
+        }]))
+        after = live.compare_batch(trio)
+        assert after["players"]["ms dhoni"]["total_runs"] == before + 150
+        assert after["players"]["ms dhoni"] == {
+            **live.player_metrics('ms dhoni'), "formats": live.format_breakdown('ms dhoni')
+        }
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
+def test_delivery_ingestion():
+    """Test ball-by-ball files aggregate into innings rows in the CSV schema."""
+    print("\n" + "=" * 60)
+    print("TEST 17: DELIVERY INGESTION")
+    print("=" * 60)
+    
+    try:
+        import tempfile
+        from analytics.deliveries import (
+            DeliveryLoader, aggregate_deliveries, innings_rows, merge_partials
+        )
+        from analytics.synthetic import COLUMNS, SyntheticDeliveryGenerator
+        
+        generator = SyntheticDeliveryGenerator(players=20, innings_per_player=50)
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = generator.write_files(tmp, files=4)
+            parallel = DeliveryLoader(paths, workers=2)
+            innings = parallel.load()
+            # Tiny chunks split innings across chunk boundaries
+            serial = DeliveryLoader(paths, chunksize=997, workers=1).load()
+        
+        stats = parallel.stats
+        print(f"\n {stats['deliveries']:,} deliveries -> {stats['innings']:,} innings "
+              f"({stats['deliveries_per_sec']:,} deliveries/s)")
+        assert stats['innings'] == 20 * 50 and stats['deliveries_per_sec'] > 0
+        pd.testing.assert_frame_equal(innings, serial)
+        assert list(innings.columns) == COLUMNS
+        
+        # Totals match a direct pass over every delivery
+        deliveries = generator.to_frame(files=4)
+        assert innings['runs'].sum() == deliveries['batter_runs'].sum()
+        assert innings['balls_faced'].sum() == (deliveries['extras_type'] != 'wide').sum()
+        assert innings['sixes'].sum() == (deliveries['batter_runs'] == 6).sum()
+        assert (innings['dismissal'] != 'not out').sum() == (deliveries['player_out'] != '').sum()
+        
+        # Non-striker run out without facing, retirement, no-ball faced, wide not
+        match = pd.DataFrame({
+            'match_id': 1, 'innings': 1, 'match_date': '2024-01-01', 'format': 'ODI',
+            'opponent': 'england',
+            'batter': ['a', 'a', 'a', 'a', 'c'],
+            'batter_runs': [4, 0, 6, 1, 0],
+            'extras_type': ['', 'wide', 'noball', '', ''],
+            'wicket_kind': ['', '', '', 'run out', 'retired hurt'],
+            'player_out': ['', '', '', 'b', 'c'],
+        })
+        halves = [aggregate_deliveries(match.iloc[:2]), aggregate_deliveries(match.iloc[2:])]
+        rows = innings_rows(merge_partials(halves)).set_index('player_name')
+        assert rows.loc['a', ['runs', 'balls_faced', 'fours', 'sixes']].tolist() == [11, 3, 1, 1]
+        assert rows.loc['a', 'dismissal'] == 'not out' and rows.loc['a', 'format'] == 'odi'
+        assert rows.loc['b', 'dismissal'] == 'run out' and rows.loc['b', 'balls_faced'] == 0
+        assert rows.loc['c', 'dismissal'] == 'not out'
+        
+        # Output plugs straight into clean_data and MetricsCalculator
+        cleaned = DataLoader().clean_data(innings)
+        player = cleaned['player_name'].iloc[0]
+        player_rows = cleaned[cleaned['player_name'] == player]
+        metrics = MetricsCalculator(player_rows).calculate_all_metrics()
+        assert metrics['total_runs'] == player_rows['runs'].sum()
+        assert metrics['centuries'] == (player_rows['runs'] >= 100).sum()
+        print(f" {player}: {metrics['total_runs']} runs at {metrics['strike_rate']}")
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
+def test_parallel_aggregation():
+    """Test multi-process league sums match single-process metrics exactly."""
+    print("\n" + "=" * 60)
+    print("TEST 18: PARALLEL AGGREGATION")
+    print("=" * 60)
+    
+    try:
+        import tempfile
+        from analytics.compare import LeagueTable
+        from analytics.parallel import ParallelAggregator, csv_partitions
+        from analytics.synthetic import DEFAULT_DIRTY, SyntheticDataGenerator
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = str(Path(tmp) / "matches.csv")
+            SyntheticDataGenerator(
+                rows=40_000, innings_per_player=400,
+                dirty={kind: 0.01 for kind in DEFAULT_DIRTY}
+            ).write_csv(csv_path)
+            
+            loader = DataLoader(csv_path)
+            cleaned = loader.clean_data(loader.load_data())
+            reference = LeagueTable.from_frame(cleaned)
+            
+            # Many small partitions over two workers, each cleaning its own rows
+            engine = ParallelAggregator(workers=2, partition_bytes=64 * 1024)
+            league = engine.league_from_csv(csv_path)
+            print(f"\n CSV: {engine.stats['rows']:,} rows in {engine.stats['partitions']} "
+                  f"partitions ({engine.stats['rows_per_sec']:,} rows/s)")
+            assert engine.stats['partitions'] > 10
+            assert engine.stats['rows_kept'] == len(cleaned)
+            assert league.metrics == reference.metrics
+            assert league.format_metrics == reference.format_metrics
+            
+            # Partitions cover every line once
+            lines = Path(csv_path).read_bytes()
+            ranges = csv_partitions(csv_path, 1000)
+            assert ranges[0][0] == lines.index(b'\n') + 1 and ranges[-1][1] == len(lines)
+            assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+            
+            # Rows repeated far apart land in different partitions and are
+            # still removed once across the whole file
+            rows = lines.splitlines(keepends=True)
+            repeated = rows[1:2000:7] + rows[1:20]
+            with open(csv_path, 'ab') as f:
+                f.writelines(repeated)
+            cleaned = loader.clean_data(loader.load_data())
+            assert LeagueTable.from_frame(cleaned).metrics == reference.metrics
+            for workers in (1, 2):
+                engine = ParallelAggregator(workers=workers, partition_bytes=64 * 1024)
+                league = engine.league_from_csv(csv_path)
+                assert engine.stats['rows_kept'] == len(cleaned)
+                assert league.metrics == reference.metrics
+                assert league.format_metrics == reference.format_metrics
+            print(f" Removed {len(repeated)} rows repeated across partitions")
+        
+        # Shared-memory path over an in-memory frame
+        engine = ParallelAggregator(workers=3)
+        league = engine.league_from_frame(cleaned)
+        print(f" Frame: {engine.stats['rows']:,} rows over {engine.stats['workers']} workers")
+        assert league.metrics == reference.metrics
+        assert league.format_metrics == reference.format_metrics
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
+def test_records_index():
+    """Test record lists against a full sort and under incremental ingest."""
+    print("\n" + "=" * 60)
+    print("TEST 19: RECORDS INDEX")
+    print("=" * 60)
+    
+    try:
+        from analytics.records import FORMATS as RECORD_FORMATS, OVERALL, RecordsIndex
+        from analytics.synthetic import SyntheticDataGenerator
+        from service import AnalyticsService
+        
+        league_data = DataLoader().clean_data(
+            SyntheticDataGenerator(rows=100_000, innings_per_player=400).to_frame()
+        ).reset_index(drop=True)
+        
+        start = time.perf_counter()
+        index = RecordsIndex.from_frame(league_data)
+        print(f"\n Built from {len(league_data):,} innings in "
+              f"{(time.perf_counter() - start) * 1000:.1f}ms")
+        
+        # Same lists as sorting every innings
+        odi = league_data[league_data['format'].str.lower() == 'odi']
+        top_scores = [e['value'] for e in index.top('highest_score', 'odi')]
+        assert top_scores == sorted(odi['runs'], reverse=True)[:10]
+        qualified = odi[odi['balls_faced'] >= index.min_balls]
+        best_rate = (qualified['runs'] / qualified['balls_faced'] * 100).max()
+        assert index.top('best_strike_rate', 'odi')[0]['value'] == round(best_rate, 1)
+        assert [e['value'] for e in index.top('most_sixes')] == sorted(league_data['sixes'], reverse=True)[:10]
+        centuries = league_data.groupby('player_name')['centuries'].sum()
+        assert [e['value'] for e in index.top('most_centuries')] == sorted(centuries, reverse=True)[:10]
+        
+        # Half built, half ingested gives identical lists, including tie order
+        incremental = RecordsIndex.from_frame(league_data.iloc[:50_000])
+        start = time.perf_counter()
+        incremental.add(league_data.iloc[50_000:])
+        per_innings = (time.perf_counter() - start) / 50_000
+        print(f" Incremental update: {per_innings * 1e6:.1f}us per innings")
+        for format_type in RECORD_FORMATS + [OVERALL]:
+            assert incremental.records(format_type) == index.records(format_type)
+        
+        # Service keeps records current on ingest
+        service = AnalyticsService.from_csv("data/cricket_data.csv")
+        service.ingest(pd.DataFrame([{
+            'player_name': 'MS Dhoni', 'runs': 301, 'balls_faced': 120, 'format': 'ODI',
+            'dismissal': 'not out', 'fours': 30, 'sixes': 14, 'centuries': 1,
+            'half_centuries': 0, 'opponent': 'Nepal', 'match_date': '2030-01-01'
+        }]))
+        odi_records = service.records('odi')["records"]
+        assert odi_records["highest_score"][0]["player_name"] == 'ms dhoni'
+        assert odi_records["highest_score"][0]["value"] == 301
+        assert odi_records["best_strike_rate"][0]["value"] == 250.8
+        
+        # Innings with missing numbers are skipped, not ranked or crashed on
+        broken = league_data.iloc[:2].copy()
+        broken['centuries'] = np.nan
+        broken['runs'] = 10_000
+        before = index.records('odi')
+        index.add(broken)
+        assert index.records('odi') == before
+        
+        # A failed ingest leaves every structure as it was
+        state = (service.row_count, len(service.player_data('ms dhoni')), service.version,
+                 service.records(), service.recent('ms dhoni'))
+        def failing_add(df):
+            raise RuntimeError("recent buffers unavailable")
+        service._recent.add = failing_add
+        try:
+            service.ingest(pd.DataFrame([{
+                'player_name': 'MS Dhoni', 'runs': 250, 'balls_faced': 100, 'format': 'ODI',
+                'dismissal': 'caught', 'fours': 20, 'sixes': 10, 'centuries': 1,
+                'half_centuries': 0, 'opponent': 'Oman', 'match_date': '2030-02-01'
+            }]))
+            raise AssertionError("ingest should have failed")
+        except RuntimeError:
+            pass
+        del service._recent.add
+        assert (service.row_count, len(service.player_data('ms dhoni')), service.version,
+                service.records(), service.recent('ms dhoni')) == state
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
+def test_recent_innings():
+    """Test recent-innings ring buffers against sorting the full data."""
+    print("\n" + "=" * 60)
+    print("TEST 20: RECENT INNINGS")
+    print("=" * 60)
+    
+    try:
+        from analytics.recent import InningsRing, RecentInningsStore, latest_runs
+        from analytics.synthetic import SyntheticDataGenerator
+        from service import AnalyticsService
+        from snapshot import build_snapshot, SnapshotService
+        
+        # Late arrivals are inserted in date order; the oldest is evicted
+        ring = InningsRing(capacity=4)
+        for date, runs in [(1, 10), (3, 30), (5, 50), (4, 40), (6, 60)]:
+            assert ring.push(date, runs, runs, True, ())
+        assert list(ring.runs[ring.last(4)]) == [30, 40, 50, 60]
+        assert not ring.push(2, 20, 20, True, ())
+        
+        # Latest innings by date, even when the file is not in date order
+        player = pd.DataFrame({'runs': [5, 1, 4, 2, 3],
+                               'match_date': ['2024-05-01', '2024-01-01', '2024-04-01',
+                                              '2024-02-01', '2024-03-01']})
+        assert list(latest_runs(player, 3)) == [3, 4, 5]
+        
+        league_data = DataLoader().clean_data(
+            SyntheticDataGenerator(rows=50_000, innings_per_player=250).to_frame()
+        ).reset_index(drop=True)
+        start = time.perf_counter()
+        store = RecentInningsStore.from_frame(league_data)
+        print(f"\n Built {len(store.rings)} buffers from {len(league_data):,} innings in "
+              f"{(time.perf_counter() - start) * 1000:.1f}ms")
+        
+        name = league_data['player_name'].iloc[0]
+        player_data = league_data[league_data['player_name'] == name]
+        assert [i['runs'] for i in store.innings(name, 10)] == list(latest_runs(player_data, 10))
+        
+        # Half built, half ingested gives the same buffers
+        incremental = RecentInningsStore.from_frame(league_data.iloc[:25_000])
+        start = time.perf_counter()
+        incremental.add(league_data.iloc[25_000:])
+        per_innings = (time.perf_counter() - start) / 25_000
+        print(f" Incremental update: {per_innings * 1e6:.1f}us per innings")
+        for player in store.rings:
+            assert incremental.innings(player, 20) == store.innings(player, 20)
+        
+        # Service keeps form current on ingest; snapshot serves the same
+        service = AnalyticsService.from_csv("data/cricket_data.csv")
+        build_snapshot("data/cricket_data.csv", "test_output/analytics.snapshot")
+        snapshot = SnapshotService("test_output/analytics.snapshot")
+        assert snapshot.recent('virat kohli') == service.recent('virat kohli')
+        assert snapshot.chart_data('virat kohli', 5) == service.chart_data('virat kohli', 5)
+        snapshot.close()
+        
+        service.ingest(pd.DataFrame([{
+            'player_name': 'Virat Kohli', 'runs': 150, 'balls_faced': 100, 'format': 'ODI',
+            'dismissal': 'caught', 'fours': 15, 'sixes': 3, 'centuries': 1,
+            'half_centuries': 0, 'opponent': 'Nepal', 'match_date': '2030-01-01'
+        }]))
+        recent = service.recent('virat kohli', 5)
+        assert recent["innings"][-1]["runs"] == 150 and recent["form"]["highest_score"] == 150
+        print(f" Virat Kohli last 5: {[i['runs'] for i in recent['innings']]} "
+              f"(trend {recent['form']['trend']:+})")
+        
+        # Career progression follows match dates too, so an older innings
+        # ingested late opens the series instead of closing it
+        service.ingest(pd.DataFrame([{
+            'player_name': 'Virat Kohli', 'runs': 7, 'balls_faced': 20, 'format': 'ODI',
+            'dismissal': 'bowled', 'fours': 1, 'sixes': 0, 'centuries': 0,
+            'half_centuries': 0, 'opponent': 'Nepal', 'match_date': '2001-01-01'
+        }]))
+        progression = service.chart_data('virat kohli')
+        assert progression['cumulative_average'][0] == 7.0
+        kohli = service.player_data('virat kohli')
+        assert GraphGenerator("test_output/graphs").career_progression_data(kohli) == progression
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
+def test_query():
+    """Test lazy queries against the eager load/clean/filter/metrics chain."""
+    print("\n" + "=" * 60)
+    print("TEST 21: LAZY QUERIES")
+    print("=" * 60)
+    
+    try:
+        import tempfile
+        from analytics.query import Query
+        from analytics.sqlite_store import SQLiteDataLoader
+        from analytics.synthetic import DEFAULT_DIRTY, SyntheticDataGenerator
+        from service import AnalyticsService
+        
+        loader = DataLoader("data/cricket_data.csv")
+        cleaned = loader.clean_data(loader.load_data())
+        sql_loader = SQLiteDataLoader("data/cricket_data.csv")
+        sql_loader.ingest_csv()
+        sources = [cleaned, AnalyticsService(cleaned), sql_loader, "data/cricket_data.csv"]
+        
+        # Every source gives the eager result, whatever the predicates
+        for format_type in [None, 'odi', 'test']:
+            for since in [None, '2023-06-01']:
+                expected = loader.filter_by_player(cleaned, "Virat Kohli")
+                if format_type:
+                    expected = loader.get_format_data(expected, format_type)
+                if since:
+                    expected = expected[pd.to_datetime(expected['match_date']) >= since]
+                expected = MetricsCalculator(expected).calculate_all_metrics()
+                for source in sources:
+                    query = Query(source).player("Virat Kohli")
+                    if format_type:
+                        query = query.format(format_type)
+                    if since:
+                        query = query.since(since)
+                    assert query.metrics() == expected
+        
+        # Predicates reach the index; only the selected columns come back
+        query = Query(sql_loader).player("virat kohli").format("odi").since("2023-01-01")
+        plan = query.explain()
+        print("\n" + plan)
+        assert "idx_matches_player_format" in plan and "no rows fetched" in plan
+        assert "player partition" in Query(sources[1]).player("ms dhoni").explain()
+        rows = query.select('runs', 'match_date').to_frame()
+        assert list(rows.columns) == ['runs', 'match_date'] and (rows['match_date'] >= '2023-01-01').all()
+        assert Query(cleaned).player("nobody").metrics()['matches_played'] == 0
+        sql_loader.close()
+        
+        # Streaming a dirty CSV: filtering before cleaning changes nothing
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = str(Path(tmp) / "matches.csv")
+            SyntheticDataGenerator(
+                rows=200_000, innings_per_player=1000,
+                dirty={kind: 0.01 for kind in DEFAULT_DIRTY}
+            ).write_csv(csv_path)
+            
+            start = time.perf_counter()
+            big_loader = DataLoader(csv_path)
+            big = big_loader.clean_data(big_loader.load_data())
+            player = big['player_name'].iloc[0]
+            eager_rows = big_loader.get_format_data(big_loader.filter_by_player(big, player), 'odi')
+            eager = MetricsCalculator(eager_rows).calculate_all_metrics()
+            eager_seconds = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            lazy = Query(csv_path, chunksize=50_000).player(player).format('odi').metrics()
+            lazy_seconds = time.perf_counter() - start
+            assert lazy == eager
+            print(f" 200,000-row CSV: eager {eager_seconds:.2f}s, lazy {lazy_seconds:.2f}s")
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
+def test_data_refresh():
+    """Test the data watcher rebuilds, swaps atomically and pre-warms the cache."""
+    print("\n" + "=" * 60)
+    print("TEST 22: BACKGROUND DATA REFRESH")
+    print("=" * 60)
+    
+    try:
+        import shutil
+        import tempfile
+        from fastapi.testclient import TestClient
+        from main import app
+        from refresh import DataRefresher
+        from service import AnalyticsService
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / "matches.csv"
+            shutil.copy("data/cricket_data.csv", csv_path)
+            
+            state = {}
+            refresher = DataRefresher(
+                str(csv_path),
+                rebuild=lambda: AnalyticsService.from_csv(str(csv_path)),
+                install=lambda service: state.update(service=service)
+            )
+            state["service"] = AnalyticsService.from_csv(str(csv_path))
+            assert not refresher.check() and not refresher.stats()["stale"]
+            
+            # A change is acted on once it has held for one poll
+            with open(csv_path, "a") as f:
+                f.write("new player,88,70,odi,caught,9,2,0,1,nepal,2030-01-01\n")
+            os.utime(csv_path, ns=(time.time_ns(), time.time_ns() + 10 ** 9))
+            assert refresher.stats()["stale"]
+            assert not refresher.check()
+            assert refresher.check()
+            assert "new player" in state["service"].players
+            stats = refresher.stats()
+            print(f"\n Rebuilt in {stats['last_rebuild_seconds']}s after the file changed")
+            assert stats["rebuilds"] == 1 and not stats["stale"]
+            
+            # A broken file keeps the previous state serving
+            previous = state["service"]
+            csv_path.write_text("not,a,cricket,file\n1,2,3,4\n")
+            refresh_logger = logging.getLogger("refresh")
+            refresh_logger.disabled = True
+            try:
+                refresher.check()
+                assert not refresher.check()
+            finally:
+                refresh_logger.disabled = False
+            assert state["service"] is previous and refresher.stats()["failures"] == 1
+        
+        # In the API, the swap replaces service and cache together, pre-warmed
+        with TestClient(app) as client:
+            for _ in range(3):
+                client.get("/api/players/virat kohli/metrics")
+            client.get("/api/players/ms dhoni/metrics")
+            old_service = app.state.service
+            version = client.get("/api/health").json()["dataset_version"]
+            
+            assert app.state.refresher.refresh()
+            assert app.state.service is not old_service
+            assert client.get("/api/health").json()["dataset_version"] == version + 1
+            
+            cache_stats = client.get("/api/cache/stats").json()
+            print(f" Pre-warmed {cache_stats['entries']} responses for the hottest players")
+            assert cache_stats["entries"] > 0 and cache_stats["hits"] == 0
+            client.get("/api/players/virat kohli/metrics")
+            client.get("/api/players/virat kohli/charts/report")
+            assert client.get("/api/cache/stats").json()["hits"] == 2
+            
+            refresh = client.get("/api/refresh").json()
+            assert refresh["enabled"] and refresh["rebuilds"] == 1 and refresh["stale_seconds"] == 0
+            metrics_text = client.get("/metrics").text
+            assert "analytics_refresh_stale_seconds 0.0" in metrics_text
+            assert 'stage="refresh.rebuild"' in metrics_text
+        
+        return True
+        
+    except Exception as e:
+        print(f" ERROR: {e}")
+        return False
+
+
 def main():
     """Run all tests."""
     print("\n" + "=" * 60)
@@ -182,6 +1331,60 @@ def main():
     # Test 4: Full Pipeline
     pipeline_success = test_full_pipeline()
     
+    # Test 5: Combined Reports
+    report_success = test_player_report()
+    
+    # Test 6: Downsampling
+    downsampling_success = test_progression_downsampling()
+    
+    # Test 7: Startup Budget
+    startup_success = test_startup_budget()
+    
+    # Test 8: API
+    api_success = test_api()
+    
+    # Test 9: Response Cache
+    cache_success = test_response_cache()
+    
+    # Test 10: Snapshot
+    snapshot_success = test_snapshot()
+    
+    # Test 11: SQLite Backend
+    sqlite_success = test_sqlite_backend()
+    
+    # Test 12: Benchmark Suite
+    benchmark_success = test_benchmark_suite()
+    
+    # Test 13: Synthetic Data
+    synthetic_success = test_synthetic_data()
+    
+    # Test 14: Instrumentation
+    instrumentation_success = test_instrumentation()
+    
+    # Test 15: Memory Budgets
+    memory_success = test_memory_budgets()
+    
+    # Test 16: Batch Compare
+    compare_success = test_batch_compare()
+    
+    # Test 17: Delivery Ingestion
+    delivery_success = test_delivery_ingestion()
+    
+    # Test 18: Parallel Aggregation
+    parallel_success = test_parallel_aggregation()
+    
+    # Test 19: Records Index
+    records_success = test_records_index()
+    
+    # Test 20: Recent Innings
+    recent_success = test_recent_innings()
+    
+    # Test 21: Lazy Queries
+    query_success = test_query()
+    
+    # Test 22: Background Data Refresh
+    refresh_success = test_data_refresh()
+    
     # Final summary
     print("\n" + "=" * 60)
     print("TEST SUMMARY")
@@ -190,11 +1393,36 @@ def main():
     print(" Metrics Calculation: PASSED")
     print(" Graph Generation: PASSED")
     print(" Full Pipeline: PASSED" if pipeline_success else "❌ Full Pipeline: FAILED")
+    print(" Combined Reports: PASSED" if report_success else "❌ Combined Reports: FAILED")
+    print(" Downsampling: PASSED" if downsampling_success else "❌ Downsampling: FAILED")
+    print(" Startup Budget: PASSED" if startup_success else "❌ Startup Budget: FAILED")
+    print(" API Service: PASSED" if api_success else "❌ API Service: FAILED")
+    print(" Response Cache: PASSED" if cache_success else "❌ Response Cache: FAILED")
+    print(" Snapshot: PASSED" if snapshot_success else "❌ Snapshot: FAILED")
+    print(" SQLite Backend: PASSED" if sqlite_success else "❌ SQLite Backend: FAILED")
+    print(" Benchmark Suite: PASSED" if benchmark_success else "❌ Benchmark Suite: FAILED")
+    print(" Synthetic Data: PASSED" if synthetic_success else "❌ Synthetic Data: FAILED")
+    print(" Instrumentation: PASSED" if instrumentation_success else "❌ Instrumentation: FAILED")
+    print(" Memory Budgets: PASSED" if memory_success else "❌ Memory Budgets: FAILED")
+    print(" Batch Compare: PASSED" if compare_success else "❌ Batch Compare: FAILED")
+    print(" Delivery Ingestion: PASSED" if delivery_success else "❌ Delivery Ingestion: FAILED")
+    print(" Parallel Aggregation: PASSED" if parallel_success else "❌ Parallel Aggregation: FAILED")
+    print(" Records Index: PASSED" if records_success else "❌ Records Index: FAILED")
+    print(" Recent Innings: PASSED" if recent_success else "❌ Recent Innings: FAILED")
+    print(" Lazy Queries: PASSED" if query_success else "❌ Lazy Queries: FAILED")
+    print(" Data Refresh: PASSED" if refresh_success else "❌ Data Refresh: FAILED")
+    
+    pipeline_success = all([pipeline_success, report_success, downsampling_success,
+                            startup_success, api_success, cache_success, snapshot_success,
+                            sqlite_success, benchmark_success, synthetic_success,
+                            instrumentation_success, memory_success, compare_success,
+                            delivery_success, parallel_success, records_success,
+                            recent_success, query_success, refresh_success])
     
     if pipeline_success:
         print("\n ALL TESTS PASSED!")
-        print("\n Analytics layer is ready for FastAPI integration.")
-        print("\nNext step: Build FastAPI routes in main.py")
+        print("\n Analytics layer and API are ready.")
+        print("\nRun the API with: uvicorn main:app --app-dir backend")
     else:
         print("\n SOME TESTS FAILED")
         print("Fix errors before proceeding to FastAPI.")
@@ -203,5 +1431,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # Analytics modules report progress through logging at INFO
+    verbose = "-v" in sys.argv[1:] or "--verbose" in sys.argv[1:]
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING, format=" %(message)s")
     success = main()
     sys.exit(0 if success else 1)
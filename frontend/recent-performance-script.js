@@ -5,6 +5,9 @@
 
 console.log('📈 Recent Performance Analytics Initialized');
 
+// Backend API (uvicorn main:app --app-dir backend)
+const API_BASE = 'http://localhost:8000';
+
 document.addEventListener('DOMContentLoaded', function() {
     
     console.log('✅ DOM Loaded - Recent Performance');
@@ -31,7 +34,7 @@ document.addEventListener('DOMContentLoaded', function() {
     
     // Initialize charts
     setTimeout(() => {
-        initializeCharts();
+        initializeCharts(playerName);
     }, 100);
     
     // Setup floating heart button
@@ -107,28 +110,73 @@ function loadPlayerProfile(name) {
 // INITIALIZE CHARTS
 // ========================================
 
-function initializeCharts() {
+async function initializeCharts(playerName) {
+    // Latest 10 innings by match date, served from the backend's recent-innings store
+    let recent = null;
+    try {
+        const response = await fetch(
+            `${API_BASE}/api/players/${encodeURIComponent(playerName)}/recent?n=10`
+        );
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+        recent = await response.json();
+        updateFormSummary(recent.form, recent.innings);
+    } catch (error) {
+        console.warn('⚠️ Could not load recent innings, showing sample data:', error.message);
+    }
+    
+    const innings = recent ? recent.innings : null;
+    
     // Last 10 Matches Performance
-    createLast10Chart();
+    createLast10Chart(innings);
     
     // Scoring Rate Progression
-    createScoringRateChart();
+    createScoringRateChart(innings);
     
     console.log('✅ Charts initialized');
 }
 
-function createLast10Chart() {
+function updateFormSummary(form, innings) {
+    const cards = document.querySelectorAll('.form-card');
+    if (cards.length < 4 || innings.length === 0) return;
+    
+    const setCard = (card, value, note) => {
+        card.querySelector('.form-value').textContent = value;
+        card.querySelector('.form-streak').textContent = note;
+    };
+    
+    // Trend is the change in runs per innings across the window
+    const direction = form.trend > 0.5 ? 'Improving' : form.trend < -0.5 ? 'Declining' : 'Steady';
+    const sign = form.trend > 0 ? '+' : '';
+    setCard(cards[0], direction, `${sign}${form.trend} runs per innings`);
+    setCard(cards[1], form.average.toFixed(1), `${form.runs} runs in ${form.innings} innings`);
+    setCard(cards[2], form.strike_rate.toFixed(1), `Consistency ${form.consistency_index}`);
+    
+    const best = innings.reduce((top, entry) => entry.runs > top.runs ? entry : top, innings[0]);
+    const notOut = best.dismissal === 'not out' ? '*' : '';
+    setCard(cards[3], `${best.runs}${notOut}`, best.opponent ? `vs ${capitalize(best.opponent)}` : best.match_date);
+}
+
+function createLast10Chart(innings) {
     const ctx = document.getElementById('last-10-chart');
     if (!ctx) return;
     
+    const labels = innings
+        ? innings.map(entry => entry.match_date)
+        : ['Match 1', 'Match 2', 'Match 3', 'Match 4', 'Match 5',
+           'Match 6', 'Match 7', 'Match 8', 'Match 9', 'Match 10'];
+    const runs = innings
+        ? innings.map(entry => entry.runs)
+        : [56, 92, 34, 87, 103, 79, 45, 68, 91, 72];
+    
     new Chart(ctx, {
         type: 'bar',
         data: {
-            labels: ['Match 1', 'Match 2', 'Match 3', 'Match 4', 'Match 5', 
-                     'Match 6', 'Match 7', 'Match 8', 'Match 9', 'Match 10'],
+            labels: labels,
             datasets: [{
                 label: 'Runs Scored',
-                data: [56, 92, 34, 87, 103, 79, 45, 68, 91, 72],
+                data: runs,
                 backgroundColor: function(context) {
                     const value = context.parsed.y;
                     if (value >= 80) return 'rgba(0, 255, 136, 0.6)';
@@ -177,7 +225,7 @@ function createLast10Chart() {
             scales: {
                 y: {
                     beginAtZero: true,
-                    max: 120,
+                    suggestedMax: 120,
                     grid: {
                         color: 'rgba(0, 245, 255, 0.1)'
                     },
@@ -206,18 +254,25 @@ function createLast10Chart() {
     });
 }
 
-function createScoringRateChart() {
+function createScoringRateChart(innings) {
     const ctx = document.getElementById('scoring-rate-chart');
     if (!ctx) return;
     
+    const labels = innings
+        ? innings.map(entry => entry.match_date)
+        : ['Match 1', 'Match 2', 'Match 3', 'Match 4', 'Match 5',
+           'Match 6', 'Match 7', 'Match 8', 'Match 9', 'Match 10'];
+    const strikeRates = innings
+        ? innings.map(entry => +(entry.runs / entry.balls_faced * 100).toFixed(1))
+        : [147.4, 117.9, 121.4, 120.8, 121.2, 164.6, 135.6, 142.1, 139.8, 133.3];
+    
     new Chart(ctx, {
         type: 'line',
         data: {
-            labels: ['Match 1', 'Match 2', 'Match 3', 'Match 4', 'Match 5', 
-                     'Match 6', 'Match 7', 'Match 8', 'Match 9', 'Match 10'],
+            labels: labels,
             datasets: [{
                 label: 'Strike Rate',
-                data: [147.4, 117.9, 121.4, 120.8, 121.2, 164.6, 135.6, 142.1, 139.8, 133.3],
+                data: strikeRates,
                 borderColor: '#ff006e',
                 backgroundColor: 'rgba(255, 0, 110, 0.1)',
                 borderWidth: 3,
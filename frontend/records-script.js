@@ -5,6 +5,9 @@
 
 console.log('🏏 Player Records Page Initialized');
 
+// Backend API (uvicorn main:app --app-dir backend)
+const API_BASE = 'http://localhost:8000';
+
 document.addEventListener('DOMContentLoaded', function() {
     
     console.log('✅ DOM Loaded - Records Page');
@@ -29,6 +32,9 @@ document.addEventListener('DOMContentLoaded', function() {
     // Update profile
     loadPlayerProfile(playerName);
     
+    // League records for every format tab
+    loadLeagueRecords(playerName);
+    
     // ========================================
     // FORMAT TAB SWITCHING WITH SLIDING ANIMATION
     // ========================================
@@ -196,6 +202,76 @@ function loadPlayerProfile(name) {
     console.log('✅ Profile loaded');
 }
 
+// ========================================
+// LOAD LEAGUE RECORDS
+// ========================================
+
+const RECORD_LABELS = {
+    highest_score: 'Highest Score',
+    most_sixes: 'Most 6s (Innings)',
+    most_fours: 'Most 4s (Innings)',
+    best_strike_rate: 'Best Strike Rate',
+    most_centuries: 'Most 100s'
+};
+
+async function loadLeagueRecords(playerName) {
+    const sections = document.querySelectorAll('.stats-section');
+    
+    for (const section of sections) {
+        const format = section.getAttribute('data-format');
+        
+        try {
+            const response = await fetch(`${API_BASE}/api/records?format=${format}&limit=10`);
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            const data = await response.json();
+            section.appendChild(renderRecords(data, playerName));
+        } catch (error) {
+            console.warn(`⚠️ Could not load ${format} records:`, error.message);
+        }
+    }
+    
+    console.log('✅ League records loaded');
+}
+
+function renderRecords(data, playerName) {
+    const category = document.createElement('div');
+    category.className = 'stats-category';
+    category.innerHTML = `
+        <div class="category-header">
+            <span class="category-icon">🏆</span>
+            <h3 class="category-title">League Records</h3>
+        </div>
+        <div class="stats-grid"></div>
+    `;
+    
+    const grid = category.querySelector('.stats-grid');
+    const player = playerName.toLowerCase();
+    
+    Object.entries(data.records).forEach(([record, entries]) => {
+        if (entries.length === 0) {
+            return;
+        }
+        
+        // Show the record holder, plus the player's own place if they are on the list
+        const holder = entries[0];
+        const own = entries.find(entry => entry.player_name === player);
+        const label = own && own !== holder
+            ? `${RECORD_LABELS[record]} · ${capitalize(holder.player_name)} (you: #${own.rank})`
+            : `${RECORD_LABELS[record]} · ${capitalize(holder.player_name)}`;
+        
+        const item = document.createElement('div');
+        item.className = 'stat-item';
+        item.innerHTML = '<span class="stat-label"></span><span class="stat-value"></span>';
+        item.querySelector('.stat-label').textContent = label;
+        item.querySelector('.stat-value').textContent = holder.value.toLocaleString();
+        grid.appendChild(item);
+    });
+    
+    return category;
+}
+
 // ========================================
 // FLOATING HEART ANIMATION (270° ROTATION)
 // ========================================